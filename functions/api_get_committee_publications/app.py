@@ -3,12 +3,14 @@ Lambda function to retrieve committee publications from Parliament API and
 queue them for processing.
 
 This module handles fetching publications for a specified committee within a date range
-and queuing them to an SQS queue for further processing.
+and queuing them to an SQS queue for further processing. The committee's sub-committees,
+at any depth, can be harvested in the same invocation.
 """
 
 import os
 
 from datetime import date
+from typing import List, Tuple
 
 import botocore.exceptions
 
@@ -18,9 +20,13 @@ from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import event_parser
 
+from caching import default_response_cache
 from models import Publications
-from parliament_api_client import ParliamentPublicationsAPIClient
-from queueing import SQSQueue
+from parliament_api_client import (
+    ParliamentCommitteesAPIClient,
+    ParliamentPublicationsAPIClient,
+)
+from queueing import SendMessagesError, SQSQueue
 
 
 logger = Logger()
@@ -29,6 +35,9 @@ tracer = Tracer()
 COMMITTEE_API_BASE_URI = os.environ["COMMITTEE_API_BASE_URI"]
 PUBLICATION_QUEUE = os.environ["PUBLICATION_QUEUE"]
 
+# Kept across warm invocations so repeated harvests reuse committee lookups
+RESPONSE_CACHE = default_response_cache()
+
 
 class Event(BaseModel):
     """
@@ -38,11 +47,13 @@ class Event(BaseModel):
         committee_id: ID of the committee to fetch publications for
         start_date: Start date of the date range to fetch publications
         end_date: End date of the date range to fetch publications
+        include_sub_committees: Also fetch publications for all sub-committees
     """
 
     committee_id: int = Field(alias="committeeId")
     start_date: date = Field(alias="startDate")
     end_date: date = Field(alias="endDate")
+    include_sub_committees: bool = Field(default=False, alias="includeSubCommittees")
 
 
 def get_committee_publications_list(
@@ -67,6 +78,32 @@ def get_committee_publications_list(
     return publications
 
 
+def get_committee_tree_publications_list(
+    api_base_uri: str, committee_id: int, start_date: date, end_date: date
+) -> Tuple[List[int], Publications]:
+    """
+    Fetch the publications of a committee and all of its sub-committees.
+
+    Args:
+        api_base_uri: Base URI for the Parliament API
+        committee_id: ID of the root committee
+        start_date: Start date of the date range
+        end_date: End date of the date range
+
+    Returns:
+        Tuple of the committee IDs harvested and their publications, deduplicated by ID
+    """
+    committees_client = ParliamentCommitteesAPIClient(api_base_uri, cache=RESPONSE_CACHE)
+    committee_ids = committees_client.get_committee_tree(committee_id)
+    logger.info("Harvesting publications for committees %s", committee_ids)
+
+    publications_client = ParliamentPublicationsAPIClient(api_base_uri)
+    publications = publications_client.get_publications_for_committees(
+        committee_ids=committee_ids, start_date=start_date, end_date=end_date
+    )
+    return committee_ids, publications
+
+
 def queue_publications(publications: Publications, publication_queue: str) -> None:
     """
     Queue publications to SQS for processing.
@@ -75,15 +112,14 @@ def queue_publications(publications: Publications, publication_queue: str) -> No
         publications: Publications object containing list of publications to queue
         publication_queue: Name of the SQS queue to send messages to
 
-    Raises:
-        botocore.exceptions.ClientError: If there is an error sending messages to SQS
+    Logs an error if any publication cannot be queued.
     """
     publication_queue = SQSQueue(queue_name=publication_queue)
-    try:
-        for publication in publications.publications:
-            publication_queue.send_message(publication.model_dump_json())
-    except botocore.exceptions.ClientError as e:
-        logger.error("Error: %s", e)
+    report = publication_queue.send_messages(
+        publication.to_json() for publication in publications.publications
+    )
+    if report.failed:
+        logger.error("Error: %s", SendMessagesError(report))
 
 
 @tracer.capture_lambda_handler
@@ -96,7 +132,7 @@ def lambda_handler(
     Lambda handler to process committee publications.
 
     Args:
-        event: Lambda event containing committee ID and date range
+        event: Lambda event containing committee ID, date range and whether to include sub-committees
         context: Lambda context object
 
     Returns:
@@ -114,6 +150,23 @@ def lambda_handler(
         if not question_queue:
             raise RuntimeError("Question Queue missing")
 
+        if event.include_sub_committees:
+            committee_ids, publications = get_committee_tree_publications_list(
+                api_base_uri=api_base_uri,
+                committee_id=event.committee_id,
+                start_date=event.start_date,
+                end_date=event.end_date,
+            )
+            queue_publications(publications, question_queue)
+
+            return {
+                "statusCode": 200,
+                "body": {
+                    "Count": len(publications.publications),
+                    "Committees": len(committee_ids),
+                },
+            }
+
         publications = get_committee_publications_list(
             api_base_uri=api_base_uri,
             committee_id=event.committee_id,
@@ -0,0 +1,273 @@
+"""
+Lambda function to incrementally retrieve committee publications from the Parliament API
+on a schedule and queue them for processing.
+
+Each committee has its own high-water mark in SSM Parameter Store. Publications are
+fetched from the committee's watermark up to today, and the watermark is only advanced
+once every publication has been queued, so a failed run is retried from the same point.
+"""
+
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import List
+
+import botocore.exceptions
+import requests
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from caching import default_response_cache
+from models import Publications
+from parliament_api_client import (
+    MAX_COMMITTEE_WORKERS,
+    ParliamentCommitteesAPIClient,
+    ParliamentPublicationsAPIClient,
+)
+from queueing import SendMessagesError, SQSQueue
+from storage import SSMStorage
+
+logger = Logger()
+tracer = Tracer()
+
+# Kept across warm invocations so repeated harvests reuse committee lookups
+RESPONSE_CACHE = default_response_cache()
+
+
+def parse_committee_ids(committee_ids: str) -> List[int]:
+    """
+    Parse a comma separated list of committee IDs.
+
+    Args:
+        committee_ids: Comma separated committee IDs, e.g. "203,351"
+
+    Returns:
+        List of committee IDs
+
+    Raises:
+        ValueError: If an ID is not an integer
+    """
+    return [int(committee_id) for committee_id in committee_ids.split(",") if committee_id.strip()]
+
+
+def get_watermark(watermark_prefix: str, committee_id: int, default_start_date: date) -> date:
+    """
+    Get the date a committee's publications were last harvested up to.
+
+    Args:
+        watermark_prefix: Prefix of the SSM parameters holding the watermarks
+        committee_id: ID of the committee
+        default_start_date: Date to use if the committee has not been harvested before
+
+    Returns:
+        Watermark date
+
+    Raises:
+        botocore.exceptions.ClientError: If reading from SSM fails
+    """
+    value = SSMStorage(parameter_key=f"{watermark_prefix}/{committee_id}").get_value()
+    if value is None or value == "null":
+        return default_start_date
+    return date.fromisoformat(value)
+
+
+def advance_watermark(watermark_prefix: str, committee_id: int, end_date: date) -> None:
+    """
+    Advance a committee's watermark, never moving it backwards.
+
+    Args:
+        watermark_prefix: Prefix of the SSM parameters holding the watermarks
+        committee_id: ID of the committee
+        end_date: Date publications have now been harvested up to
+
+    Raises:
+        botocore.exceptions.ClientError: If writing to SSM fails
+    """
+    storage = SSMStorage(parameter_key=f"{watermark_prefix}/{committee_id}")
+    current_value = storage.get_value()
+    if current_value in (None, "null") or date.fromisoformat(current_value) < end_date:
+        storage.save_parameter(end_date.strftime("%Y-%m-%d"))
+
+
+def queue_publications(publications: Publications, publication_queue: str) -> None:
+    """
+    Queue publications to SQS for processing.
+
+    Args:
+        publications: Publications object containing list of publications to queue
+        publication_queue: Name of the SQS queue to send messages to
+
+    Raises:
+        SendMessagesError: If any publication cannot be queued
+    """
+    queue = SQSQueue(queue_name=publication_queue)
+    report = queue.send_messages(
+        publication.to_json() for publication in publications.publications
+    )
+    if report.failed:
+        raise SendMessagesError(report)
+
+
+# pylint: disable=too-many-arguments
+def sync_committee(
+    *,
+    api_base_uri: str,
+    publication_queue: str,
+    watermark_prefix: str,
+    committee_id: int,
+    default_start_date: date,
+    end_date: date,
+) -> int:
+    """
+    Queue a committee's publications since its watermark, then advance the watermark.
+
+    Args:
+        api_base_uri: Base URI for the Parliament API
+        publication_queue: Name of the SQS queue to send messages to
+        watermark_prefix: Prefix of the SSM parameters holding the watermarks
+        committee_id: ID of the committee
+        default_start_date: Start date if the committee has not been harvested before
+        end_date: End date of the harvest
+
+    Returns:
+        Number of publications queued
+
+    Raises:
+        botocore.exceptions.ClientError: For AWS service related errors
+        requests.exceptions.RequestException: For Parliament API request errors
+        SendMessagesError: If any publication cannot be queued
+    """
+    start_date = get_watermark(watermark_prefix, committee_id, default_start_date)
+
+    client = ParliamentPublicationsAPIClient(api_base_uri)
+    publications = client.get_committee_publications_list(
+        committee_id=committee_id, start_date=start_date, end_date=end_date
+    )
+    queue_publications(publications, publication_queue)
+    advance_watermark(watermark_prefix, committee_id, end_date)
+
+    logger.info(
+        "Queued %s publications for committee %s from %s",
+        len(publications.publications),
+        committee_id,
+        start_date,
+    )
+    return len(publications.publications)
+
+
+# pylint: disable=too-many-locals
+@tracer.capture_lambda_handler
+@logger.inject_lambda_context(log_event=True)
+def lambda_handler(
+    event: dict, context: LambdaContext  # pylint: disable=unused-argument
+) -> dict:
+    """
+    AWS Lambda handler for incrementally harvesting committee publications.
+
+    Required environment variables:
+        - COMMITTEE_API_BASE_URI: Base URI for the Parliament Committees API
+        - PUBLICATION_QUEUE: Name of the SQS queue for publications
+        - COMMITTEE_IDS: Comma separated IDs of the committees to harvest
+        - WATERMARK_PARAMETER_PREFIX: Prefix of the SSM parameters holding each committee's watermark
+        - DEFAULT_DAYS_TO_RETRIEVE: Number of days to look back for a committee with no watermark
+
+    Optional environment variables:
+        - INCLUDE_SUB_COMMITTEES: "true" to also harvest every sub-committee of the committees
+        - CLAIM_CHECK_BUCKET: S3 bucket for publications too large to send to SQS directly
+
+    Args:
+        event (dict): Lambda event (not used in current implementation)
+        context (LambdaContext): Lambda context object (unused)
+
+    Returns:
+        dict: Response containing:
+            - statusCode (int): 200 if every committee was harvested, 500 otherwise
+            - body (dict): Count of publications queued and IDs of failed committees,
+              or error message string
+
+    Raises:
+        RuntimeError: If required environment variables are missing
+    """
+    try:
+        api_base_uri = os.getenv("COMMITTEE_API_BASE_URI")
+        publication_queue = os.getenv("PUBLICATION_QUEUE")
+        committee_ids = os.getenv("COMMITTEE_IDS")
+        watermark_prefix = os.getenv("WATERMARK_PARAMETER_PREFIX")
+        default_days_to_retrieve = os.getenv("DEFAULT_DAYS_TO_RETRIEVE")
+
+        if not api_base_uri:
+            raise RuntimeError("API Base URI missing")
+
+        if not publication_queue:
+            raise RuntimeError("Publication Queue missing")
+
+        if not committee_ids:
+            raise RuntimeError("Committee IDs missing")
+
+        if not watermark_prefix:
+            raise RuntimeError("Watermark Parameter Prefix missing")
+
+        if not default_days_to_retrieve:
+            raise RuntimeError("Default Days to Retrieve missing")
+
+        committee_ids = parse_committee_ids(committee_ids)
+        if os.getenv("INCLUDE_SUB_COMMITTEES", "false").lower() == "true":
+            committees_client = ParliamentCommitteesAPIClient(
+                api_base_uri, cache=RESPONSE_CACHE
+            )
+            committee_ids = list(
+                dict.fromkeys(
+                    committee_id
+                    for root_committee_id in committee_ids
+                    for committee_id in committees_client.get_committee_tree(
+                        root_committee_id
+                    )
+                )
+            )
+
+        end_date = date.today()
+        default_start_date = end_date - timedelta(days=int(default_days_to_retrieve))
+
+        def sync(committee_id: int) -> int:
+            return sync_committee(
+                api_base_uri=api_base_uri,
+                publication_queue=publication_queue,
+                watermark_prefix=watermark_prefix,
+                committee_id=committee_id,
+                default_start_date=default_start_date,
+                end_date=end_date,
+            )
+
+        count = 0
+        failed = []
+        with ThreadPoolExecutor(max_workers=MAX_COMMITTEE_WORKERS) as executor:
+            futures = {
+                committee_id: executor.submit(sync, committee_id)
+                for committee_id in committee_ids
+            }
+            for committee_id, future in futures.items():
+                try:
+                    count += future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # The committee's watermark is only saved once it is harvested, so
+                    # any failure leaves it to be retried on the next run
+                    logger.error("Failed to harvest committee %s: %s", committee_id, e)
+                    failed.append(committee_id)
+
+        logger.info("Queued %s publications, %s committees failed", count, len(failed))
+
+        return {
+            "statusCode": 500 if failed else 200,
+            "body": {"Count": count, "Failed": failed},
+        }
+
+    except (
+        RuntimeError,
+        ValueError,
+        botocore.exceptions.ClientError,
+        requests.exceptions.RequestException,
+    ) as e:
+        logger.error("Error: %s", e)
+        return {"statusCode": 500, "body": {"message": e}}
@@ -13,6 +13,7 @@ and handles API and AWS service interactions with appropriate error handling.
 import os
 
 from datetime import date, datetime
+from typing import Iterable, Iterator, Optional
 
 from pydantic import BaseModel, Field
 
@@ -23,9 +24,10 @@ from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import event_parser
 
-from models import Questions
+from backfill import DateShard, ShardCheckpoint, ShardSize, run_shards, split_date_range
+from models import Question
 from parliament_api_client import DateType, ParliamentQuestionsAPIClient
-from queueing import SQSQueue
+from queueing import MessagePacking, SendMessagesError, SQSQueue
 from storage import SSMStorage
 
 logger = Logger()
@@ -38,17 +40,23 @@ class Event(BaseModel):
     Attributes:
         start_date (date): Start date for retrieving questions (inclusive)
         end_date (date): End date for retrieving questions (inclusive)
+        shard_size (ShardSize, optional): Split the range into day or week shards,
+            processed concurrently and checkpointed so a rerun resumes
     """
 
     start_date: date = Field(alias="startDate")
     end_date: date = Field(alias="endDate")
+    shard_size: Optional[ShardSize] = Field(default=None, alias="shardSize")
 
 
-def get_questions_by_date(
+def iter_questions_by_date(
     api_base_uri: str, date_type: DateType, start_date: date, end_date: date
-) -> Questions:
+) -> Iterator[Question]:
     """
-    Retrieve parliamentary questions for a given date range from the Parliament API.
+    Iterate over parliamentary questions for a given date range from the Parliament API.
+
+    Questions are yielded as each page of results is decoded, so they can be queued
+    while later pages are still being retrieved.
 
     Args:
         api_base_uri (str): Base URI for the Parliament Questions API
@@ -57,39 +65,58 @@ def get_questions_by_date(
         end_date (date): End date for retrieving questions (inclusive)
 
     Returns:
-        Questions: Collection of parliamentary questions matching the date criteria
+        Iterator[Question]: Questions matching the date criteria
 
     Raises:
         requests.exceptions.HTTPError: If the API request fails
     """
     client = ParliamentQuestionsAPIClient(api_base_uri)
-    questions = client.get_questions_by_date(
+    return client.iter_questions_by_date(
         date_type=date_type,
         start_date=start_date,
         end_date=end_date,
     )
-    return questions
 
 
-def queue_questions(questions: Questions, questions_queue: str) -> None:
+def queue_questions(
+    questions: Iterable[Question],
+    questions_queue: str,
+    raise_on_error: bool = False,
+    packing: MessagePacking = MessagePacking.NONE,
+) -> int:
     """
     Queue parliamentary questions to SQS for asynchronous processing.
 
-    Each question is serialized to JSON and sent as an individual message to the specified SQS queue.
+    Each question is serialized to JSON and sent as a message to the specified SQS queue in
+    concurrent batches as soon as it is received, so questions are never all held in memory at once.
+    With packing, many questions are sent in each message as an envelope.
+    Logs an error if any message cannot be sent but does not raise unless raise_on_error is set.
 
     Args:
-        questions (Questions): Collection of questions to be queued
+        questions (Iterable[Question]): Questions to be queued
         questions_queue (str): Name of the SQS queue to send messages to
+        raise_on_error (bool): Re-raise errors sending messages to SQS. Defaults to False.
+        packing (MessagePacking): How questions are packed into messages. Defaults to one
+            question per message.
+
+    Returns:
+        int: Number of questions queued
 
     Raises:
-        botocore.exceptions.ClientError: If there is an error sending messages to SQS
+        requests.exceptions.HTTPError: If retrieving the questions fails
+        SendMessagesError: If any message cannot be sent and raise_on_error is set
     """
     question_queue = SQSQueue(queue_name=questions_queue)
-    try:
-        for question in questions.questions:
-            question_queue.send_message(question.model_dump_json())
-    except botocore.exceptions.ClientError as e:
-        logger.error(f"Error: {e}")
+    report = question_queue.send_packed(
+        (question.to_json() for question in questions), packing=packing
+    )
+    if report.failed:
+        error = SendMessagesError(report)
+        logger.error(f"Error: {error}")
+        if raise_on_error:
+            raise error
+
+    return report.sent
 
 
 def update_last_run(parameter_key: str, end_date: date) -> None:
@@ -110,6 +137,77 @@ def update_last_run(parameter_key: str, end_date: date) -> None:
     if current_value == "null" or current_value < end_date:
         client.save_parameter(end_date.strftime("%Y-%m-%d"))
 
+
+# pylint: disable=too-many-arguments
+def backfill_questions(
+    *,
+    api_base_uri: str,
+    questions_queue: str,
+    last_run_parameter: str,
+    checkpoint_prefix: str,
+    event: Event,
+    packing: MessagePacking = MessagePacking.NONE,
+) -> int:
+    """
+    Queue the questions answered in a date range one shard at a time.
+
+    The range is split into day or week shards which are processed concurrently. Progress is
+    checkpointed in an SSM parameter for the range as contiguous shards complete, so a rerun
+    with the same range resumes from the first incomplete shard. The last run date advances
+    with the checkpoint, and the checkpoint is deleted once every shard is complete.
+
+    Args:
+        api_base_uri (str): Base URI for the Parliament Questions API
+        questions_queue (str): Name of the SQS queue to send messages to
+        last_run_parameter (str): Key of the last run date parameter
+        checkpoint_prefix (str): Prefix of the SSM parameters holding backfill checkpoints
+        event (Event): Lambda event containing the date range and shard size
+        packing (MessagePacking): How questions are packed into messages
+
+    Returns:
+        int: Number of questions queued by this invocation
+
+    Raises:
+        botocore.exceptions.ClientError: For AWS service related errors
+        requests.exceptions.HTTPError: For Parliament API request errors
+    """
+    checkpoint_storage = SSMStorage(
+        parameter_key=f"{checkpoint_prefix}/{event.start_date}_{event.end_date}"
+    )
+    completed_through = checkpoint_storage.get_value()
+
+    def save_checkpoint(completed: date):
+        checkpoint_storage.save_parameter(completed.strftime("%Y-%m-%d"))
+        update_last_run(parameter_key=last_run_parameter, end_date=completed)
+
+    checkpoint = ShardCheckpoint(
+        shards=split_date_range(event.start_date, event.end_date, event.shard_size),
+        on_advance=save_checkpoint,
+        completed_through=date.fromisoformat(completed_through) if completed_through else None,
+    )
+    if completed_through:
+        logger.info("Resuming backfill after %s", completed_through)
+
+    def queue_shard(shard: DateShard) -> int:
+        questions = iter_questions_by_date(
+            api_base_uri=api_base_uri,
+            date_type=DateType.ANSWERED,
+            start_date=shard.start_date,
+            end_date=shard.end_date,
+        )
+        return queue_questions(
+            questions=questions,
+            questions_queue=questions_queue,
+            raise_on_error=True,
+            packing=packing,
+        )
+
+    count = run_shards(checkpoint, queue_shard)
+    checkpoint_storage.delete_parameter()
+
+    return count
+
+
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context(log_event=True)
 @event_parser(model=Event)  # pylint: disable=no-value-for-parameter
@@ -121,9 +219,11 @@ def lambda_handler(
 
     Retrieves questions from Parliament API based on date range provided in the event
     and queues them to SQS for further processing. Uses Powertools for tracing and logging.
+    If the event has a shardSize the range is backfilled in resumable shards. The last run date
+    is not advanced if any question cannot be queued.
 
     Args:
-        event (Event): Lambda event containing startDate and endDate dates
+        event (Event): Lambda event containing startDate and endDate dates, and optional shardSize
         context (LambdaContext): Lambda context object (unused)
 
     Returns:
@@ -150,19 +250,43 @@ def lambda_handler(
         if not last_run_parameter:
             raise RuntimeError("Last Run Parameter missing")
 
-        questions = get_questions_by_date(
+        packing = MessagePacking(os.getenv("QUESTION_MESSAGE_PACKING", MessagePacking.NONE.value))
+
+        if event.shard_size:
+            checkpoint_prefix = os.getenv("BACKFILL_CHECKPOINT_PREFIX")
+            if not checkpoint_prefix:
+                raise RuntimeError("Backfill Checkpoint Prefix missing")
+
+            count = backfill_questions(
+                api_base_uri=question_api_base_uri,
+                questions_queue=question_queue,
+                last_run_parameter=last_run_parameter,
+                checkpoint_prefix=checkpoint_prefix,
+                event=event,
+                packing=packing,
+            )
+            logger.info("Queued %s answered questions", count)
+
+            return {"statusCode": 200, "body": {"Count": count}}
+
+        questions = iter_questions_by_date(
             api_base_uri=question_api_base_uri,
             date_type=DateType.ANSWERED,
             start_date=event.start_date,
             end_date=event.end_date,
         )
-        logger.info("Retrieved %s answered questions", format(len(questions.questions)))
 
-        queue_questions(questions=questions, questions_queue=question_queue)
+        count = queue_questions(
+            questions=questions,
+            questions_queue=question_queue,
+            raise_on_error=True,
+            packing=packing,
+        )
+        logger.info("Queued %s answered questions", count)
 
         update_last_run(parameter_key=last_run_parameter, end_date=event.end_date)
 
-        return {"statusCode": 200, "body": {"Count": len(questions.questions)}}
+        return {"statusCode": 200, "body": {"Count": count}}
 
     except (
         RuntimeError,
@@ -12,6 +12,7 @@ and handles API and AWS service interactions with appropriate error handling.
 import os
 
 from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator
 
 import requests
 import botocore.exceptions
@@ -19,19 +20,23 @@ import botocore.exceptions
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from models import Questions
+from backfill import DateShard, ShardCheckpoint, ShardSize, run_shards, split_date_range
+from models import Question
 from parliament_api_client import DateType, ParliamentQuestionsAPIClient
-from queueing import SQSQueue
+from queueing import MessagePacking, SendMessagesError, SQSQueue
 from storage import SSMStorage
 
 logger = Logger()
 tracer = Tracer()
 
-def get_questions_by_date(
+def iter_questions_by_date(
     api_base_uri: str, date_type: DateType, start_date: date, end_date: date
-) -> Questions:
+) -> Iterator[Question]:
     """
-    Retrieve parliamentary questions for a given date range from the Parliament API.
+    Iterate over parliamentary questions for a given date range from the Parliament API.
+
+    Questions are yielded as each page of results is decoded, so they can be queued
+    while later pages are still being retrieved.
 
     Args:
         api_base_uri (str): Base URI for the Parliament Questions API
@@ -40,40 +45,58 @@ def get_questions_by_date(
         end_date (date): End date for retrieving questions (inclusive)
 
     Returns:
-        Questions: Collection of parliamentary questions matching the date criteria
+        Iterator[Question]: Questions matching the date criteria
 
     Raises:
         requests.exceptions.HTTPError: If the API request fails
     """
     client = ParliamentQuestionsAPIClient(api_base_uri)
-    questions = client.get_questions_by_date(
+    return client.iter_questions_by_date(
         date_type=date_type,
         start_date=start_date,
         end_date=end_date,
     )
-    return questions
 
 
-def queue_questions(questions: Questions, questions_queue: str) -> None:
+def queue_questions(
+    questions: Iterable[Question],
+    questions_queue: str,
+    raise_on_error: bool = False,
+    packing: MessagePacking = MessagePacking.NONE,
+) -> int:
     """
     Queue parliamentary questions to SQS for asynchronous processing.
 
-    Each question is serialized to JSON and sent as an individual message to the specified SQS queue.
-    Logs an error if sending to SQS fails but does not re-raise the exception.
+    Each question is serialized to JSON and sent as a message to the specified SQS queue in
+    concurrent batches as soon as it is received, so questions are never all held in memory at once.
+    With packing, many questions are sent in each message as an envelope.
+    Logs an error if any message cannot be sent but does not raise unless raise_on_error is set.
 
     Args:
-        questions (Questions): Collection of questions to be queued
+        questions (Iterable[Question]): Questions to be queued
         questions_queue (str): Name of the SQS queue to send messages to
+        raise_on_error (bool): Re-raise errors sending messages to SQS. Defaults to False.
+        packing (MessagePacking): How questions are packed into messages. Defaults to one
+            question per message.
+
+    Returns:
+        int: Number of questions queued
 
     Raises:
-        botocore.exceptions.ClientError: If there is an error sending messages to SQS
+        requests.exceptions.HTTPError: If retrieving the questions fails
+        SendMessagesError: If any message cannot be sent and raise_on_error is set
     """
     question_queue = SQSQueue(queue_name=questions_queue)
-    try:
-        for question in questions.questions:
-            question_queue.send_message(question.model_dump_json())
-    except botocore.exceptions.ClientError as e:
-        logger.error(f"Error: {e}")
+    report = question_queue.send_packed(
+        (question.to_json() for question in questions), packing=packing
+    )
+    if report.failed:
+        error = SendMessagesError(report)
+        logger.error(f"Error: {error}")
+        if raise_on_error:
+            raise error
+
+    return report.sent
 
 
 def update_last_run(ssm_client: SSMStorage, end_date: date) -> None:
@@ -93,6 +116,62 @@ def update_last_run(ssm_client: SSMStorage, end_date: date) -> None:
     if current_value == "null" or current_value < end_date:
         ssm_client.save_parameter(end_date.strftime("%Y-%m-%d"))
 
+
+# pylint: disable=too-many-arguments
+def queue_questions_in_shards(
+    *,
+    api_base_uri: str,
+    questions_queue: str,
+    ssm_client: SSMStorage,
+    start_date: date,
+    end_date: date,
+    shard_size: ShardSize,
+    packing: MessagePacking = MessagePacking.NONE,
+) -> int:
+    """
+    Queue the questions answered in a date range one shard at a time.
+
+    Shards are processed concurrently and the last run date advances as contiguous shards
+    complete, so a failed run resumes from the first incomplete shard on the next schedule.
+
+    Args:
+        api_base_uri (str): Base URI for the Parliament Questions API
+        questions_queue (str): Name of the SQS queue to send messages to
+        ssm_client (SSMStorage): SSM client for the last run date parameter
+        start_date (date): Start date for retrieving questions (inclusive)
+        end_date (date): End date for retrieving questions (inclusive)
+        shard_size (ShardSize): Size of each shard
+        packing (MessagePacking): How questions are packed into messages
+
+    Returns:
+        int: Number of questions queued
+
+    Raises:
+        botocore.exceptions.ClientError: For AWS service related errors
+        requests.exceptions.HTTPError: For Parliament API request errors
+    """
+    checkpoint = ShardCheckpoint(
+        shards=split_date_range(start_date, end_date, shard_size),
+        on_advance=lambda completed: update_last_run(ssm_client, end_date=completed),
+    )
+
+    def queue_shard(shard: DateShard) -> int:
+        questions = iter_questions_by_date(
+            api_base_uri=api_base_uri,
+            date_type=DateType.ANSWERED,
+            start_date=shard.start_date,
+            end_date=shard.end_date,
+        )
+        return queue_questions(
+            questions=questions,
+            questions_queue=questions_queue,
+            raise_on_error=True,
+            packing=packing,
+        )
+
+    return run_shards(checkpoint, queue_shard)
+
+
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context(log_event=True)
 def lambda_handler(
@@ -104,6 +183,7 @@ def lambda_handler(
     Retrieves answered questions from Parliament API based on the last run date stored in SSM Parameter Store
     up to the current date, and queues them to SQS for further processing. Uses Powertools for 
     tracing and logging. If no last run date exists, defaults to looking back a configurable number of days.
+    The last run date is not advanced if any question cannot be queued, so the next run retries them.
 
     Required environment variables:
         - QUESTION_API_BASE_URI: Base URI for the Parliament Questions API
@@ -111,6 +191,11 @@ def lambda_handler(
         - LAST_RUN_PARAMETER: Name of the SSM parameter storing last run date
         - DEFAULT_DAYS_TO_RETRIEVE: Number of days to look back if no last run date
 
+    Optional environment variables:
+        - SHARD_SIZE: Split the date range into "day" or "week" shards processed concurrently
+        - QUESTION_MESSAGE_PACKING: "json" or "gzip" to pack many questions into each message
+        - CLAIM_CHECK_BUCKET: S3 bucket for messages too large to send to SQS directly
+
     Args:
         event (dict): Lambda event (not used in current implementation)
         context (LambdaContext): Lambda context object (unused)
@@ -151,20 +236,41 @@ def lambda_handler(
             last_run = last_run.date() if isinstance(last_run, datetime) else last_run
 
         end_date = date.today()
-
-        questions = get_questions_by_date(
+        packing = MessagePacking(os.getenv("QUESTION_MESSAGE_PACKING", MessagePacking.NONE.value))
+
+        shard_size = os.getenv("SHARD_SIZE")
+        if shard_size:
+            count = queue_questions_in_shards(
+                api_base_uri=question_api_base_uri,
+                questions_queue=question_queue,
+                ssm_client=ssm_client,
+                start_date=last_run,
+                end_date=end_date,
+                shard_size=ShardSize(shard_size),
+                packing=packing,
+            )
+            logger.info("Queued %s answered questions", count)
+
+            return {"statusCode": 200, "body": {"Count": count}}
+
+        questions = iter_questions_by_date(
             api_base_uri=question_api_base_uri,
             date_type=DateType.ANSWERED,
             start_date=last_run,
             end_date=end_date,
         )
-        logger.info("Retrieved %s answered questions", format(len(questions.questions)))
 
-        queue_questions(questions=questions, questions_queue=question_queue)
+        count = queue_questions(
+            questions=questions,
+            questions_queue=question_queue,
+            raise_on_error=True,
+            packing=packing,
+        )
+        logger.info("Queued %s answered questions", count)
 
         update_last_run(ssm_client, end_date=end_date)
 
-        return {"statusCode": 200, "body": {"Count": len(questions.questions)}}
+        return {"statusCode": 200, "body": {"Count": count}}
 
     except (
         RuntimeError,
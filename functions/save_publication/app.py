@@ -1,12 +1,11 @@
 """
 Lambda function handler for processing publication records from SQS.
 
-This module receives SQS events containing publication metadata, retrieves the associated
+This module receives SQS events containing publication metadata, streams the associated
 publication files from the Parliament Publications API, and stores them in S3.
 """
 
 import os
-import json
 
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -14,6 +13,7 @@ from aws_lambda_powertools.utilities.data_classes import SQSEvent, event_source
 
 from storage import S3Storage
 from models import Publication
+from queueing import read_message
 from parliament_api_client import ParliamentPublicationsAPIClient
 
 
@@ -27,20 +27,8 @@ CONTENT_BUCKET = os.environ["CONTENT_BUCKET"]
 s3_client = S3Storage(CONTENT_BUCKET)
 
 
-def get_publication_file(api_base_uri: str, publication: Publication) -> bytes:
-    """
-    Retrieve publication file from Parliament Publications API.
-
-    Args:
-        api_base_uri (str): Base URI for the Parliament Publications API
-        publication (Publication): Publication metadata object
-
-    Returns:
-        bytes: Raw publication file data
-    """
-    client = ParliamentPublicationsAPIClient(api_base_uri)
-    file = client.get_publication_file(publication)
-    return file
+class PublicationsNotSavedError(Exception):
+    """Raised when no message in the batch had all of its publication files saved."""
 
 
 @tracer.capture_lambda_handler
@@ -53,35 +41,57 @@ def lambda_handler(
     AWS Lambda handler for processing SQS events containing publication records.
 
     Processes each record in the SQS event by:
-    1. Parsing the publication metadata from JSON
-    2. Retrieving the publication file from the Parliament API
-    3. Storing the file in S3
+    1. Parsing the publication metadata from JSON, reading it from S3 if the message
+       is a claim check
+    2. Streaming every file of every document from the Parliament API concurrently
+    3. Storing each file and its metadata in S3 as it is received, using a multipart
+       upload for large files
+
+    Each record is processed separately, so one failure does not stop the rest of the
+    batch. Messages that cannot be read, or with any file that was not saved, are reported
+    as batch item failures so SQS redelivers them, or moves them to the dead-letter queue.
+    If no message was saved in full, the handler raises instead.
 
     Args:
         event (SQSEvent): SQS event containing publication records
         context (LambdaContext): Lambda execution context
 
     Returns:
-        dict: Response object with status code and message
+        dict: Batch item failures for the messages to redeliver
 
     Raises:
-        JSONDecodeError: If record body contains invalid JSON
-        Exception: For any other unexpected errors
+        PublicationsNotSavedError: If no message had all of its publication files saved
     """
-    try:
-        for record in event.records:
-            publication_json = json.loads(record.body)
-            publication = Publication.from_dict(publication_json)
-
-            file = get_publication_file(COMMITTEE_API_BASE_URI, publication)
-
-            s3_client.save_publication(file, publication, COMMITTEE_BASE_URI)
-
-        return {"statusCode": 200, "body": "Ok"}
-
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON Decoding Error: {e}")
-        return {"statusCode": 400, "body": "Invalid JSON in the request body"}
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error(f"Unexpected Error: {e}")
-        return {"statusCode": 500, "body": "An unexpected error occurred"}
+    client = ParliamentPublicationsAPIClient(COMMITTEE_API_BASE_URI)
+    message_ids = []
+    failed_records = []
+
+    for record in event.records:
+        message_ids.append(record.message_id)
+        try:
+            publication = Publication.from_json(read_message(record.body))
+            report = s3_client.save_publication_files(
+                publication, client.iter_document_file, COMMITTEE_BASE_URI
+            )
+        # A claim check that cannot be read or an invalid message only fails its own record
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to process message %s: %s", record.message_id, e)
+            failed_records.append(record.message_id)
+            continue
+
+        if report.failed:
+            logger.error(
+                "Failed to save files %s from message %s",
+                list(report.failed),
+                record.message_id,
+            )
+            failed_records.append(record.message_id)
+
+    if failed_records and len(failed_records) == len(message_ids):
+        raise PublicationsNotSavedError(f"Failed to save messages {failed_records}")
+
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_records
+        ]
+    }
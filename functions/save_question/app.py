@@ -4,15 +4,17 @@ It retrieves full question details from the Parliament Questions API and handles
 """
 
 import os
-import json
-from dateutil import parser
+from typing import Dict, Iterable, List, Set, Tuple
+
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from aws_lambda_powertools.utilities.data_classes import SQSEvent, event_source
+from aws_lambda_powertools.utilities.data_classes import SQSEvent, SQSRecord, event_source
 
+from caching import default_response_cache
+from queueing import unpack_message
 from storage import S3Storage
 from parliament_api_client import ParliamentQuestionsAPIClient
-from models import Question, House
+from models import Question, IndexedQuestions
 
 logger = Logger()
 tracer = Tracer()
@@ -20,20 +22,48 @@ tracer = Tracer()
 QUESTION_API_BASE_URI = os.environ["QUESTION_API_BASE_URI"]
 QUESTIONS_BUCKET = os.environ["QUESTIONS_BUCKET"]
 
+# Kept across warm invocations so redelivered messages reuse earlier responses
+RESPONSE_CACHE = default_response_cache()
+
+
+class QuestionsNotSavedError(Exception):
+    """Raised when no message in the batch had all of its questions saved."""
+
 
-def save_question(question: Question, questions_bucket: str) -> None:
+def read_questions(
+    records: Iterable[SQSRecord],
+) -> Tuple[IndexedQuestions, Dict[str, Set[int]], List[str]]:
     """
-    Save a parliamentary question to S3 storage.
+    Read the questions from each SQS record, unpacking any envelopes of many questions.
 
     Args:
-        question (Question): The question object to save
-        questions_bucket (str): Name of the S3 bucket to save to
+        records (Iterable[SQSRecord]): Records of the SQS event
 
     Returns:
-        None
+        Tuple[IndexedQuestions, Dict[str, Set[int]], List[str]]: Questions of the batch,
+            the question IDs of each message by message ID, and the IDs of messages
+            that could not be read
     """
-    question_repository = S3Storage(bucket_name=questions_bucket)
-    question_repository.save_question(question)
+    questions = IndexedQuestions()
+    record_question_ids = {}
+    unreadable_records = []
+    for record in records:
+        logger.debug(f"Question: {record.body}")
+        try:
+            record_questions = [
+                Question.from_value(value) for value in unpack_message(record.body)
+            ]
+        # An invalid envelope or an expired claim check only fails its own record
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to read message %s: %s", record.message_id, e)
+            unreadable_records.append(record.message_id)
+            continue
+
+        record_question_ids[record.message_id] = {question.id for question in record_questions}
+        for question in record_questions:
+            questions.add(question)
+
+    return questions, record_question_ids, unreadable_records
 
 
 @tracer.capture_lambda_handler
@@ -45,39 +75,61 @@ def lambda_handler(
     """
     AWS Lambda handler that processes SQS events containing parliamentary questions.
 
-    Retrieves questions from SQS, gets full details from Parliament API, and saves to S3.
+    Retrieves questions from SQS, unpacking any envelopes of many questions, gets full details
+    from Parliament API for any truncated questions in the batch, and saves them to S3.
+
+    Each message is read, and each question retrieved and saved, separately, so one failure
+    does not stop the rest of the batch. Messages that cannot be read, or with any question
+    that was not saved, are reported as batch item failures so SQS redelivers them, or moves
+    them to the dead-letter queue; questions saved already are skipped as unchanged on
+    redelivery. If no message was saved in full, the
+    handler raises instead.
 
     Args:
         event (SQSEvent): The SQS event containing question data
         context (LambdaContext): Lambda execution context
 
     Returns:
-        dict: Response object with status code and body
+        dict: Batch item failures for the messages to redeliver
+
+    Raises:
+        QuestionsNotSavedError: If no message had all of its questions saved
     """
-    try:
-        parliament_api_client = ParliamentQuestionsAPIClient(
-            base_uri=QUESTION_API_BASE_URI
+    parliament_api_client = ParliamentQuestionsAPIClient(
+        base_uri=QUESTION_API_BASE_URI, cache=RESPONSE_CACHE
+    )
+
+    questions, record_question_ids, unreadable_records = read_questions(event.records)
+
+    full_questions, failed = parliament_api_client.try_get_full_questions(questions)
+    question_repository = S3Storage(bucket_name=QUESTIONS_BUCKET)
+    report = question_repository.save_questions(full_questions)
+
+    failed_ids = set(failed)
+    failed_ids.update(
+        question.id
+        for question in full_questions
+        if question_repository.question_key(question) in report.failed
+    )
+    failed_records = unreadable_records + [
+        message_id
+        for message_id, question_ids in record_question_ids.items()
+        if question_ids & failed_ids
+    ]
+    if not failed_records:
+        return {"batchItemFailures": []}
+
+    if failed_ids:
+        logger.error(
+            "Failed to save questions %s from messages %s", sorted(failed_ids), failed_records
+        )
+    if len(failed_records) == len(unreadable_records) + len(record_question_ids):
+        raise QuestionsNotSavedError(
+            f"Failed to save messages {failed_records}, questions {sorted(failed_ids)}"
         )
 
-        for record in event.records:
-            json_question = json.loads(record.body)
-            logger.debug(f"Question: {json_question}")
-            question = Question(
-                id=json_question["id"],
-                house=House(json_question["house"].lower()),
-                date_tabled=parser.parse(json_question["date_tabled"]),
-                question=json_question["question"],
-                answer=json_question["answer"],
-            )
-
-            full_question = parliament_api_client.get_full_question(question)
-            save_question(full_question, QUESTIONS_BUCKET)
-
-        return {"statusCode": 200, "body": "Ok"}
-
-    except json.JSONDecodeError as json_error:
-        logger.error(f"JSON Decoding Error: {json_error}")
-        return {"statusCode": 400, "body": "Invalid JSON in the request body"}
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error("Error: %s", e)
-        return {"statusCode": 500, "body": {"message": e}}
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_records
+        ]
+    }
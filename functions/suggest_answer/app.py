@@ -16,6 +16,7 @@ from aws_lambda_powertools.event_handler.openapi.exceptions import RequestValida
 from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from circuit_breaker import CircuitOpenError
 from repositories import BedrockAgent
 
 logger = Logger()
@@ -53,6 +54,26 @@ def handle_validation_error(ex: RequestValidationError):
         body="Invalid data",
     )
 
+@app.exception_handler(CircuitOpenError)
+def handle_circuit_open_error(ex: CircuitOpenError):
+    """
+    Handle requests rejected because the Bedrock Agent circuit is open.
+
+    Args:
+        ex (CircuitOpenError): The circuit open error that occurred
+
+    Returns:
+        Response: HTTP 503 response with a Retry-After header
+    """
+    logger.warning("Request rejected by circuit breaker", circuit=ex.name)
+
+    return Response(
+        status_code=503,
+        content_type=content_types.APPLICATION_JSON,
+        body="Service temporarily unavailable",
+        headers={"Retry-After": str(max(1, int(ex.retry_after)))},
+    )
+
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_HTTP)
 def lambda_handler(event: dict, context: LambdaContext) -> dict:
@@ -0,0 +1,742 @@
+"""
+Module providing asyncio counterparts of the Parliament API clients.
+
+The async clients send requests with aiohttp on the running event loop, so a handler can
+fan out hundreds of requests without blocking a thread per call. They return the same
+models and apply the same validation as the clients in parliament_api_client, and share
+each endpoint family's rate limiter and circuit breaker with them. Connection errors and
+500, 502 and 504 responses are retried with the same policy as the pooled transport.
+
+Each client owns an aiohttp session, created on first use and bound to the event loop it
+was created on. Use the clients as async context managers, or await close() when done.
+run_sync runs a coroutine from synchronous code, so the existing handlers keep using the
+synchronous clients unchanged and can call into the async clients where they fan out.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncIterator, Awaitable, Dict, List, Tuple, TypeVar
+
+import aiohttp
+
+from aws_lambda_powertools import Logger, Metrics
+
+from caching import CachedResponse, ResponseCache
+from circuit_breaker import get_circuit_breaker
+from decoding import (
+    Base64FieldDecoder,
+    decode_api_publication,
+    decode_api_question,
+    decode_api_question_records,
+    decode_api_questions,
+)
+from models import (
+    Publications,
+    PublicationDocument,
+    PublicationFile,
+    Question,
+    QuestionRecord,
+    Questions,
+)
+from parliament_api_client import (
+    CIRCUIT_FAILURE_STATUS_CODES,
+    MAX_PAGE_WORKERS,
+    MAX_THROTTLE_RETRIES,
+    STREAM_CHUNK_SIZE,
+    TAKE,
+    THROTTLE_STATUS_CODES,
+    DateType,
+    publications_url,
+    questions_url,
+    validate_base_uri,
+    validate_start_end_dates,
+)
+from rate_limiting import get_rate_limiter, parse_retry_after
+from serialization import loads
+from transport import (
+    CONNECT_TIMEOUT,
+    POOL_MAXSIZE,
+    READ_TIMEOUT,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+)
+
+logger = Logger()
+metrics = Metrics()
+
+ResultT = TypeVar("ResultT")
+
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+def run_sync(awaitable: Awaitable[ResultT]) -> ResultT:
+    """
+    Run a coroutine to completion from synchronous code, such as a Lambda handler.
+
+    The coroutine runs on a new event loop, so clients must be created, used and
+    closed within it.
+
+    Args:
+        awaitable (Awaitable[ResultT]): Coroutine to run
+
+    Returns:
+        ResultT: Result of the coroutine
+
+    Raises:
+        RuntimeError: If called while an event loop is running in the current thread
+    """
+    return asyncio.run(awaitable)
+
+
+class AsyncParliamentAPIClient:
+    """Base class for the asyncio Parliament API clients."""
+
+    rate_limit_family = None
+
+    def __init__(
+        self,
+        base_uri: str,
+        cache: ResponseCache = None,
+        session: aiohttp.ClientSession = None,
+    ):
+        """
+        Initialize the client with base URI.
+
+        Args:
+            base_uri (str): Base URI for the API
+            cache (ResponseCache, optional): Cache for lookups by ID. Defaults to None.
+            session (aiohttp.ClientSession, optional): Session to send requests with, which
+                the caller closes. Defaults to a session owned by the client.
+
+        Raises:
+            ValueError: If base_uri is invalid
+        """
+        try:
+            validate_base_uri(base_uri)
+
+        except ValueError as e:
+            logger.warning("Invalid base uri %s", e)
+            raise e
+
+        self.base_uri = base_uri
+        self.cache = cache
+        self.rate_limiter = (
+            get_rate_limiter(self.rate_limit_family) if self.rate_limit_family else None
+        )
+        self.circuit_breaker = get_circuit_breaker(
+            f"ParliamentAPI{(self.rate_limit_family or '').title()}"
+        )
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the client's session, if the client created it.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Session used to send requests, created on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=POOL_MAXSIZE),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+                ),
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def _get(self, url: str, headers: dict = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a GET request through the client's circuit breaker.
+
+        Connection errors, timeouts and 5xx responses count as failures of the API.
+        While the circuit is open requests fail fast without being sent.
+
+        Args:
+            url (str): URL to retrieve
+            headers (dict, optional): Request headers. Defaults to None.
+
+        Yields:
+            aiohttp.ClientResponse: Response from the API, released on exit
+
+        Raises:
+            CircuitOpenError: If the circuit for the API is open
+        """
+        self.circuit_breaker.before_call()
+        try:
+            response = await self._get_with_retries(url, headers)
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+
+        if response.status in CIRCUIT_FAILURE_STATUS_CODES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def _get_with_retries(self, url: str, headers: dict) -> aiohttp.ClientResponse:
+        """
+        Send a GET request, retrying connection errors and server errors.
+
+        Uses the transport's retry policy: up to RETRY_TOTAL retries of connection errors,
+        timeouts and RETRY_STATUS_FORCELIST responses, with exponential backoff.
+
+        Args:
+            url (str): URL to retrieve
+            headers (dict): Request headers
+
+        Returns:
+            aiohttp.ClientResponse: Response from the API
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self._get_rate_limited(url, headers)
+                if response.status not in RETRY_STATUS_FORCELIST or attempt >= RETRY_TOTAL:
+                    return response
+                response.release()
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= RETRY_TOTAL:
+                    raise
+                logger.warning("Retrying %s after %s", url, repr(e))
+
+            attempt += 1
+            await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1))
+
+    async def _get_rate_limited(self, url: str, headers: dict) -> aiohttp.ClientResponse:
+        """
+        Send a GET request paced by the client's rate limiter.
+
+        Throttling responses (429 and 503) slow the limiter down and are retried
+        after any Retry-After delay, up to MAX_THROTTLE_RETRIES times.
+
+        Args:
+            url (str): URL to retrieve
+            headers (dict): Request headers
+
+        Returns:
+            aiohttp.ClientResponse: Response from the API
+        """
+        if self.rate_limiter is None:
+            return await self.session.get(url, headers=headers)
+
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            await self.rate_limiter.acquire_async()
+            response = await self.session.get(url, headers=headers)
+
+            if response.status not in THROTTLE_STATUS_CODES:
+                self.rate_limiter.on_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning(
+                "Throttled by API with status %s, retry after %s",
+                response.status,
+                retry_after,
+            )
+            self.rate_limiter.on_throttle(retry_after)
+            if attempt < MAX_THROTTLE_RETRIES:
+                response.release()
+
+        return response
+
+    async def _get_json(self, url: str) -> dict:
+        """
+        Get a JSON response.
+
+        Args:
+            url (str): URL to retrieve
+
+        Returns:
+            dict: Decoded JSON response
+
+        Raises:
+            aiohttp.ClientResponseError: If HTTP error occurs
+        """
+        async with self._get(url) as response:
+            response.raise_for_status()
+            return loads(await response.read())
+
+    async def _get_cached_json(self, url: str) -> dict:
+        """
+        Get a JSON response, using the response cache if the client has one.
+
+        Fresh cached responses are returned without a request. Stale responses with an
+        ETag or Last-Modified validator are revalidated with a conditional request.
+
+        Args:
+            url (str): URL to retrieve
+
+        Returns:
+            dict: Decoded JSON response
+
+        Raises:
+            aiohttp.ClientResponseError: If HTTP error occurs
+        """
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached and self.cache.is_fresh(cached):
+            metrics.add_metric(name="APICacheHit", unit="Count", value=1)
+            return cached.body
+
+        headers = cached.conditional_headers() if cached else None
+        async with self._get(url, headers=headers) as response:
+            if cached and response.status == 304:
+                metrics.add_metric(name="APICacheRevalidated", unit="Count", value=1)
+                self.cache.set(cached.refreshed())
+                return cached.body
+
+            response.raise_for_status()
+            body = loads(await response.read())
+
+            if self.cache is not None:
+                metrics.add_metric(name="APICacheMiss", unit="Count", value=1)
+                self.cache.set(
+                    CachedResponse(
+                        url=url,
+                        body=body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                )
+
+            return body
+
+
+class AsyncParliamentCommitteesAPIClient(AsyncParliamentAPIClient):
+    """Asyncio client for accessing Parliament Committee API endpoints."""
+
+    rate_limit_family = "committees"
+
+    async def get_sub_committees(self, parent_committee_id: int) -> list:
+        """
+        Get list of sub-committees for a parent committee.
+
+        Args:
+            parent_committee_id (int): ID of the parent committee
+
+        Returns:
+            list: List of sub-committee dictionaries with id and name
+        """
+        committee_json = await self._get_cached_json(
+            f"{self.base_uri}committees/{parent_committee_id}"
+        )
+
+        return [
+            {"id": sub_committee["id"], "name": sub_committee["name"]}
+            for sub_committee in committee_json["subCommittees"]
+        ]
+
+    async def get_committee_tree(self, committee_id: int) -> List[int]:
+        """
+        Get a committee and all of its sub-committees, at any depth.
+
+        The tree is walked a level at a time, looking up every committee in a level
+        concurrently. Each committee is looked up once, even if it appears under more
+        than one parent.
+
+        Args:
+            committee_id (int): ID of the root committee
+
+        Returns:
+            List[int]: IDs of the root committee followed by its sub-committees, level by level
+
+        Raises:
+            aiohttp.ClientResponseError: If HTTP error occurs
+        """
+        committee_ids = [committee_id]
+        visited = {committee_id}
+        level = [committee_id]
+
+        while level:
+            next_level = []
+            for sub_committees in await asyncio.gather(
+                *(self.get_sub_committees(parent_id) for parent_id in level)
+            ):
+                for sub_committee in sub_committees:
+                    if sub_committee["id"] not in visited:
+                        visited.add(sub_committee["id"])
+                        next_level.append(sub_committee["id"])
+            committee_ids.extend(next_level)
+            level = next_level
+
+        metrics.add_metric(name="CommitteeTreeSize", unit="Count", value=len(committee_ids))
+        return committee_ids
+
+
+class AsyncParliamentPublicationsAPIClient(AsyncParliamentAPIClient):
+    """Asyncio client for accessing Parliament Publications API endpoints."""
+
+    rate_limit_family = "publications"
+
+    async def iter_document_file(
+        self,
+        document: PublicationDocument,
+        file: PublicationFile,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the decoded data of one file of a publication document.
+
+        The response is read in chunks and the base64 data field is decoded as it
+        arrives, so memory use is bounded by the chunk size rather than the file size.
+
+        Args:
+            document (PublicationDocument): Document containing the file
+            file (PublicationFile): File to download, in its data format
+            chunk_size (int): Number of bytes to read from the response at a time
+
+        Yields:
+            bytes: Chunks of the decoded file
+
+        Raises:
+            KeyError: If the response has no data field
+            aiohttp.ClientError: For request errors
+        """
+        url = f"{self.base_uri}{document.file_api_uri_path(file)}"
+        decoder = Base64FieldDecoder("data")
+
+        logger.debug("Streaming %s", url)
+        async with self._get(url) as response:
+            response.raise_for_status()
+
+            async for chunk in response.content.iter_chunked(chunk_size):
+                data = decoder.feed(chunk)
+                if data:
+                    yield data
+                if decoder.complete:
+                    break
+
+            decoder.close()
+
+    async def get_committee_publications_list(
+        self, committee_id: int, start_date: date, end_date: date
+    ) -> Publications:
+        """
+        Get list of publications for a committee within a date range.
+
+        The first page is retrieved to discover totalResults, the remaining pages are
+        then retrieved concurrently.
+
+        Args:
+            committee_id (int): ID of the committee
+            start_date (date): Start date for publication search
+            end_date (date): End date for publication search
+
+        Returns:
+            Publications: Object containing list of publications with documents and files
+
+        Raises:
+            ValueError: If the dates are invalid
+            aiohttp.ClientError: For request errors
+        """
+        validate_start_end_dates(start_date, end_date)
+
+        first_page = await self._get_json(
+            publications_url(self.base_uri, committee_id, start_date, end_date, 0)
+        )
+        pages = [first_page] + await asyncio.gather(
+            *(
+                self._get_json(
+                    publications_url(self.base_uri, committee_id, start_date, end_date, skip)
+                )
+                for skip in range(TAKE, first_page["totalResults"], TAKE)
+            )
+        )
+
+        publications = Publications(committee_api_base_uri=self.base_uri)
+        for page in pages:
+            for api_publication in page["items"]:
+                publications.append(decode_api_publication(api_publication))
+
+        return publications
+
+    async def get_publications_for_committees(
+        self, committee_ids: List[int], start_date: date, end_date: date
+    ) -> Publications:
+        """
+        Get the publications of several committees within a date range.
+
+        Each committee's list is fetched concurrently. Publications shared by more than
+        one committee are only included once, in the order of the first committee listing them.
+
+        Args:
+            committee_ids (List[int]): IDs of the committees
+            start_date (date): Start date for publication search
+            end_date (date): End date for publication search
+
+        Returns:
+            Publications: Object containing the merged list of publications
+
+        Raises:
+            ValueError: If the dates are invalid
+            aiohttp.ClientError: For request errors
+        """
+        validate_start_end_dates(start_date, end_date)
+
+        merged = Publications(committee_api_base_uri=self.base_uri)
+        seen = set()
+
+        for publications in await asyncio.gather(
+            *(
+                self.get_committee_publications_list(committee_id, start_date, end_date)
+                for committee_id in committee_ids
+            )
+        ):
+            for publication in publications.publications:
+                if publication.id not in seen:
+                    seen.add(publication.id)
+                    merged.append(publication)
+
+        return merged
+
+
+class AsyncParliamentQuestionsAPIClient(AsyncParliamentAPIClient):
+    """Asyncio client for accessing Parliament Questions API endpoints."""
+
+    rate_limit_family = "questions"
+
+    async def get_question_by_id(self, question_id: int) -> Question:
+        """
+        Get a specific question by its ID.
+
+        Args:
+            question_id (int): ID of the question to retrieve
+
+        Returns:
+            Question: Question object containing ID, house, date tabled, question text and answer text
+        """
+        question_json = await self._get_cached_json(f"{self.base_uri}questions/{question_id}")
+
+        return decode_api_question(question_json)
+
+    async def get_full_question(self, question: Question) -> Question:
+        """
+        Get complete question and answer if not already present.
+
+        Args:
+            question (Question): Question object to complete
+
+        Returns:
+            Question: Complete question object with full question and answer text
+        """
+        full_questions = await self.get_full_questions(Questions(questions=[question]))
+        return full_questions.questions[0]
+
+    async def get_full_questions(self, questions: Questions) -> Questions:
+        """
+        Get complete questions and answers for a batch of questions.
+
+        Only questions whose text or answer is truncated are retrieved from the API,
+        all of them concurrently. Complete questions are returned as they are.
+
+        Args:
+            questions (Questions): Questions to complete
+
+        Returns:
+            Questions: Complete questions in the same order as the input
+
+        Raises:
+            aiohttp.ClientError: If retrieving a question fails
+        """
+        full_questions, failed = await self.try_get_full_questions(questions)
+        if failed:
+            raise next(iter(failed.values()))
+
+        return full_questions
+
+    async def try_get_full_questions(
+        self, questions: Questions
+    ) -> Tuple[Questions, Dict[int, Exception]]:
+        """
+        Get complete questions and answers, retrieving each question separately.
+
+        A failure to retrieve one question does not stop the rest of the batch; the
+        question is left out of the result and its error is returned by question ID.
+
+        Args:
+            questions (Questions): Questions to complete
+
+        Returns:
+            Tuple[Questions, Dict[int, Exception]]: Complete questions in the same order
+                as the input, and the error for each question that could not be retrieved
+        """
+        questions = list(questions)
+        incomplete = [
+            index
+            for index, question in enumerate(questions)
+            if not (question.complete_question and question.complete_answer)
+        ]
+
+        metrics.add_metric(name="QuestionAPIRequest", unit="Count", value=len(incomplete))
+        metrics.add_metric(
+            name="QuestionComplete", unit="Count", value=len(questions) - len(incomplete)
+        )
+
+        failed = {}
+        if incomplete:
+            logger.info(
+                "Retrieving %s full questions and answers from API", len(incomplete)
+            )
+            results = await asyncio.gather(
+                *(self.get_question_by_id(questions[index].id) for index in incomplete),
+                return_exceptions=True,
+            )
+            for index, result in zip(incomplete, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        "Failed to retrieve question %s: %s", questions[index].id, result
+                    )
+                    failed[questions[index].id] = result
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    questions[index] = result
+
+        if failed:
+            metrics.add_metric(name="QuestionAPIFailure", unit="Count", value=len(failed))
+
+        return (
+            Questions(
+                questions=[question for question in questions if question.id not in failed]
+            ),
+            failed,
+        )
+
+    async def _iter_questions(
+        self, date_type: DateType, start_date: date, end_date: date, records: bool = False
+    ) -> AsyncIterator:
+        """
+        Generator behind iter_questions_by_date and iter_question_records_by_date.
+
+        At most MAX_PAGE_WORKERS pages are in flight or waiting to be consumed
+        at any one time, so memory stays flat however long the date range is.
+        """
+        decode = decode_api_question_records if records else decode_api_questions
+        pending = []
+
+        try:
+            first_page = await self._get_json(
+                questions_url(self.base_uri, date_type, start_date, end_date, 0)
+            )
+            total_results = first_page["totalResults"]
+            for question in decode(first_page["results"]):
+                yield question
+            del first_page
+
+            for skip in range(TAKE, total_results, TAKE):
+                url = questions_url(self.base_uri, date_type, start_date, end_date, skip)
+                pending.append(asyncio.ensure_future(self._get_json(url)))
+                if len(pending) >= MAX_PAGE_WORKERS:
+                    for question in decode((await pending.pop(0))["results"]):
+                        yield question
+
+            while pending:
+                for question in decode((await pending.pop(0))["results"]):
+                    yield question
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Request failed: {e}")
+            raise e
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_metrics()
+
+    def iter_questions_by_date(
+        self, date_type: DateType, start_date: date, end_date: date
+    ) -> AsyncIterator[Question]:
+        """
+        Iterate over all questions tabled or answered between two dates.
+
+        Questions are yielded as each page is decoded. The first page is retrieved
+        to discover totalResults, the remaining pages are then retrieved concurrently,
+        up to MAX_PAGE_WORKERS at a time, and yielded in offset order.
+
+        Args:
+            date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+            start_date (date): Start date for question search
+            end_date (date): End date for question search
+
+        Returns:
+            AsyncIterator[Question]: Async iterator over the questions
+
+        Raises:
+            ValueError: If the dates or date_type are invalid
+            aiohttp.ClientError: For request errors while iterating
+        """
+        validate_start_end_dates(start_date, end_date)
+        questions_url(self.base_uri, date_type, start_date, end_date, 0)
+
+        return self._iter_questions(date_type, start_date, end_date)
+
+    def iter_question_records_by_date(
+        self, date_type: DateType, start_date: date, end_date: date
+    ) -> AsyncIterator[QuestionRecord]:
+        """
+        Iterate over all questions tabled or answered between two dates as question records.
+
+        Behaves like iter_questions_by_date, but yields lightweight QuestionRecord
+        instances for bulk processing.
+
+        Args:
+            date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+            start_date (date): Start date for question search
+            end_date (date): End date for question search
+
+        Returns:
+            AsyncIterator[QuestionRecord]: Async iterator over the question records
+
+        Raises:
+            ValueError: If the dates or date_type are invalid
+            aiohttp.ClientError: For request errors while iterating
+        """
+        validate_start_end_dates(start_date, end_date)
+        questions_url(self.base_uri, date_type, start_date, end_date, 0)
+
+        return self._iter_questions(date_type, start_date, end_date, records=True)
+
+    async def get_questions_by_date(
+        self, date_type: DateType, start_date: date, end_date: date
+    ) -> Questions:
+        """
+        Get all questions tabled or answered between two dates.
+
+        Collects iter_questions_by_date into a single Questions object.
+
+        Args:
+            date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+            start_date (date): Start date for question search
+            end_date (date): End date for question search
+
+        Returns:
+            Questions: Object containing list of questions
+
+        Raises:
+            ValueError: If the dates or date_type are invalid
+            aiohttp.ClientError: For request errors
+        """
+        questions = Questions()
+        async for question in self.iter_questions_by_date(date_type, start_date, end_date):
+            questions.add(question)
+
+        return questions
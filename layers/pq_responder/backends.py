@@ -0,0 +1,470 @@
+"""
+Module providing the service clients used by queueing and storage.
+
+The SQS, S3 and SSM clients are created through client(), which returns a boto3 client
+by default. For local load testing the SERVICE_BACKEND environment variable selects an
+in-process implementation of the same client calls instead:
+    aws     boto3 clients (default)
+    memory  Queues, objects and parameters held in memory, shared by the whole process
+    local   Queues, objects and parameters held as files under SERVICE_BACKEND_DIR
+            (default /tmp/pq-responder-backend), shared by every process using the dir
+
+SQSQueue, S3Storage and SSMStorage are unchanged whichever backend is selected, so the
+Lambda handlers can be run in-process against them. Clients are created when queueing
+and storage are imported, so the environment must be set before then.
+
+The in-process clients implement only the calls and response fields this solution uses.
+Errors are raised as botocore ClientErrors with the same codes as the real services.
+SQS visibility timeouts are not emulated: a received message stays hidden until it is
+deleted or returned with release_messages.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import uuid
+from itertools import count
+from typing import Dict, List, Optional, Tuple, Union
+
+import boto3
+import botocore.exceptions
+
+from aws_lambda_powertools import Logger
+
+from serialization import dumps, loads
+
+logger = Logger()
+
+AWS_BACKEND = "aws"
+MEMORY_BACKEND = "memory"
+LOCAL_BACKEND = "local"
+BACKENDS = (AWS_BACKEND, MEMORY_BACKEND, LOCAL_BACKEND)
+DEFAULT_BACKEND_DIR = os.path.join(tempfile.gettempdir(), "pq-responder-backend")
+
+_OK = {"ResponseMetadata": {"HTTPStatusCode": 200}}
+
+
+def _client_error(operation: str, code: str, message: str, status: int = 400):
+    return botocore.exceptions.ClientError(
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        operation,
+    )
+
+
+class MemoryStore:
+    """Thread-safe store of byte values by namespace and key, held in memory."""
+
+    def __init__(self):
+        self._namespaces: Dict[str, Dict[str, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, namespace: str, key: str, value: bytes) -> None:
+        """Store a value, replacing any existing value."""
+        with self._lock:
+            self._namespaces.setdefault(namespace, {})[key] = value
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Get a value, or None if it does not exist."""
+        with self._lock:
+            return self._namespaces.get(namespace, {}).get(key)
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete a value, returning False if it did not exist."""
+        with self._lock:
+            return self._namespaces.get(namespace, {}).pop(key, None) is not None
+
+    def move(self, namespace: str, key: str, destination: str) -> bool:
+        """Move a value to another namespace, returning False if it did not exist."""
+        with self._lock:
+            value = self._namespaces.get(namespace, {}).pop(key, None)
+            if value is None:
+                return False
+            self._namespaces.setdefault(destination, {})[key] = value
+            return True
+
+    def take(self, namespace: str, destination: str, limit: int) -> List[Tuple[str, bytes]]:
+        """Move up to limit of the oldest values to another namespace and return them."""
+        taken = []
+        with self._lock:
+            values = self._namespaces.get(namespace, {})
+            target = self._namespaces.setdefault(destination, {})
+            while values and len(taken) < limit:
+                key = next(iter(values))
+                target[key] = values.pop(key)
+                taken.append((key, target[key]))
+        return taken
+
+    def keys(self, namespace: str, prefix: str = "") -> List[str]:
+        """List the keys of a namespace starting with prefix, in sorted order."""
+        with self._lock:
+            keys = list(self._namespaces.get(namespace, {}))
+        return sorted(key for key in keys if key.startswith(prefix))
+
+    def size(self) -> int:
+        """Total size in bytes of every stored value."""
+        with self._lock:
+            return sum(
+                len(value) for values in self._namespaces.values() for value in values.values()
+            )
+
+
+class FileStore:
+    """
+    Store of byte values by namespace and key, held as files under a directory.
+
+    Values are written to a temporary file and renamed into place, and moves are
+    renames, so several processes can share a directory.
+
+    Args:
+        root (str): Directory holding one subdirectory per namespace
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, namespace: str, key: str = "") -> str:
+        return os.path.join(self.root, namespace, key.lstrip("/"))
+
+    def put(self, namespace: str, key: str, value: bytes) -> None:
+        """Store a value, replacing any existing value."""
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        with os.fdopen(handle, "wb") as file:
+            file.write(value)
+        os.replace(temp_path, path)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Get a value, or None if it does not exist."""
+        try:
+            with open(self._path(namespace, key), "rb") as file:
+                return file.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete a value, returning False if it did not exist."""
+        try:
+            os.remove(self._path(namespace, key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def move(self, namespace: str, key: str, destination: str) -> bool:
+        """Move a value to another namespace, returning False if it did not exist."""
+        path = self._path(destination, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.rename(self._path(namespace, key), path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def take(self, namespace: str, destination: str, limit: int) -> List[Tuple[str, bytes]]:
+        """Move up to limit of the oldest values to another namespace and return them.
+
+        Values are ordered by key. A value moved by another process first is skipped.
+        """
+        try:
+            keys = sorted(
+                name for name in os.listdir(self._path(namespace)) if not name.startswith(".tmp-")
+            )
+        except FileNotFoundError:
+            return []
+
+        taken = []
+        for key in keys:
+            if len(taken) == limit:
+                break
+            if self.move(namespace, key, destination):
+                taken.append((key, self.get(destination, key)))
+        return taken
+
+    def keys(self, namespace: str, prefix: str = "") -> List[str]:
+        """List the keys of a namespace starting with prefix, in sorted order."""
+        base = self._path(namespace)
+        keys = []
+        for directory, _, files in os.walk(base):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                key = os.path.relpath(os.path.join(directory, name), base).replace(os.sep, "/")
+                if key.startswith(prefix):
+                    keys.append(key)
+        return sorted(keys)
+
+    def size(self) -> int:
+        """Total size in bytes of every stored value."""
+        return sum(
+            os.path.getsize(os.path.join(directory, name))
+            for directory, _, files in os.walk(self.root)
+            for name in files
+        )
+
+
+Store = Union[MemoryStore, FileStore]
+
+
+class InProcessS3Client:
+    """S3 client calls used by S3Storage and SQSQueue, backed by a store."""
+
+    def __init__(self, store: Store):
+        self.store = store
+        self._uploads: Dict[str, Dict[int, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, Metadata=None, **_):  # pylint: disable=invalid-name
+        """Store an object and its user metadata."""
+        body = Body.encode("utf-8") if isinstance(Body, str) else bytes(Body)
+        self.store.put(f"s3/{Bucket}", Key, body)
+        self.store.put(f"s3-metadata/{Bucket}", Key, dumps(Metadata or {}))
+        return {**_OK, "ETag": f'"{hashlib.md5(body).hexdigest()}"'}  # nosec
+
+    def head_object(self, Bucket, Key, **_):  # pylint: disable=invalid-name
+        """Get an object's user metadata and size."""
+        metadata = self.store.get(f"s3-metadata/{Bucket}", Key)
+        body = self.store.get(f"s3/{Bucket}", Key)
+        if body is None:
+            raise _client_error("HeadObject", "404", "Not Found", 404)
+        return {**_OK, "ContentLength": len(body), "Metadata": loads(metadata or b"{}")}
+
+    def get_object(self, Bucket, Key, **_):  # pylint: disable=invalid-name
+        """Get an object, with its body as a readable stream."""
+        body = self.store.get(f"s3/{Bucket}", Key)
+        if body is None:
+            raise _client_error("GetObject", "NoSuchKey", "The specified key does not exist.", 404)
+        metadata = self.store.get(f"s3-metadata/{Bucket}", Key)
+        return {
+            **_OK,
+            "Body": io.BytesIO(body),
+            "ContentLength": len(body),
+            "Metadata": loads(metadata or b"{}"),
+        }
+
+    def delete_object(self, Bucket, Key, **_):  # pylint: disable=invalid-name
+        """Delete an object."""
+        self.store.delete(f"s3/{Bucket}", Key)
+        self.store.delete(f"s3-metadata/{Bucket}", Key)
+        return _OK
+
+    def list_objects_v2(self, Bucket, Prefix="", **_):  # pylint: disable=invalid-name
+        """List every object under a prefix in a single page."""
+        keys = self.store.keys(f"s3/{Bucket}", Prefix)
+        return {**_OK, "KeyCount": len(keys), "IsTruncated": False, "Contents": [{"Key": key} for key in keys]}
+
+    def create_multipart_upload(self, Bucket, Key, **_):  # pylint: disable=invalid-name,unused-argument
+        """Start a multipart upload."""
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {}
+        return {**_OK, "UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, **_):  # pylint: disable=invalid-name,unused-argument
+        """Upload one part of a multipart upload."""
+        with self._lock:
+            if UploadId not in self._uploads:
+                raise _client_error("UploadPart", "NoSuchUpload", "Upload does not exist", 404)
+            self._uploads[UploadId][PartNumber] = bytes(Body)
+        return {**_OK, "ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, **_):  # pylint: disable=invalid-name
+        """Join the listed parts into the object."""
+        with self._lock:
+            parts = self._uploads.pop(UploadId, None)
+        if parts is None:
+            raise _client_error("CompleteMultipartUpload", "NoSuchUpload", "Upload does not exist", 404)
+        body = b"".join(parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+        return self.put_object(Bucket=Bucket, Key=Key, Body=body)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, **_):  # pylint: disable=invalid-name,unused-argument
+        """Discard the parts of a multipart upload."""
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return _OK
+
+
+class InProcessSQSClient:
+    """
+    SQS client calls used by SQSQueue and SQS event sources, backed by a store.
+
+    Queues are created on first use and named by the last segment of the queue URL.
+    """
+
+    def __init__(self, store: Store):
+        self.store = store
+        self._sequence = count()
+
+    @staticmethod
+    def _queue(queue_url: str) -> str:
+        return f"sqs/{queue_url.rstrip('/').rsplit('/', 1)[-1]}"
+
+    def _message_id(self) -> str:
+        # Keys sort in send order within a process
+        return f"{time.time_ns():020d}-{next(self._sequence):08d}-{uuid.uuid4().hex[:8]}"
+
+    def send_message(self, QueueUrl, MessageBody, **_):  # pylint: disable=invalid-name
+        """Add a message to a queue."""
+        message_id = self._message_id()
+        self.store.put(self._queue(QueueUrl), message_id, MessageBody.encode("utf-8"))
+        return {**_OK, "MessageId": message_id}
+
+    def send_message_batch(self, QueueUrl, Entries, **_):  # pylint: disable=invalid-name
+        """Add up to 10 messages to a queue."""
+        successful = [
+            {"Id": entry["Id"], **self.send_message(QueueUrl, entry["MessageBody"])}
+            for entry in Entries
+        ]
+        for entry in successful:
+            entry.pop("ResponseMetadata")
+        return {**_OK, "Successful": successful, "Failed": []}
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages=1, **_):  # pylint: disable=invalid-name
+        """Take the oldest visible messages, hiding them until they are deleted or released."""
+        queue = self._queue(QueueUrl)
+        messages = [
+            {
+                "MessageId": message_id,
+                "ReceiptHandle": message_id,
+                "Body": body.decode("utf-8"),
+                "MD5OfBody": hashlib.md5(body).hexdigest(),  # nosec
+            }
+            for message_id, body in self.store.take(queue, f"{queue}-inflight", MaxNumberOfMessages)
+        ]
+        return {**_OK, "Messages": messages} if messages else _OK
+
+    def delete_message(self, QueueUrl, ReceiptHandle, **_):  # pylint: disable=invalid-name
+        """Delete a received message."""
+        self.store.delete(f"{self._queue(QueueUrl)}-inflight", ReceiptHandle)
+        return _OK
+
+    def release_messages(self, QueueUrl: str, ReceiptHandles: List[str]):  # pylint: disable=invalid-name
+        """Make received messages visible again, as when their visibility timeout expires."""
+        queue = self._queue(QueueUrl)
+        for receipt_handle in ReceiptHandles:
+            self.store.move(f"{queue}-inflight", receipt_handle, queue)
+        return _OK
+
+    def get_queue_attributes(self, QueueUrl, **_):  # pylint: disable=invalid-name
+        """Get the number of visible and in flight messages."""
+        queue = self._queue(QueueUrl)
+        return {
+            **_OK,
+            "Attributes": {
+                "ApproximateNumberOfMessages": str(len(self.store.keys(queue))),
+                "ApproximateNumberOfMessagesNotVisible": str(
+                    len(self.store.keys(f"{queue}-inflight"))
+                ),
+            },
+        }
+
+
+class InProcessSSMClient:
+    """SSM Parameter Store client calls used by SSMStorage, backed by a store."""
+
+    def __init__(self, store: Store):
+        self.store = store
+
+    def put_parameter(self, Name, Value, Overwrite=False, **_):  # pylint: disable=invalid-name
+        """Create or update a parameter."""
+        existing = self.store.get("ssm", Name)
+        if existing is not None and not Overwrite:
+            raise _client_error("PutParameter", "ParameterAlreadyExists", f"{Name} already exists")
+        version = loads(existing)["Version"] + 1 if existing is not None else 1
+        self.store.put("ssm", Name, dumps({"Value": Value, "Version": version}))
+        return {**_OK, "Version": version}
+
+    def get_parameter(self, Name, **_):  # pylint: disable=invalid-name
+        """Get a parameter."""
+        stored = self.store.get("ssm", Name)
+        if stored is None:
+            raise _client_error("GetParameter", "ParameterNotFound", f"{Name} not found")
+        return {**_OK, "Parameter": {"Name": Name, "Type": "String", **loads(stored)}}
+
+    def delete_parameter(self, Name, **_):  # pylint: disable=invalid-name
+        """Delete a parameter."""
+        if not self.store.delete("ssm", Name):
+            raise _client_error("DeleteParameter", "ParameterNotFound", f"{Name} not found")
+        return _OK
+
+
+IN_PROCESS_CLIENTS = {
+    "s3": InProcessS3Client,
+    "sqs": InProcessSQSClient,
+    "ssm": InProcessSSMClient,
+}
+
+_stores: Dict[str, Store] = {}
+_stores_lock = threading.Lock()
+
+
+def get_backend() -> str:
+    """
+    Get the service backend selected by SERVICE_BACKEND.
+
+    Returns:
+        str: "aws", "memory" or "local"
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = os.getenv("SERVICE_BACKEND", AWS_BACKEND)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown service backend: {backend}")
+    return backend
+
+
+def get_store(backend: Optional[str] = None) -> Store:
+    """
+    Get the store shared by every in-process client of a backend.
+
+    Args:
+        backend (str, optional): "memory" or "local". Defaults to SERVICE_BACKEND.
+
+    Returns:
+        Store: Store of the backend
+
+    Raises:
+        ValueError: If the backend is not an in-process backend
+    """
+    backend = backend or get_backend()
+    if backend == MEMORY_BACKEND:
+        location = MEMORY_BACKEND
+    elif backend == LOCAL_BACKEND:
+        location = os.path.abspath(os.getenv("SERVICE_BACKEND_DIR", DEFAULT_BACKEND_DIR))
+    else:
+        raise ValueError(f"{backend} is not an in-process service backend")
+
+    with _stores_lock:
+        if location not in _stores:
+            _stores[location] = MemoryStore() if backend == MEMORY_BACKEND else FileStore(location)
+        return _stores[location]
+
+
+def client(service: str, **kwargs):
+    """
+    Create a client for a service with the selected backend.
+
+    Args:
+        service (str): "s3", "sqs" or "ssm"
+        **kwargs: Arguments for boto3.client, ignored by the in-process clients
+
+    Returns:
+        A boto3 client, or an in-process client implementing the same calls
+
+    Raises:
+        ValueError: If the backend is unknown, or has no client for the service
+    """
+    backend = get_backend()
+    if backend == AWS_BACKEND:
+        return boto3.client(service, **kwargs)
+
+    if service not in IN_PROCESS_CLIENTS:
+        raise ValueError(f"No {backend} service backend for {service}")
+    logger.debug("Using %s service backend for %s", backend, service)
+    return IN_PROCESS_CLIENTS[service](get_store(backend))
@@ -0,0 +1,191 @@
+"""
+Module for splitting question backfills into date range shards.
+
+This module provides functions to split a date range into day or week shards and process
+them concurrently, and the ShardCheckpoint class which tracks completed shards so that
+progress is only recorded up to the end of the last contiguous completed shard. A rerun
+can then resume from the first incomplete shard.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from enum import Enum
+from typing import Callable, List, Optional
+
+from pydantic import BaseModel
+from aws_lambda_powertools import Logger, Metrics
+
+logger = Logger()
+metrics = Metrics()
+
+MAX_SHARD_WORKERS = 4
+
+
+class ShardSize(str, Enum):
+    """
+    Enum representing the size of the date range shards.
+
+    Values:
+        DAY: One shard per day
+        WEEK: One shard per seven days
+    """
+
+    DAY = "day"
+    WEEK = "week"
+
+
+SHARD_DAYS = {ShardSize.DAY: 1, ShardSize.WEEK: 7}
+
+
+class DateShard(BaseModel):
+    """Model representing one shard of a date range."""
+
+    index: int
+    start_date: date
+    end_date: date
+
+
+def split_date_range(
+    start_date: date, end_date: date, shard_size: ShardSize
+) -> List[DateShard]:
+    """
+    Split an inclusive date range into consecutive shards.
+
+    Args:
+        start_date (date): Start date of the range (inclusive)
+        end_date (date): End date of the range (inclusive)
+        shard_size (ShardSize): Size of each shard
+
+    Returns:
+        List[DateShard]: Shards covering the range in date order
+    """
+    days = SHARD_DAYS[ShardSize(shard_size)]
+    shards = []
+    shard_start = start_date
+
+    while shard_start <= end_date:
+        shard_end = min(shard_start + timedelta(days=days - 1), end_date)
+        shards.append(
+            DateShard(index=len(shards), start_date=shard_start, end_date=shard_end)
+        )
+        shard_start = shard_end + timedelta(days=1)
+
+    return shards
+
+
+class ShardCheckpoint:
+    """
+    Tracks completed shards and advances a watermark over contiguous completed shards.
+
+    Args:
+        shards (List[DateShard]): All shards of the range in date order
+        on_advance (Callable[[date], None]): Called with the new watermark each time it advances
+        completed_through (date, optional): Watermark from a previous run. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        shards: List[DateShard],
+        on_advance: Callable[[date], None],
+        completed_through: Optional[date] = None,
+    ):
+        self.shards = shards
+        self.on_advance = on_advance
+        self.completed_through = completed_through
+        self._completed = set()
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+        while (
+            completed_through is not None
+            and self._next_index < len(shards)
+            and shards[self._next_index].end_date <= completed_through
+        ):
+            self._next_index += 1
+
+    def pending_shards(self) -> List[DateShard]:
+        """
+        Get the shards which have not been completed.
+
+        Returns:
+            List[DateShard]: Shards from the first incomplete shard onwards
+        """
+        return self.shards[self._next_index :]
+
+    def complete(self, shard: DateShard):
+        """
+        Mark a shard as completed, advancing the watermark if it is now contiguous.
+
+        Args:
+            shard (DateShard): Completed shard
+        """
+        with self._lock:
+            self._completed.add(shard.index)
+            advanced = False
+
+            while self._next_index in self._completed:
+                self.completed_through = self.shards[self._next_index].end_date
+                self._next_index += 1
+                advanced = True
+
+            if advanced:
+                self.on_advance(self.completed_through)
+
+
+def run_shards(
+    checkpoint: ShardCheckpoint,
+    process: Callable[[DateShard], int],
+    max_workers: int = MAX_SHARD_WORKERS,
+) -> int:
+    """
+    Process the pending shards of a checkpoint concurrently.
+
+    Each shard is marked complete as soon as it has been processed. If a shard fails,
+    shards which have not started are cancelled and the error is raised once the
+    running shards have finished, leaving the watermark at the last contiguous shard.
+
+    Args:
+        checkpoint (ShardCheckpoint): Checkpoint holding the shards to process
+        process (Callable[[DateShard], int]): Processes a shard, returning a count of items
+        max_workers (int): Maximum number of shards processed at once
+
+    Returns:
+        int: Total count of items processed
+
+    Raises:
+        Exception: The first error raised while processing a shard
+    """
+    shards = checkpoint.pending_shards()
+    if not shards:
+        return 0
+
+    count = 0
+    error = None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as executor:
+        futures = {executor.submit(process, shard): shard for shard in shards}
+
+        for future in as_completed(futures):
+            shard = futures[future]
+            if future.cancelled():
+                continue
+            try:
+                count += future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Shard %s to %s failed: %s", shard.start_date, shard.end_date, e
+                )
+                if error is None:
+                    error = e
+                    for pending in futures:
+                        pending.cancel()
+                continue
+
+            checkpoint.complete(shard)
+            metrics.add_metric(name="BackfillShardComplete", unit="Count", value=1)
+
+    if error is not None:
+        raise error
+
+    return count
@@ -0,0 +1,264 @@
+"""
+Module providing response caches for the Parliament API clients.
+
+This module provides an in-memory LRU cache with a time to live, an optional disk cache
+for the Lambda /tmp directory, and a tiered cache combining the two. Cached responses keep
+their ETag and Last-Modified validators so stale entries can be revalidated with a
+conditional request instead of being downloaded again.
+"""
+
+import abc
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_CACHE_DIR = "/tmp/parliament-api-cache"  # nosec B108 - Lambda scratch space
+# Fraction of max_entries removed when the disk cache is pruned, so it is only scanned
+# about once every max_entries * DISK_PRUNE_FRACTION writes once full
+DISK_PRUNE_FRACTION = 0.1
+
+
+class CachedResponse(BaseModel):
+    """Model representing a cached JSON response."""
+
+    url: str
+    body: dict
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = Field(default_factory=time.time)
+
+    def conditional_headers(self) -> dict:
+        """Build the headers for revalidating the response.
+
+        Returns:
+            Dictionary of If-None-Match and If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def refreshed(self) -> "CachedResponse":
+        """Copy the response, marking it as fresh from now.
+
+        Returns:
+            CachedResponse instance
+        """
+        return self.model_copy(update={"stored_at": time.time()})
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response caches.
+
+    Args:
+        ttl (float): Number of seconds a response is fresh for
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+
+    @abc.abstractmethod
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Get a cached response, fresh or stale.
+
+        Args:
+            url (str): URL of the response
+
+        Returns:
+            CachedResponse: Cached response or None if not cached
+        """
+
+    @abc.abstractmethod
+    def set(self, response: CachedResponse):
+        """Store a response.
+
+        Args:
+            response (CachedResponse): Response to store
+        """
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """Check whether a cached response can be used without revalidation.
+
+        Args:
+            response (CachedResponse): Cached response
+
+        Returns:
+            Boolean indicating if the response is within its time to live
+        """
+        return time.time() - response.stored_at < self.ttl
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-memory least recently used response cache.
+
+    Args:
+        ttl (float): Number of seconds a response is fresh for
+        max_entries (int): Maximum number of responses to keep
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._entries.get(url)
+            if response is not None:
+                self._entries.move_to_end(url)
+            return response
+
+    def set(self, response: CachedResponse):
+        with self._lock:
+            self._entries[response.url] = response
+            self._entries.move_to_end(response.url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        """Get number of cached responses."""
+        return len(self._entries)
+
+
+class DiskResponseCache(ResponseCache):
+    """Response cache stored as JSON files in a directory, such as Lambda /tmp.
+
+    The directory is only scanned for old responses to remove once enough responses have
+    been written since the last scan to take it over max_entries. Responses written by
+    other processes sharing the directory are found at the next scan.
+
+    Args:
+        ttl (float): Number of seconds a response is fresh for
+        cache_dir (str): Directory to store the responses in
+        max_entries (int): Maximum number of responses to keep
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        super().__init__(ttl)
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._writes_until_prune = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                return CachedResponse.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read cached response: %s", e)
+            return None
+
+    def set(self, response: CachedResponse):
+        path = self._path(response.url)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(response.model_dump_json())
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write cached response: %s", e)
+            return
+
+        with self._lock:
+            self._writes_until_prune -= 1
+            if self._writes_until_prune <= 0:
+                self._writes_until_prune = self.max_entries - self._prune() + 1
+
+    def _prune(self) -> int:
+        """Remove the oldest responses when there are more than max_entries.
+
+        Responses are removed until DISK_PRUNE_FRACTION of max_entries is free.
+
+        Returns:
+            int: Number of responses left in the directory
+        """
+        try:
+            paths = [
+                entry.path
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(".json")
+            ]
+            if len(paths) <= self.max_entries:
+                return len(paths)
+            keep = self.max_entries - int(self.max_entries * DISK_PRUNE_FRACTION)
+            paths.sort(key=os.path.getmtime)
+            for path in paths[: len(paths) - keep]:
+                os.remove(path)
+            return keep
+        except OSError as e:
+            logger.warning("Failed to prune response cache: %s", e)
+            return self.max_entries
+
+
+class TieredResponseCache(ResponseCache):
+    """Response cache checking each tier in turn, such as memory then disk.
+
+    Responses found in a lower tier are copied into the tiers above it.
+
+    Args:
+        tiers (List[ResponseCache]): Caches in the order they are checked
+        ttl (float): Number of seconds a response is fresh for
+    """
+
+    def __init__(self, tiers: List[ResponseCache], ttl: float = DEFAULT_TTL):
+        super().__init__(ttl)
+        self.tiers = tiers
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        for index, tier in enumerate(self.tiers):
+            response = tier.get(url)
+            if response is not None:
+                for upper_tier in self.tiers[:index]:
+                    upper_tier.set(response)
+                return response
+        return None
+
+    def set(self, response: CachedResponse):
+        for tier in self.tiers:
+            tier.set(response)
+
+
+def default_response_cache() -> ResponseCache:
+    """Create the response cache configured by environment variables.
+
+    RESPONSE_CACHE_TTL sets the time to live in seconds (default 300) and
+    RESPONSE_CACHE_DIR enables a disk tier below the in-memory cache.
+
+    Returns:
+        ResponseCache: In-memory cache, or tiered memory and disk cache
+    """
+    ttl = float(os.getenv("RESPONSE_CACHE_TTL", str(DEFAULT_TTL)))
+    memory_cache = MemoryResponseCache(ttl=ttl)
+
+    cache_dir = os.getenv("RESPONSE_CACHE_DIR")
+    if not cache_dir:
+        return memory_cache
+
+    return TieredResponseCache(
+        [memory_cache, DiskResponseCache(ttl=ttl, cache_dir=cache_dir)], ttl=ttl
+    )
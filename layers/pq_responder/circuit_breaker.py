@@ -0,0 +1,259 @@
+"""
+Module providing circuit breakers for the external dependencies of the shared layer.
+
+A circuit breaker counts consecutive failures of a dependency. Once the failure threshold
+is reached the circuit opens and calls fail fast with CircuitOpenError instead of waiting
+on an unhealthy dependency. After the recovery timeout the circuit is half-open and a
+limited number of probe calls are let through: a successful probe closes the circuit and
+a failed probe opens it again. A probe which has not finished within the probe timeout is
+given up on, so a lost probe cannot hold the circuit half-open.
+
+Circuit breakers are kept in a module level registry, so their state persists across warm
+Lambda invocations. State transitions are logged and emitted as metrics.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable
+
+from aws_lambda_powertools import Logger, Metrics
+
+logger = Logger()
+metrics = Metrics()
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+DEFAULT_PROBE_TIMEOUT = 60
+
+
+class CircuitState(str, Enum):
+    """
+    Enum representing the state of a circuit breaker.
+
+    Values:
+        CLOSED: Calls are allowed
+        OPEN: Calls fail fast
+        HALF_OPEN: A limited number of probe calls are allowed
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised when a call is rejected because the circuit is open.
+
+    Args:
+        name (str): Name of the circuit breaker
+        retry_after (float): Seconds until the circuit will allow a probe call
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit {name} is open, retry after {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """
+    Circuit breaker for a single dependency.
+
+    Args:
+        name (str): Name of the dependency, used in metric names
+        failure_threshold (int): Consecutive failures that open the circuit
+        recovery_timeout (float): Seconds the circuit stays open before probing
+        half_open_max_calls (int): Number of concurrent probe calls when half-open
+        probe_timeout (float): Seconds after which a probe in flight no longer counts
+            against half_open_max_calls
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.probe_timeout = probe_timeout
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the recovery timeout has passed."""
+        with self._lock:
+            self._check_recovery()
+            return self._state
+
+    def _check_recovery(self):
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState):
+        previous = self._state
+        self._state = state
+        self._probes.clear()
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.CLOSED:
+            self._failures = 0
+
+        logger.warning("Circuit %s changed from %s to %s", self.name, previous.value, state.value)
+        metrics.add_metric(
+            name=f"{self.name}Circuit{state.name.title().replace('_', '')}",
+            unit="Count",
+            value=1,
+        )
+
+    def before_call(self):
+        """
+        Check that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            self._check_recovery()
+
+            if self._state == CircuitState.OPEN:
+                raise CircuitOpenError(
+                    self.name,
+                    self.recovery_timeout - (time.monotonic() - self._opened_at),
+                )
+
+            if self._state == CircuitState.HALF_OPEN:
+                now = time.monotonic()
+                while self._probes and now - self._probes[0] >= self.probe_timeout:
+                    self._probes.popleft()
+                    logger.warning("Circuit %s probe timed out", self.name)
+                if len(self._probes) >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, self._probes[0] + self.probe_timeout - now)
+                self._probes.append(now)
+
+    def record_success(self):
+        """
+        Record a successful call, closing the circuit if it was probing.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+            else:
+                self._failures = 0
+
+    def record_failure(self):
+        """
+        Record a failed call, opening the circuit at the threshold or if a probe failed.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED
+                and self._failures >= self.failure_threshold
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def call(
+        self,
+        func: Callable,
+        *args,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+        **kwargs,
+    ):
+        """
+        Call a function through the circuit breaker.
+
+        Args:
+            func (Callable): Function to call
+            *args: Positional arguments for the function
+            is_failure (Callable[[Exception], bool]): Whether an exception counts as a
+                dependency failure. Defaults to counting every exception.
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Result of the function
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: Any exception raised by the function
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+
+        self.record_success()
+        return result
+
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the module level circuit breaker for a dependency, creating it on first use.
+
+    The thresholds are read from the CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT and CIRCUIT_BREAKER_PROBE_TIMEOUT environment variables.
+
+    Args:
+        name (str): Name of the dependency
+
+    Returns:
+        CircuitBreaker: Circuit breaker shared by all callers of the dependency in the process
+    """
+    with _circuit_breakers_lock:
+        if name not in _circuit_breakers:
+            _circuit_breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=int(
+                    os.getenv(
+                        "CIRCUIT_BREAKER_FAILURE_THRESHOLD",
+                        str(DEFAULT_FAILURE_THRESHOLD),
+                    )
+                ),
+                recovery_timeout=float(
+                    os.getenv(
+                        "CIRCUIT_BREAKER_RECOVERY_TIMEOUT",
+                        str(DEFAULT_RECOVERY_TIMEOUT),
+                    )
+                ),
+                probe_timeout=float(
+                    os.getenv(
+                        "CIRCUIT_BREAKER_PROBE_TIMEOUT",
+                        str(DEFAULT_PROBE_TIMEOUT),
+                    )
+                ),
+            )
+        return _circuit_breakers[name]
+
+
+def reset_circuit_breakers():
+    """
+    Remove all circuit breakers, closing every circuit.
+    """
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
@@ -0,0 +1,325 @@
+"""
+Module providing a columnar, Arrow backed batch of parliamentary questions.
+
+QuestionsBatch holds questions as Arrow columns rather than a list of Question models,
+so bulk corpora can be sliced without copying, filtered by house and date tabled, and
+written to Parquet for analytics. Parquet datasets are partitioned with the same
+question_type/year/month/day layout as S3Storage.question_key, so Athena can prune
+partitions of the Parquet copy in the same way as the JSON objects.
+
+pyarrow is installed in the shared layer, and is only imported by functions using this
+module.
+"""
+
+import time
+import uuid
+from datetime import date
+from typing import Iterable, List, Optional, Union
+
+from aws_lambda_powertools import Logger
+
+from models import House, Question, QuestionRecord, Questions
+from decoding import decode_api_question_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+logger = Logger()
+
+QUESTION_TYPE = "written"
+PARTITION_COLUMNS = ["question_type", "year", "month", "day"]
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("pyarrow is required for columnar question batches")
+
+
+def question_schema() -> "pa.Schema":
+    """
+    Get the Arrow schema of a questions batch.
+
+    Returns:
+        pa.Schema: Schema with one column per Question field
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("question", pa.string(), nullable=False),
+            pa.field("answer", pa.string()),
+            pa.field("date_tabled", pa.date32(), nullable=False),
+            pa.field("house", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+        ]
+    )
+
+
+class QuestionsBatch:
+    """
+    Columnar batch of parliamentary questions backed by an Arrow table.
+
+    Args:
+        table (pa.Table): Table with the question_schema columns
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+
+    def __init__(self, table: "pa.Table"):
+        _require_pyarrow()
+        self.table = table
+
+    @classmethod
+    def from_questions(
+        cls, questions: Iterable[Union[Question, QuestionRecord]]
+    ) -> "QuestionsBatch":
+        """
+        Build a batch from questions or question records.
+
+        Args:
+            questions: Questions, Question models or QuestionRecords
+
+        Returns:
+            QuestionsBatch: Batch holding the questions in order
+        """
+        _require_pyarrow()
+        ids, texts, answers, dates, houses = [], [], [], [], []
+        for question in questions:
+            ids.append(question.id)
+            texts.append(question.question)
+            answers.append(question.answer)
+            dates.append(question.date_tabled)
+            houses.append(question.house.value)
+
+        schema = question_schema()
+        return cls(
+            pa.table(
+                [
+                    pa.array(ids, pa.int64()),
+                    pa.array(texts, pa.string()),
+                    pa.array(answers, pa.string()),
+                    pa.array(dates, pa.date32()),
+                    pa.array(houses, pa.string()).dictionary_encode().cast(
+                        schema.field("house").type
+                    ),
+                ],
+                schema=schema,
+            )
+        )
+
+    @classmethod
+    def from_api_results(cls, results: List[dict]) -> "QuestionsBatch":
+        """
+        Build a batch from a page of Parliament API question results.
+
+        Args:
+            results (List[dict]): API results, each containing a question under "value"
+
+        Returns:
+            QuestionsBatch: Batch holding the questions in order
+
+        Raises:
+            KeyError: If a required field is missing
+            pydantic.ValidationError: If a field is invalid
+        """
+        return cls.from_questions(decode_api_question_records(results))
+
+    @classmethod
+    def concat(cls, batches: Iterable["QuestionsBatch"]) -> "QuestionsBatch":
+        """
+        Concatenate batches without copying their columns.
+
+        Args:
+            batches: Batches to concatenate in order
+
+        Returns:
+            QuestionsBatch: Batch holding every question of the batches
+        """
+        _require_pyarrow()
+        tables = [batch.table for batch in batches]
+        if not tables:
+            return cls(question_schema().empty_table())
+        return cls(pa.concat_tables(tables, promote_options="permissive"))
+
+    def __len__(self) -> int:
+        """Get number of questions in the batch."""
+        return self.table.num_rows
+
+    def slice(self, offset: int = 0, length: Optional[int] = None) -> "QuestionsBatch":
+        """
+        Get a zero-copy slice of the batch.
+
+        Args:
+            offset (int): Index of the first question in the slice. Defaults to 0.
+            length (int, optional): Number of questions in the slice. Defaults to the rest.
+
+        Returns:
+            QuestionsBatch: Batch sharing this batch's memory
+        """
+        return QuestionsBatch(self.table.slice(offset, length))
+
+    def filter(
+        self,
+        house: Optional[House] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> "QuestionsBatch":
+        """
+        Get the questions from a house and/or tabled within a date range.
+
+        Args:
+            house (House, optional): House the questions were tabled in
+            start_date (date, optional): Earliest date tabled (inclusive)
+            end_date (date, optional): Latest date tabled (inclusive)
+
+        Returns:
+            QuestionsBatch: Batch of the matching questions, in order
+        """
+        mask = None
+        conditions = []
+        if house is not None:
+            conditions.append(
+                pc.equal(self.table["house"].cast(pa.string()), House(house).value)
+            )
+        if start_date is not None:
+            conditions.append(pc.greater_equal(self.table["date_tabled"], start_date))
+        if end_date is not None:
+            conditions.append(pc.less_equal(self.table["date_tabled"], end_date))
+
+        for condition in conditions:
+            mask = condition if mask is None else pc.and_(mask, condition)
+
+        if mask is None:
+            return self
+        return QuestionsBatch(self.table.filter(mask))
+
+    def to_records(self) -> List[QuestionRecord]:
+        """
+        Convert the batch to question records.
+
+        Returns:
+            List[QuestionRecord]: Question records in order
+        """
+        houses = {house.value: house for house in House}
+        return [
+            QuestionRecord(
+                row["id"],
+                row["question"],
+                row["answer"],
+                row["date_tabled"],
+                houses[row["house"]],
+            )
+            for row in self.table.to_pylist()
+        ]
+
+    def to_questions(self) -> Questions:
+        """
+        Convert the batch to a Questions collection.
+
+        Returns:
+            Questions: Questions in order
+        """
+        return Questions.from_records(self.to_records())
+
+    def to_dict_list(self) -> List[dict]:
+        """
+        Convert the batch to the same dictionaries as Questions.to_dict_list.
+
+        Returns:
+            List[dict]: Dictionary representation of each question
+        """
+        return [record.to_dict() for record in self.to_records()]
+
+    def partitioned_table(self) -> "pa.Table":
+        """
+        Add the question_type, year, month and day partition columns to the table.
+
+        The values are zero padded strings, matching the keys of S3Storage.question_key.
+
+        Returns:
+            pa.Table: Table with the partition columns appended
+        """
+        tabled = self.table["date_tabled"].cast(pa.timestamp("s"))
+        return (
+            self.table.append_column(
+                "question_type",
+                pa.array([QUESTION_TYPE] * self.table.num_rows, pa.string()),
+            )
+            .append_column("year", pc.strftime(tabled, format="%Y"))
+            .append_column("month", pc.strftime(tabled, format="%m"))
+            .append_column("day", pc.strftime(tabled, format="%d"))
+        )
+
+    def write_parquet(
+        self, base_dir: str, filesystem: Optional["pa.fs.FileSystem"] = None
+    ) -> None:
+        """
+        Write the batch as a Parquet dataset partitioned like the questions bucket.
+
+        Files are written to
+        base_dir/question_type=written/year=YYYY/month=MM/day=DD/part-<time>-<id>-N.parquet.
+        Each write adds new files named in write order and never deletes existing files,
+        so a partial batch leaves the rest of its partitions in place. A question written
+        more than once is read back by read_parquet as its most recently written version.
+
+        Args:
+            base_dir (str): Root of the dataset, e.g. "bucket/prefix" for S3
+            filesystem (pa.fs.FileSystem, optional): Filesystem to write to, e.g.
+                pyarrow.fs.S3FileSystem. Defaults to inferring it from base_dir.
+        """
+        if self.table.num_rows == 0:
+            return
+
+        pq.write_to_dataset(
+            self.partitioned_table(),
+            root_path=base_dir,
+            partition_cols=PARTITION_COLUMNS,
+            filesystem=filesystem,
+            basename_template=f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        logger.info("Wrote %s questions as Parquet to %s", len(self), base_dir)
+
+
+def read_parquet(
+    base_dir: str, filesystem: Optional["pa.fs.FileSystem"] = None
+) -> QuestionsBatch:
+    """
+    Read a Parquet dataset written by QuestionsBatch.write_parquet.
+
+    Files are read in write order and only the most recently written version of each
+    question is kept.
+
+    Args:
+        base_dir (str): Root of the dataset
+        filesystem (pa.fs.FileSystem, optional): Filesystem to read from
+
+    Returns:
+        QuestionsBatch: Batch of every question in the dataset
+    """
+    _require_pyarrow()
+    schema = question_schema()
+    dataset = ds.dataset(
+        base_dir, filesystem=filesystem, format="parquet", partitioning="hive"
+    )
+    fragments = sorted(dataset.get_fragments(), key=lambda fragment: fragment.path)
+    if not fragments:
+        return QuestionsBatch(schema.empty_table())
+
+    table = pa.concat_tables(
+        fragment.to_table(columns=schema.names).cast(schema) for fragment in fragments
+    )
+    latest = (
+        pa.table({"id": table["id"], "row": pa.array(range(table.num_rows), pa.int64())})
+        .group_by("id")
+        .aggregate([("row", "max")])["row_max"]
+    )
+    return QuestionsBatch(table.take(pc.take(latest, pc.sort_indices(latest))))
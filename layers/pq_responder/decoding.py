@@ -0,0 +1,376 @@
+"""
+Module providing decoding of Parliament API responses.
+
+Written question results are decoded to Question models or QuestionRecords, taking a
+fast path without pydantic validation for well formed results. Committee publications
+are decoded to Publication models with their documents and files.
+
+The publications API returns each file as a base64 string field of a JSON document.
+Base64FieldDecoder finds the field while the document is still being received and decodes
+it chunk by chunk, so files can be streamed to S3 without holding them in memory.
+"""
+
+import re
+from base64 import b64decode
+from datetime import date
+from typing import Iterator, List, Optional
+
+from dateutil import parser
+from aws_lambda_powertools import Metrics
+
+from models import (
+    House,
+    Publication,
+    PublicationDocument,
+    PublicationFile,
+    Question,
+    QuestionRecord,
+)
+
+metrics = Metrics()
+
+API_HOUSES = {"Commons": House.COMMONS, "Lords": House.LORDS}
+
+BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+
+
+# pylint: disable=too-few-public-methods
+class _FieldScanner:
+    """
+    Scans a JSON document chunk by chunk for the string value of one top level field.
+
+    Args:
+        field (bytes): Name of the field
+    """
+
+    def __init__(self, field: bytes):
+        self.field = field
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._token = bytearray()
+        self._key = None
+        self._awaiting_value = False
+
+    def find_value(self, chunk: bytes) -> int:
+        """
+        Scan the next chunk of the document for the start of the field's value.
+
+        Args:
+            chunk (bytes): Next chunk of the document
+
+        Returns:
+            int: Index in the chunk just after the value's opening quote, or -1 if the
+                value does not start in this chunk
+
+        Raises:
+            ValueError: If the field is not a string
+        """
+        for index, char in enumerate(chunk):
+            if self._in_string:
+                self._scan_string(char)
+            elif self._awaiting_value and self._key == self.field and char not in b" \t\r\n":
+                if char != 0x22:  # quote
+                    raise ValueError(f"{self.field.decode()} field is not a string")
+                return index + 1
+            else:
+                self._scan_structure(char)
+
+        return -1
+
+    def _scan_string(self, char: int):
+        if self._escape:
+            self._escape = False
+        elif char == 0x5C:  # backslash
+            self._escape = True
+            return
+        elif char == 0x22:  # quote
+            self._in_string = False
+            if self._depth == 1 and not self._awaiting_value:
+                self._key = bytes(self._token)
+            return
+        if len(self._token) <= len(self.field):
+            self._token.append(char)
+
+    def _scan_structure(self, char: int):
+        if char == 0x22:  # quote
+            self._in_string = True
+            self._token.clear()
+        elif char in b"{[":
+            self._depth += 1
+        elif char in b"}]":
+            self._depth -= 1
+        elif char == 0x3A and self._depth == 1:  # colon
+            self._awaiting_value = True
+        elif char == 0x2C and self._depth == 1:  # comma
+            self._awaiting_value = False
+            self._key = None
+
+
+class Base64FieldDecoder:
+    """
+    Incrementally extracts and base64 decodes one string field of a JSON object.
+
+    Chunks of the JSON document are passed to feed() as they are received, and the
+    decoded bytes of the field are returned as soon as they are available, so neither
+    the document nor the decoded file needs to be held in memory at once.
+    """
+
+    _NOT_BASE64 = bytes(c for c in range(256) if c not in BASE64_ALPHABET)
+    _JSON_ESCAPE = re.compile(rb"\\(.)", re.DOTALL)
+
+    def __init__(self, field: str = "data"):
+        """
+        Initialize the decoder.
+
+        Args:
+            field (str): Name of the top level field containing the base64 data
+        """
+        self.field = field.encode("utf-8")
+        self.found = False
+        self.complete = False
+        self._scanner = _FieldScanner(self.field)
+        self._encoded = b""
+        self._escape_tail = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Process the next chunk of the JSON document.
+
+        Args:
+            chunk (bytes): Next chunk of the document
+
+        Returns:
+            bytes: Decoded bytes of the field available so far
+
+        Raises:
+            ValueError: If the field is not a string
+        """
+        if self.complete:
+            return b""
+        if not self.found:
+            start = self._scanner.find_value(chunk)
+            if start == -1:
+                return b""
+            self.found = True
+            chunk = chunk[start:]
+
+        return self._feed_value(chunk)
+
+    def _feed_value(self, chunk: bytes) -> bytes:
+        """
+        Decode the next part of the field's string value.
+
+        Args:
+            chunk (bytes): Next chunk of the document, starting inside the value
+
+        Returns:
+            bytes: Decoded bytes available so far
+        """
+        end = chunk.find(b'"')
+        if end != -1:
+            self.complete = True
+            chunk = chunk[:end]
+
+        chunk = self._escape_tail + chunk
+        self._escape_tail = b""
+        if chunk.endswith(b"\\") and not self.complete:
+            chunk, self._escape_tail = chunk[:-1], chunk[-1:]
+
+        # JSON may escape "/" as "\/" and line breaks as "\n", which are not data
+        chunk = self._JSON_ESCAPE.sub(
+            lambda match: b"/" if match.group(1) == b"/" else b"", chunk
+        )
+        encoded = self._encoded + chunk.translate(None, self._NOT_BASE64)
+        usable = len(encoded) if self.complete else len(encoded) - len(encoded) % 4
+        self._encoded = encoded[usable:]
+
+        return b64decode(encoded[:usable])
+
+    def close(self):
+        """
+        Finish decoding, checking the field was found and complete.
+
+        Raises:
+            KeyError: If the field was not found in the document
+            ValueError: If the document ended inside the field
+        """
+        if not self.found:
+            raise KeyError(self.field.decode())
+        if not self.complete:
+            raise ValueError(f"{self.field.decode()} field is incomplete")
+
+
+def _validate_api_question(value: dict) -> Question:
+    """
+    Build a question from an API result with full parsing and validation.
+
+    Args:
+        value (dict): Value of a single API question result
+
+    Returns:
+        Question: Validated question
+
+    Raises:
+        KeyError: If a required field is missing
+        pydantic.ValidationError: If a field is invalid
+    """
+    return Question(
+        id=value["id"],
+        house=House(value["house"].lower()),
+        date_tabled=parser.parse(value["dateTabled"][:10]),
+        question=value["questionText"],
+        answer=value["answerText"],
+    )
+
+
+def _fast_api_question_fields(value: dict) -> Optional[tuple]:
+    """
+    Extract the fields of a well formed API question without validation.
+
+    Args:
+        value (dict): Value of a single API question result
+
+    Returns:
+        tuple: ID, question text, answer text, date tabled and house, or None if the
+               result is not well formed and needs full validation
+    """
+    try:
+        question_id = value["id"]
+        question_text = value["questionText"]
+        answer_text = value["answerText"]
+        if (
+            isinstance(question_id, int)
+            and not isinstance(question_id, bool)
+            and isinstance(question_text, str)
+            and (answer_text is None or isinstance(answer_text, str))
+        ):
+            return (
+                question_id,
+                question_text,
+                answer_text,
+                date.fromisoformat(value["dateTabled"][:10]),
+                API_HOUSES[value["house"]],
+            )
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    metrics.add_metric(name="QuestionDecodeFallback", unit="Count", value=1)
+    return None
+
+
+def decode_api_question(api_question: dict) -> Question:
+    """
+    Build a question from a single API result.
+
+    Well formed results, with an integer ID, string texts, a known house and an ISO
+    dateTabled, are built with Question.model_construct, skipping pydantic validation
+    and dateutil parsing. Any other result falls back to full validation, so invalid
+    data raises the same errors as before.
+
+    Args:
+        api_question (dict): API result containing the question under "value"
+
+    Returns:
+        Question: Question built from the result
+
+    Raises:
+        KeyError: If a required field is missing
+        pydantic.ValidationError: If a field is invalid
+    """
+    value = api_question["value"]
+    fields = _fast_api_question_fields(value)
+    if fields is None:
+        return _validate_api_question(value)
+
+    question_id, question_text, answer_text, date_tabled, house = fields
+    return Question.model_construct(
+        id=question_id,
+        question=question_text,
+        answer=answer_text,
+        date_tabled=date_tabled,
+        house=house,
+    )
+
+
+def decode_api_question_record(api_question: dict) -> QuestionRecord:
+    """
+    Build a question record from a single API result.
+
+    Uses the same fast path and fallback as decode_api_question.
+
+    Args:
+        api_question (dict): API result containing the question under "value"
+
+    Returns:
+        QuestionRecord: Question record built from the result
+
+    Raises:
+        KeyError: If a required field is missing
+        pydantic.ValidationError: If a field is invalid
+    """
+    value = api_question["value"]
+    fields = _fast_api_question_fields(value)
+    if fields is None:
+        return QuestionRecord.from_question(_validate_api_question(value))
+    return QuestionRecord(*fields)
+
+
+def decode_api_questions(results: List[dict]) -> Iterator[Question]:
+    """
+    Build questions from a page of API results.
+
+    Args:
+        results (List[dict]): API results, each containing a question under "value"
+
+    Yields:
+        Question: Question for each result, in order
+    """
+    for api_question in results:
+        yield decode_api_question(api_question)
+
+
+def decode_api_question_records(results: List[dict]) -> List[QuestionRecord]:
+    """
+    Build question records from a page of API results.
+
+    Args:
+        results (List[dict]): API results, each containing a question under "value"
+
+    Returns:
+        List[QuestionRecord]: Question record for each result, in order
+    """
+    return [decode_api_question_record(api_question) for api_question in results]
+
+
+def decode_api_publication(api_publication: dict) -> Publication:
+    """
+    Build a publication, with its documents and files, from a single API result.
+
+    Args:
+        api_publication (dict): Item from a page of committee publications
+
+    Returns:
+        Publication: Publication built from the result
+
+    Raises:
+        KeyError: If a required field is missing
+    """
+    publication = Publication(
+        id=api_publication["id"],
+        description=api_publication["description"],
+        committee_id=api_publication["committee"]["id"],
+    )
+
+    for api_document in api_publication["documents"]:
+        document = PublicationDocument(id=api_document["documentId"])
+        for api_file in api_document["files"]:
+            document.append(
+                PublicationFile(
+                    filename=api_file["fileName"],
+                    data_format=api_file.get("fileDataFormat") or "OriginalFormat",
+                )
+            )
+        publication.append(document)
+
+    return publication
@@ -4,13 +4,16 @@ It includes classes for managing publications, documents, and parliamentary ques
 from both the House of Commons and House of Lords.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import date
 from enum import Enum
 from dateutil import parser
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, PrivateAttr, ValidationError, computed_field
 from aws_lambda_powertools import Logger
 
+from serialization import loads, model_from_json, model_to_json
+
 logging = Logger()
 
 
@@ -23,18 +26,22 @@ class House(Enum):
 class PublicationFile(BaseModel):
     """Model representing a publication file."""
     filename: str
+    data_format: str = "OriginalFormat"
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "PublicationFile":
         """Create a PublicationFile instance from a dictionary.
         
         Args:
-            data: Dictionary containing filename
+            data: Dictionary containing filename and optionally data_format
             
         Returns:
             PublicationFile instance
         """
-        return cls(filename=data["filename"])
+        return cls(
+            filename=data["filename"],
+            data_format=data.get("data_format", "OriginalFormat"),
+        )
 
 
 class PublicationDocument(BaseModel):
@@ -63,6 +70,17 @@ class PublicationDocument(BaseModel):
         """
         return f"publications/{self.publication_id}/documents/{self.id}/default"
 
+    def file_api_uri_path(self, file: PublicationFile) -> str:
+        """Generate API URI path for one of the document's files.
+
+        Args:
+            file: PublicationFile of the document
+
+        Returns:
+            String containing the API URI path for the file's data format
+        """
+        return f"Publications/{self.publication_id}/Document/{self.id}/{file.data_format}"
+
     def append(self, file: PublicationFile):
         """Add a file to the document.
         
@@ -101,6 +119,16 @@ class Publication(BaseModel):
         document.publication_id = self.id
         self.documents.append(document)
 
+    def iter_files(self) -> Iterator[Tuple[PublicationDocument, PublicationFile]]:
+        """Iterate over every file of every document in the publication.
+
+        Yields:
+            Tuple of the document and one of its files
+        """
+        for document in self.documents:
+            for file in document.files:
+                yield document, file
+
     @classmethod
     def from_dict(cls, data: Dict[str, any]) -> "Publication":
         """Create a Publication instance from a dictionary.
@@ -121,6 +149,35 @@ class Publication(BaseModel):
             documents=documents,
         )
 
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Publication":
+        """Create a Publication instance from a JSON document.
+
+        Documents produced by to_json are parsed and validated in a single pass,
+        anything else falls back to from_dict.
+
+        Args:
+            data: JSON document containing publication data
+
+        Returns:
+            Publication instance
+
+        Raises:
+            json.JSONDecodeError: If the document is invalid JSON
+        """
+        try:
+            return model_from_json(cls, data)
+        except ValidationError:
+            return cls.from_dict(loads(data))
+
+    def to_json(self) -> bytes:
+        """Convert publication to JSON, identical to model_dump_json.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return model_to_json(self)
+
 
 class Publications(BaseModel):
     """Collection of parliamentary publications."""
@@ -205,6 +262,53 @@ class Question(BaseModel):
             house=House(data["house"]),
         )
 
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Question":
+        """Create a Question instance from a JSON document.
+
+        Documents produced by to_json are parsed and validated in a single pass,
+        anything else falls back to from_dict.
+
+        Args:
+            data: JSON document containing question data
+
+        Returns:
+            Question instance
+
+        Raises:
+            json.JSONDecodeError: If the document is invalid JSON
+        """
+        try:
+            return model_from_json(cls, data)
+        except ValidationError:
+            return cls.from_value(loads(data))
+
+    @classmethod
+    def from_value(cls, value: Dict[str, any]) -> "Question":
+        """Create a Question instance from a parsed JSON document.
+
+        Values produced by to_json are validated in a single pass, anything else
+        falls back to from_dict.
+
+        Args:
+            value: Parsed JSON document containing question data
+
+        Returns:
+            Question instance
+        """
+        try:
+            return cls.model_validate(value)
+        except ValidationError:
+            return cls.from_dict({**value, "house": str(value["house"]).lower()})
+
+    def to_json(self) -> bytes:
+        """Convert question to JSON, identical to model_dump_json.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return model_to_json(self)
+
     def to_dict(self) -> Dict[str, str]:
         """Convert question to dictionary format.
         
@@ -220,6 +324,87 @@ class Question(BaseModel):
         }
 
 
+@dataclass(slots=True)
+class QuestionRecord:
+    """Lightweight slotted record of a parliamentary question for bulk processing.
+
+    Records have no validation and no per-instance dict, so large batches take far
+    less time and memory to build than Question models. Convert to Question at the
+    edges where validation or serialization is needed.
+    """
+    id: int
+    question: str
+    answer: Optional[str]
+    date_tabled: date
+    house: House
+
+    @property
+    def complete_question(self) -> bool:
+        """Check if the question text is complete.
+
+        Returns:
+            Boolean indicating if question is complete
+        """
+        return not self.question.endswith("...")
+
+    @property
+    def complete_answer(self) -> bool:
+        """Check if the answer text is complete.
+
+        Returns:
+            Boolean indicating if answer is complete
+        """
+        if self.answer is None:
+            return True
+        return not self.answer.endswith("...")
+
+    @classmethod
+    def from_question(cls, question: Question) -> "QuestionRecord":
+        """Create a record from a Question model.
+
+        Args:
+            question: Question to convert
+
+        Returns:
+            QuestionRecord instance
+        """
+        return cls(
+            question.id,
+            question.question,
+            question.answer,
+            question.date_tabled,
+            question.house,
+        )
+
+    def to_question(self) -> Question:
+        """Convert the record to a Question model without revalidating it.
+
+        Returns:
+            Question instance
+        """
+        return Question.model_construct(
+            id=self.id,
+            question=self.question,
+            answer=self.answer,
+            date_tabled=self.date_tabled,
+            house=self.house,
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert record to the same dictionary format as Question.to_dict.
+
+        Returns:
+            Dictionary representation of the question
+        """
+        return {
+            "id": self.id,
+            "question": self.question,
+            "answer": self.answer,
+            "date_tabled": self.date_tabled.isoformat(),
+            "house": self.house.value,
+        }
+
+
 class Questions(BaseModel):
     """Collection of parliamentary questions."""
 
@@ -254,6 +439,26 @@ class Questions(BaseModel):
         questions = [Question.from_dict(q) for q in data]
         return cls(questions=questions)
 
+    @classmethod
+    def from_records(cls, records: Iterable[QuestionRecord]) -> "Questions":
+        """Create a Questions instance from question records without revalidating them.
+
+        Args:
+            records: Question records
+
+        Returns:
+            Questions instance
+        """
+        return cls.model_construct(questions=[record.to_question() for record in records])
+
+    def to_records(self) -> List[QuestionRecord]:
+        """Convert questions collection to question records.
+
+        Returns:
+            List of question records
+        """
+        return [QuestionRecord.from_question(q) for q in self.questions]
+
     def to_dict_list(self) -> List[Dict[str, str]]:
         """Convert questions collection to list of dictionaries.
         
@@ -261,3 +466,103 @@ class Questions(BaseModel):
             List of dictionary representations of questions
         """
         return [q.to_dict() for q in self.questions]
+
+
+def _completeness(question: Question) -> int:
+    """Score how complete a question is, from 0 (both texts truncated) to 2."""
+    return int(question.complete_question) + int(question.complete_answer)
+
+
+class IndexedQuestions(Questions):
+    """Collection of parliamentary questions indexed by ID.
+
+    Questions are deduplicated on insert, keeping the most complete version of each
+    question in the position it was first added, so merging overlapping results
+    needs no scans. Questions should only be added through add, union or update so
+    the index stays in step with the list.
+    """
+
+    _index: Dict[int, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Index and deduplicate the questions the collection was created with."""
+        questions = self.questions
+        self.questions = []
+        self._index = {}
+        self.update(questions)
+
+    def __contains__(self, question_id: object) -> bool:
+        """Check if a question ID, or the ID of a question, is in the collection."""
+        if isinstance(question_id, (Question, QuestionRecord)):
+            question_id = question_id.id
+        return question_id in self._index
+
+    def get(self, question_id: int) -> Optional[Question]:
+        """Get a question by ID.
+
+        Args:
+            question_id: ID of the question
+
+        Returns:
+            Question, or None if the ID is not in the collection
+        """
+        position = self._index.get(question_id)
+        return None if position is None else self.questions[position]
+
+    def add(self, question: Question):
+        """Add a question, replacing an existing version only if it is more complete.
+
+        Args:
+            question: Question to add
+        """
+        position = self._index.get(question.id)
+        if position is None:
+            self._index[question.id] = len(self.questions)
+            self.questions.append(question)
+        elif _completeness(question) > _completeness(self.questions[position]):
+            self.questions[position] = question
+
+    def update(self, questions: Iterable[Question]):
+        """Add each of a number of questions.
+
+        Args:
+            questions: Questions to add
+        """
+        for question in questions:
+            self.add(question)
+
+    def union(self, other: Iterable[Question]) -> "IndexedQuestions":
+        """Create a collection of the questions in either collection.
+
+        Args:
+            other: Questions to merge after this collection's questions
+
+        Returns:
+            IndexedQuestions instance
+        """
+        merged = IndexedQuestions(questions=self.questions)
+        merged.update(other)
+        return merged
+
+    def difference(self, other: Iterable[Question]) -> "IndexedQuestions":
+        """Create a collection of the questions whose IDs are not in another collection.
+
+        Args:
+            other: Questions to exclude
+
+        Returns:
+            IndexedQuestions instance
+        """
+        if isinstance(other, IndexedQuestions):
+            excluded = other._index  # pylint: disable=protected-access
+        else:
+            excluded = {question.id for question in other}
+        return IndexedQuestions(
+            questions=[q for q in self.questions if q.id not in excluded]
+        )
+
+    def __or__(self, other: Iterable[Question]) -> "IndexedQuestions":
+        return self.union(other)
+
+    def __sub__(self, other: Iterable[Question]) -> "IndexedQuestions":
+        return self.difference(other)
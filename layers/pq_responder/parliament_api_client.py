@@ -2,31 +2,44 @@
 This module provides API clients for interacting with the Parliament API services.
 It includes clients for accessing committee information, publications, and questions.
 Each client handles request retries and data validation.
+
+All clients share a single pooled HTTP transport (see transport), created on first use
+and reused across warm Lambda invocations. Requests are paced by a rate limiter per
+endpoint family (see rate_limiting), which backs off when the API responds with 429 or
+503, and fail fast through a circuit breaker while an API is unhealthy.
 """
 
 from datetime import date, time, datetime
-from base64 import b64decode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple
 from urllib.parse import urlparse
 from enum import Enum
-from dateutil import parser
-from urllib3.util import Retry
-
 
 import requests
-import requests.adapters
 import requests.exceptions
 import validators
 
 from aws_lambda_powertools import Logger, Tracer, Metrics
 
+from caching import CachedResponse, ResponseCache
+from circuit_breaker import get_circuit_breaker
+from decoding import (
+    Base64FieldDecoder,
+    decode_api_publication,
+    decode_api_question,
+    decode_api_question_records,
+    decode_api_questions,
+)
+from rate_limiting import get_rate_limiter, parse_retry_after
+from transport import get_transport
 from models import (
     Publications,
-    Publication,
     PublicationDocument,
     PublicationFile,
     Question,
+    QuestionRecord,
     Questions,
-    House,
 )
 
 logger = Logger()
@@ -34,6 +47,15 @@ tracer = Tracer()
 metrics = Metrics()
 
 TAKE = 1000
+MAX_PAGE_WORKERS = 8
+MAX_HYDRATION_WORKERS = 8
+MAX_COMMITTEE_WORKERS = 4
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+THROTTLE_STATUS_CODES = (429, 503)
+CIRCUIT_FAILURE_STATUS_CODES = (500, 502, 503, 504)
+MAX_THROTTLE_RETRIES = 5
 
 
 def validate_base_uri(base_uri):
@@ -97,16 +119,79 @@ def validate_start_end_dates(start_date_tabled: date, end_date_tabled: date):
         raise ValueError("start_date_tabled and end_date_tabled must be in the past")
 
 
+class DateType(str, Enum):
+    """
+    Enum representing the type of date to filter questions by.
+
+    Values:
+        TABLED: Filter by the date the question was tabled
+        ANSWERED: Filter by the date the question was answered
+    """
+
+    TABLED = "tabled"
+    ANSWERED = "answered"
+
+
+def publications_url(
+    base_uri: str, committee_id: int, start_date: date, end_date: date, skip: int
+) -> str:
+    """
+    Build the URL for a single page of a committee's publications.
+
+    Args:
+        base_uri (str): Base URI for the API
+        committee_id (int): ID of the committee
+        start_date (date): Start date for publication search
+        end_date (date): End date for publication search
+        skip (int): Offset of the first result in the page
+
+    Returns:
+        str: URL for the page
+    """
+    start_date_iso = datetime.combine(start_date, time(0, 0, 0)).isoformat()
+    end_date_iso = datetime.combine(end_date, time(0, 0, 0)).isoformat()
+    return f"{base_uri}publications/?CommitteeId={committee_id}&StartDate={start_date_iso}&EndDate={end_date_iso}&skip={skip}&take={TAKE}"  # pylint: disable=line-too-long
+
+
+def questions_url(
+    base_uri: str, date_type: DateType, start_date: date, end_date: date, skip: int
+) -> str:
+    """
+    Build the URL for a single page of questions.
+
+    Args:
+        base_uri (str): Base URI for the API
+        date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+        start_date (date): Start date for question search
+        end_date (date): End date for question search
+        skip (int): Offset of the first result in the page
+
+    Returns:
+        str: URL for the page
+
+    Raises:
+        ValueError: If date_type is invalid
+    """
+    if date_type == DateType.TABLED:
+        return f"{base_uri}questions?tabledWhenFrom={start_date}&tabledWhenTo={end_date}&skip={skip}&take={TAKE}"
+    if date_type == DateType.ANSWERED:
+        return f"{base_uri}questions?answeredWhenFrom={start_date}&answeredWhenTo={end_date}&skip={skip}&take={TAKE}"
+    raise ValueError(f"Invalid date_type: {date_type}")
+
+
 # pylint: disable=too-few-public-methods
-class ParliamentCommitteesAPIClient:
-    """Client for accessing Parliament Committee API endpoints."""
+class ParliamentAPIClient:
+    """Base class for the Parliament API clients."""
 
-    def __init__(self, base_uri: str):
+    rate_limit_family = None
+
+    def __init__(self, base_uri: str, cache: ResponseCache = None):
         """
-        Initialize the client with base URI and configure session.
+        Initialize the client with base URI and the shared transport.
 
         Args:
             base_uri (str): Base URI for the API
+            cache (ResponseCache, optional): Cache for lookups by ID. Defaults to None.
 
         Raises:
             ValueError: If base_uri is invalid
@@ -119,124 +204,254 @@ class ParliamentCommitteesAPIClient:
             raise e
 
         self.base_uri = base_uri
-        self.session = requests.Session()
-
-        retries = Retry(total=3, backoff_factor=0.4)
-
-        self.session.mount(
-            "base_uri", requests.adapters.HTTPAdapter(max_retries=retries)
+        self.cache = cache
+        self.transport = get_transport()
+        self.transport.mount(base_uri)
+        self.session = self.transport.session
+        self.rate_limiter = (
+            get_rate_limiter(self.rate_limit_family) if self.rate_limit_family else None
+        )
+        self.circuit_breaker = get_circuit_breaker(
+            f"ParliamentAPI{(self.rate_limit_family or '').title()}"
         )
 
-    def get_sub_committees(self, parent_committee_id: int) -> list:
+    def _get(self, url: str, **kwargs) -> requests.Response:
         """
-        Get list of sub-committees for a parent committee.
+        Send a GET request through the client's circuit breaker.
+
+        Connection errors, timeouts and 5xx responses count as failures of the API.
+        While the circuit is open requests fail fast without being sent.
 
         Args:
-            parent_committee_id (int): ID of the parent committee
+            url (str): URL to retrieve
+            **kwargs: Additional arguments passed to the transport
 
         Returns:
-            list: List of sub-committee dictionaries with id and name
-        """
-        url = f"{self.base_uri}committees/{parent_committee_id}"
+            requests.Response: Response from the API
 
+        Raises:
+            CircuitOpenError: If the circuit for the API is open
+        """
+        self.circuit_breaker.before_call()
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            committee_json = response.json()
+            response = self._get_rate_limited(url, **kwargs)
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
 
-            sub_committees = [
-                {"id": sub_committee["id"], "name": sub_committee["name"]}
-                for sub_committee in committee_json["subCommittees"]
-            ]
+        if response.status_code in CIRCUIT_FAILURE_STATUS_CODES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
 
-            return sub_committees
-        finally:
-            response.close()
+    def _get_rate_limited(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request paced by the client's rate limiter.
 
+        Throttling responses (429 and 503) slow the limiter down and are retried
+        after any Retry-After delay, up to MAX_THROTTLE_RETRIES times.
 
-class ParliamentPublicationsAPIClient:
-    """Client for accessing Parliament Publications API endpoints."""
+        Args:
+            url (str): URL to retrieve
+            **kwargs: Additional arguments passed to the transport
+
+        Returns:
+            requests.Response: Response from the API
+        """
+        if self.rate_limiter is None:
+            return self.transport.get(url, **kwargs)
+
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.transport.get(url, **kwargs)
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                self.rate_limiter.on_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning(
+                "Throttled by API with status %s, retry after %s",
+                response.status_code,
+                retry_after,
+            )
+            self.rate_limiter.on_throttle(retry_after)
+            if attempt < MAX_THROTTLE_RETRIES:
+                response.close()
 
-    def __init__(self, base_uri: str):
+        return response
+
+    def _get_cached_json(self, url: str) -> dict:
         """
-        Initialize the client with base URI and configure session.
+        Get a JSON response, using the response cache if the client has one.
+
+        Fresh cached responses are returned without a request. Stale responses with an
+        ETag or Last-Modified validator are revalidated with a conditional request.
 
         Args:
-            base_uri (str): Base URI for the API
+            url (str): URL to retrieve
+
+        Returns:
+            dict: Decoded JSON response
 
         Raises:
-            ValueError: If base_uri is invalid
+            requests.exceptions.HTTPError: If HTTP error occurs
         """
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached and self.cache.is_fresh(cached):
+            metrics.add_metric(name="APICacheHit", unit="Count", value=1)
+            return cached.body
+
+        headers = cached.conditional_headers() if cached else {}
+        response = (
+            self._get(url, headers=headers) if headers else self._get(url)
+        )
         try:
-            validate_base_uri(base_uri)
+            if cached and response.status_code == 304:
+                metrics.add_metric(name="APICacheRevalidated", unit="Count", value=1)
+                self.cache.set(cached.refreshed())
+                return cached.body
 
-        except ValueError as e:
-            logger.warning("Invalid base uri %s", e)
-            raise e
+            response.raise_for_status()
+            body = response.json()
+
+            if self.cache is not None:
+                metrics.add_metric(name="APICacheMiss", unit="Count", value=1)
+                self.cache.set(
+                    CachedResponse(
+                        url=url,
+                        body=body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                )
 
-        self.base_uri = base_uri
-        self.session = requests.Session()
+            return body
+        finally:
+            response.close()
 
-        retries = Retry(total=3, backoff_factor=0.4)
 
-        self.session.mount(
-            "base_uri", requests.adapters.HTTPAdapter(max_retries=retries)
-        )
+# pylint: disable=too-few-public-methods
+class ParliamentCommitteesAPIClient(ParliamentAPIClient):
+    """Client for accessing Parliament Committee API endpoints."""
+
+    rate_limit_family = "committees"
 
-    def get_publication_file(self, publication: Publication) -> dict:
+    def get_sub_committees(self, parent_committee_id: int) -> list:
         """
-        Get file data for a publication.
+        Get list of sub-committees for a parent committee.
 
         Args:
-            publication (Publication): Publication object containing document info
+            parent_committee_id (int): ID of the parent committee
+
+        Returns:
+            list: List of sub-committee dictionaries with id and name
+        """
+        url = f"{self.base_uri}committees/{parent_committee_id}"
+        committee_json = self._get_cached_json(url)
+
+        sub_committees = [
+            {"id": sub_committee["id"], "name": sub_committee["name"]}
+            for sub_committee in committee_json["subCommittees"]
+        ]
+
+        return sub_committees
+
+    def get_committee_tree(self, committee_id: int) -> List[int]:
+        """
+        Get a committee and all of its sub-committees, at any depth.
+
+        The tree is walked a level at a time, looking up the committees in each level
+        concurrently. Each committee is looked up once, even if it appears under more
+        than one parent.
+
+        Args:
+            committee_id (int): ID of the root committee
 
         Returns:
-            dict: Dictionary containing base_uri and decoded file data
+            List[int]: IDs of the root committee followed by its sub-committees, level by level
 
         Raises:
-            requests.exceptions.ConnectionError: If connection fails
-            requests.exceptions.Timeout: If request times out
             requests.exceptions.HTTPError: If HTTP error occurs
-            requests.exceptions.RequestException: For other request errors
-            Exception: For unexpected errors
         """
-        url = f"{self.base_uri}{publication.documents[0].api_uri_path}"
+        committee_ids = [committee_id]
+        visited = {committee_id}
+        level = [committee_id]
+
+        with ThreadPoolExecutor(max_workers=MAX_COMMITTEE_WORKERS) as executor:
+            while level:
+                next_level = []
+                for sub_committees in executor.map(self.get_sub_committees, level):
+                    for sub_committee in sub_committees:
+                        if sub_committee["id"] not in visited:
+                            visited.add(sub_committee["id"])
+                            next_level.append(sub_committee["id"])
+                committee_ids.extend(next_level)
+                level = next_level
+
+        metrics.add_metric(name="CommitteeTreeSize", unit="Count", value=len(committee_ids))
+        return committee_ids
+
+
+class ParliamentPublicationsAPIClient(ParliamentAPIClient):
+    """Client for accessing Parliament Publications API endpoints."""
+
+    rate_limit_family = "publications"
+
+    def iter_document_file(
+        self,
+        document: PublicationDocument,
+        file: PublicationFile,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream the decoded data of one file of a publication document.
+
+        The response is read in chunks and the base64 data field is decoded as it
+        arrives, so memory use is bounded by the chunk size rather than the file size.
+
+        Args:
+            document (PublicationDocument): Document containing the file
+            file (PublicationFile): File to download, in its data format
+            chunk_size (int): Number of bytes to read from the response at a time
 
+        Yields:
+            bytes: Chunks of the decoded file
+
+        Raises:
+            KeyError: If the response has no data field
+            requests.exceptions.RequestException: For request errors
+        """
+        url = f"{self.base_uri}{document.file_api_uri_path(file)}"
+        decoder = Base64FieldDecoder("data")
+
+        logger.debug("Streaming %s", url)
+        response = self._get(url, stream=True)
         try:
-            logger.debug("Fetching %s", url)
-            response = self.session.get(url)
             response.raise_for_status()
             logger.debug("Status Code: %s for %s", response.status_code, url)
 
-            data = b64decode(response.json()["data"])
-            file = {"base_uri": self.base_uri, "data": data}
-            return file
-        except requests.exceptions.ConnectionError as e:
-            logger.error("Connection failed: %s", str(e))
-            raise
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                data = decoder.feed(chunk)
+                if data:
+                    yield data
+                if decoder.complete:
+                    break
 
-        except requests.exceptions.Timeout as e:
-            logger.error("Request timed out: %s", str(e))
-            raise
+            decoder.close()
 
         except requests.exceptions.HTTPError as e:
             logger.error("HTTP error occurred: %s - %s", e.response.status_code, str(e))
             raise
 
         except requests.exceptions.RequestException as e:
-            # Catches all requests exceptions not caught above
             logger.error("Request failed: %s", str(e))
             raise
 
-        except Exception as e:
-            # Catches any other unexpected exceptions
-            logger.error("Unexpected error: %s", str(e))
-            raise
-
         finally:
             response.close()
 
-    # pylint: disable=too-many-locals
     def get_committee_publications_list(
         self, committee_id: int, start_date: date, end_date: date
     ) -> Publications:
@@ -259,13 +474,13 @@ class ParliamentPublicationsAPIClient:
         skip = 0
         publications_obj = Publications(committee_api_base_uri=self.base_uri)
 
-        start_date_iso = datetime.combine(start_date, time(0, 0, 0)).isoformat()
-        end_date_iso = datetime.combine(end_date, time(0, 0, 0)).isoformat()
+        response = None
 
         try:
             while True:
-                url = f"{self.base_uri}publications/?CommitteeId={committee_id}&StartDate={start_date_iso}&EndDate={end_date_iso}&skip={skip}&take={TAKE}"  # pylint: disable=line-too-long
-                response = self.session.get(url)
+                response = self._get(
+                    publications_url(self.base_uri, committee_id, start_date, end_date, skip)
+                )
                 response.raise_for_status()
                 publications_json = response.json()
 
@@ -273,21 +488,7 @@ class ParliamentPublicationsAPIClient:
                 skip += TAKE
 
                 for publication in publications_json["items"]:
-                    publication_obj = Publication(
-                        id=publication["id"],
-                        description=publication["description"],
-                        committee_id=publication["committee"]["id"],
-                    )
-
-                    for document in publication["documents"]:
-                        document_obj = PublicationDocument(
-                            id=document["documentId"],
-                        )
-                        for file in document["files"]:
-                            file_obj = PublicationFile(filename=file["fileName"])
-                            document_obj.append(file_obj)
-                        publication_obj.append(document_obj)
-                    publications_obj.append(publication_obj)
+                    publications_obj.append(decode_api_publication(publication))
 
                 if skip >= total_results:
                     break
@@ -297,93 +498,299 @@ class ParliamentPublicationsAPIClient:
             logger.error(f"HTTP error occurred: {e}")
             raise
         finally:
-            response.close()
+            if response is not None:
+                response.close()
 
+    def get_publications_for_committees(
+        self, committee_ids: List[int], start_date: date, end_date: date
+    ) -> Publications:
+        """
+        Get the publications of several committees within a date range.
 
-class DateType(str, Enum):
-    """
-    Enum representing the type of date to filter questions by.
+        Each committee's list is fetched concurrently. Publications shared by more than
+        one committee are only included once, in the order of the first committee listing them.
 
-    Values:
-        TABLED: Filter by the date the question was tabled
-        ANSWERED: Filter by the date the question was answered
-    """
+        Args:
+            committee_ids (List[int]): IDs of the committees
+            start_date (date): Start date for publication search
+            end_date (date): End date for publication search
 
-    TABLED = "tabled"
-    ANSWERED = "answered"
+        Returns:
+            Publications: Object containing the merged list of publications
+
+        Raises:
+            requests.exceptions.RequestException: For request errors
+        """
+        validate_start_end_dates(start_date, end_date)
+
+        merged = Publications(committee_api_base_uri=self.base_uri)
+        seen = set()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_COMMITTEE_WORKERS, len(committee_ids)))
+        ) as executor:
+            committee_publications = executor.map(
+                lambda committee_id: self.get_committee_publications_list(
+                    committee_id=committee_id, start_date=start_date, end_date=end_date
+                ),
+                committee_ids,
+            )
+            for publications in committee_publications:
+                for publication in publications.publications:
+                    if publication.id not in seen:
+                        seen.add(publication.id)
+                        merged.append(publication)
+
+        return merged
 
 
-class ParliamentQuestionsAPIClient:
+class ParliamentQuestionsAPIClient(ParliamentAPIClient):
     """Client for accessing Parliament Questions API endpoints."""
 
-    def __init__(self, base_uri: str):
+    rate_limit_family = "questions"
+
+    def get_question_by_id(self, question_id: int) -> Question:
         """
-        Initialize the client with base URI and configure session.
+        Get a specific question by its ID.
 
         Args:
-            base_uri (str): Base URI for the API
+            question_id (int): ID of the question to retrieve
+
+        Returns:
+            Question: Question object containing ID, house, date tabled, question text and answer text
+        """
+        url = f"{self.base_uri}questions/{question_id}"
+        question_json = self._get_cached_json(url)
+
+        return decode_api_question(question_json)
+
+    def get_full_question(self, question: Question) -> Question:
+        """
+        Get complete question and answer if not already present.
+
+        Args:
+            question (Question): Question object to complete
+
+        Returns:
+            Question: Complete question object with full question and answer text
+        """
+        full_questions = self.get_full_questions(Questions(questions=[question]))
+        return full_questions.questions[0]
+
+    def get_full_questions(self, questions: Questions) -> Questions:
+        """
+        Get complete questions and answers for a batch of questions.
+
+        Only questions whose text or answer is truncated are retrieved from the API,
+        concurrently with up to MAX_HYDRATION_WORKERS threads. Complete questions are
+        returned as they are.
+
+        Args:
+            questions (Questions): Questions to complete
+
+        Returns:
+            Questions: Complete questions in the same order as the input
 
         Raises:
-            ValueError: If base_uri is invalid
+            requests.exceptions.HTTPError: If retrieving a question fails
         """
-        try:
-            validate_base_uri(base_uri)
+        full_questions, failed = self.try_get_full_questions(questions)
+        if failed:
+            raise next(iter(failed.values()))
 
-        except ValueError as e:
-            logger.warning("Invalid base uri %s", e)
-            raise e
+        return full_questions
 
-        self.base_uri = base_uri
-        self.session = requests.Session()
+    def try_get_full_questions(
+        self, questions: Questions
+    ) -> Tuple[Questions, Dict[int, Exception]]:
+        """
+        Get complete questions and answers, retrieving each question separately.
 
-        retries = Retry(total=3, backoff_factor=0.4)
+        A failure to retrieve one question does not stop the rest of the batch; the
+        question is left out of the result and its error is returned by question ID.
 
-        self.session.mount(
-            "base_uri", requests.adapters.HTTPAdapter(max_retries=retries)
+        Args:
+            questions (Questions): Questions to complete
+
+        Returns:
+            Tuple[Questions, Dict[int, Exception]]: Complete questions in the same order
+                as the input, and the error for each question that could not be retrieved
+        """
+        questions = list(questions)
+        incomplete = [
+            index
+            for index, question in enumerate(questions)
+            if not (question.complete_question and question.complete_answer)
+        ]
+
+        metrics.add_metric(name="QuestionAPIRequest", unit="Count", value=len(incomplete))
+        metrics.add_metric(
+            name="QuestionComplete", unit="Count", value=len(questions) - len(incomplete)
         )
 
-    def get_question_by_id(self, question_id: int) -> Question:
+        failed = {}
+        if incomplete:
+            logger.info(
+                "Retrieving %s full questions and answers from API", len(incomplete)
+            )
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_HYDRATION_WORKERS, len(incomplete))
+            ) as executor:
+                futures = {
+                    index: executor.submit(self.get_question_by_id, questions[index].id)
+                    for index in incomplete
+                }
+                for index, future in futures.items():
+                    try:
+                        questions[index] = future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.warning(
+                            "Failed to retrieve question %s: %s", questions[index].id, e
+                        )
+                        failed[questions[index].id] = e
+
+        if failed:
+            metrics.add_metric(name="QuestionAPIFailure", unit="Count", value=len(failed))
+
+        return (
+            Questions(
+                questions=[question for question in questions if question.id not in failed]
+            ),
+            failed,
+        )
+
+    def _get_questions_page(self, url: str) -> dict:
         """
-        Get a specific question by its ID.
+        Retrieve a single page of questions.
 
         Args:
-            question_id (int): ID of the question to retrieve
+            url (str): URL of the page
 
         Returns:
-            Question: Question object containing ID, house, date tabled, question text and answer text
+            dict: Decoded JSON page containing totalResults and results
         """
-        url = f"{self.base_uri}questions/{question_id}"
+        response = self._get(url)
+        response.raise_for_status()
+        return response.json()
+
+    def _decode_questions_page(self, question_data: dict, records: bool = False) -> Iterator:
+        """
+        Decode the questions in a single page of API results.
+
+        Args:
+            question_data (dict): Decoded JSON page containing results
+            records (bool): Decode to QuestionRecord instead of Question. Defaults to False.
+
+        Yields:
+            Question or QuestionRecord for each result in the page
+        """
+        if records:
+            yield from decode_api_question_records(question_data["results"])
+        else:
+            yield from decode_api_questions(question_data["results"])
+
+    def _iter_questions(
+        self, date_type: DateType, start_date: date, end_date: date, records: bool = False
+    ) -> Iterator:
+        """
+        Generator behind iter_questions_by_date and iter_question_records_by_date.
+
+        At most MAX_PAGE_WORKERS pages are in flight or waiting to be consumed
+        at any one time, so memory stays flat however long the date range is.
+        """
+        executor = None
+        pending = deque()
+
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            question_json = response.json()
-
-            return Question(
-                id=question_json["value"]["id"],
-                house=question_json["value"]["house"].lower(),
-                date_tabled=parser.parse(question_json["value"]["dateTabled"]),
-                question=question_json["value"]["questionText"],
-                answer=question_json["value"]["answerText"],
+            first_page = self._get_questions_page(
+                questions_url(self.base_uri, date_type, start_date, end_date, 0)
             )
+            total_results = first_page["totalResults"]
+            yield from self._decode_questions_page(first_page, records)
+            del first_page
+
+            if total_results > TAKE:
+                executor = ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS)
+                for skip in range(TAKE, total_results, TAKE):
+                    url = questions_url(self.base_uri, date_type, start_date, end_date, skip)
+                    pending.append(executor.submit(self._get_questions_page, url))
+                    if len(pending) >= MAX_PAGE_WORKERS:
+                        yield from self._decode_questions_page(
+                            pending.popleft().result(), records
+                        )
+
+                while pending:
+                    yield from self._decode_questions_page(pending.popleft().result(), records)
+
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"HTTP error occurred: {e}")
+            raise e
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise e
         finally:
-            response.close()
+            for future in pending:
+                future.cancel()
+            if executor:
+                executor.shutdown(wait=True)
+            self.transport.record_pool_metrics()
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_metrics()
+
+    def iter_questions_by_date(
+        self, date_type: DateType, start_date: date, end_date: date
+    ) -> Iterator[Question]:
+        """
+        Iterate over all questions tabled or answered between two dates.
 
-    def get_full_question(self, question: Question) -> Question:
+        Questions are yielded as each page is decoded. The first page is retrieved
+        to discover totalResults, the remaining pages are then retrieved in parallel
+        with up to MAX_PAGE_WORKERS threads and yielded in offset order.
+
+        Args:
+            date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+            start_date (date): Start date for question search
+            end_date (date): End date for question search
+
+        Returns:
+            Iterator[Question]: Iterator over the questions
+
+        Raises:
+            ValueError: If the dates or date_type are invalid
+            requests.exceptions.HTTPError: If HTTP error occurs while iterating
+            requests.exceptions.RequestException: For other request errors while iterating
         """
-        Get complete question and answer if not already present.
+        validate_start_end_dates(start_date, end_date)
+        questions_url(self.base_uri, date_type, start_date, end_date, 0)
+
+        return self._iter_questions(date_type, start_date, end_date)
+
+    def iter_question_records_by_date(
+        self, date_type: DateType, start_date: date, end_date: date
+    ) -> Iterator[QuestionRecord]:
+        """
+        Iterate over all questions tabled or answered between two dates as question records.
+
+        Behaves like iter_questions_by_date, but yields lightweight QuestionRecord
+        instances for bulk processing.
 
         Args:
-            question (Question): Question object to complete
+            date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
+            start_date (date): Start date for question search
+            end_date (date): End date for question search
 
         Returns:
-            Question: Complete question object with full question and answer text
+            Iterator[QuestionRecord]: Iterator over the question records
+
+        Raises:
+            ValueError: If the dates or date_type are invalid
+            requests.exceptions.HTTPError: If HTTP error occurs while iterating
+            requests.exceptions.RequestException: For other request errors while iterating
         """
-        if question.complete_question and question.complete_answer:
-            return question
-        logger.info("Retrieving full question and answer from API")
-        metrics.add_metric(name="QuestionAPIRequest", unit="Count", value=1)
-        full_question = self.get_question_by_id(question.id)
-        return full_question
+        validate_start_end_dates(start_date, end_date)
+        questions_url(self.base_uri, date_type, start_date, end_date, 0)
+
+        return self._iter_questions(date_type, start_date, end_date, records=True)
 
     def get_questions_by_date(
         self, date_type: DateType, start_date: date, end_date: date
@@ -391,6 +798,9 @@ class ParliamentQuestionsAPIClient:
         """
         Get all questions tabled or answered between two dates.
 
+        Collects iter_questions_by_date into a single Questions object. Prefer
+        iter_questions_by_date for long date ranges.
+
         Args:
             date_type (DateType): Type of date to filter by (TABLED or ANSWERED)
             start_date (date): Start date for question search
@@ -404,50 +814,8 @@ class ParliamentQuestionsAPIClient:
             requests.exceptions.HTTPError: If HTTP error occurs
             requests.exceptions.RequestException: For other request errors
         """
-        validate_start_end_dates(start_date, end_date)
-
-        skip = 0
         questions = Questions()
+        for question in self.iter_questions_by_date(date_type, start_date, end_date):
+            questions.add(question)
 
-        try:
-            while True:
-                if date_type == DateType.TABLED:
-                    url = f"{self.base_uri}questions?tabledWhenFrom={start_date}&tabledWhenTo={end_date}&skip={skip}&take={TAKE}"
-                elif date_type == DateType.ANSWERED:
-                    url = f"{self.base_uri}questions?answeredWhenFrom={start_date}&answeredWhenTo={end_date}&skip={skip}&take={TAKE}"
-                else:
-                    raise ValueError(f"Invalid date_type: {date_type}")
-
-                # amazonq-ignore-next-line as this is caught by the finally block
-                response = self.session.get(url)
-                response.raise_for_status()
-
-                question_data = response.json()
-
-                total_results = question_data["totalResults"]
-                skip += TAKE
-
-                for api_question in question_data["results"]:
-                    question = Question(
-                        id=api_question["value"]["id"],
-                        house=House(api_question["value"]["house"].lower()),
-                        date_tabled=parser.parse(
-                            api_question["value"]["dateTabled"][:10]
-                        ),
-                        question=api_question["value"]["questionText"],
-                        answer=api_question["value"]["answerText"],
-                    )
-                    questions.add(question)
-                if total_results <= skip:
-                    break
-
-            return questions
-
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error occurred: {e}")
-            raise e
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise e
-        finally:
-            self.session.close()
+        return questions
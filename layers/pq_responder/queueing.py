@@ -1,42 +1,602 @@
 """Module for interacting with Amazon Simple Queue Service (SQS).
 
-This module provides a class for sending messages to SQS queues.
+This module provides a class for sending messages to SQS queues, one at a time or in
+concurrent batches, and an envelope format packing many messages into one.
+
+An envelope is a JSON object holding the packed messages as a JSON array, either
+inline or gzip compressed and base64 encoded:
+    {"envelope": 1, "count": 2, "items": [{...}, {...}]}
+    {"envelope": 1, "count": 2, "encoding": "gzip", "data": "H4sI..."}
+unpack_message returns the items of an envelope, or a plain message as a single item,
+so consumers handle both formats.
+
+When a claim check bucket is configured, a message larger than the claim check
+threshold is written to S3 and the SQS message carries a pointer to it instead:
+    {"claimCheck": {"bucket": "...", "key": "claim-check/..."}}
+read_message, and so unpack_message, dereference the pointer transparently. Objects are
+not deleted by the consumer, so a redelivered message can still be read. They are
+removed by a lifecycle rule on the bucket.
 """
 
-import boto3
+import base64
+import gzip
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
 import botocore.exceptions
+from botocore.config import Config
+from pydantic import BaseModel
 
-from aws_lambda_powertools import Logger
+from aws_lambda_powertools import Logger, Metrics
+
+import backends
+from serialization import dumps, loads
 
 logger = Logger()
+metrics = Metrics()
+
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+MAX_BATCH_WORKERS = 8
+SEND_MAX_ATTEMPTS = 4
+SEND_BASE_DELAY = 0.1
+
+ENVELOPE_VERSION = 1
+ENVELOPE_MAX_ITEMS = 500
+# Uncompressed bytes gathered for a gzip envelope, which is split if it still does not fit
+ENVELOPE_MAX_UNCOMPRESSED_BYTES = 4 * MAX_BATCH_BYTES
+
+CLAIM_CHECK_THRESHOLD = MAX_BATCH_BYTES
+CLAIM_CHECK_KEY_PREFIX = "claim-check/"
+# Largest envelope packed when envelopes are sent by claim check
+CLAIM_CHECK_MAX_ENVELOPE_BYTES = 16 * 1024 * 1024
+_CLAIM_CHECK_MARKER = b'{"claimCheck":'
+
+# Sized so every send_messages worker has its own connection
+sqs_client = backends.client("sqs", config=Config(max_pool_connections=MAX_BATCH_WORKERS))
+s3_client = backends.client("s3", config=Config(max_pool_connections=MAX_BATCH_WORKERS))
+
+
+class MessagePacking(str, Enum):
+    """
+    Enum representing how messages are packed into SQS messages.
+
+    Values:
+        NONE: One message per SQS message
+        JSON: Envelopes of messages as an inline JSON array
+        GZIP: Envelopes of messages as a gzip compressed, base64 encoded JSON array
+    """
+
+    NONE = "none"
+    JSON = "json"
+    GZIP = "gzip"
+
+
+class FailedMessage(BaseModel):
+    """Model representing a message that could not be sent."""
+
+    index: int
+    code: str
+    message: str = ""
+
+
+class SendReport(BaseModel):
+    """Model representing the outcome of sending a batch of messages."""
+
+    sent: int = 0
+    failed: List[FailedMessage] = []
+
+    def merge(self, other: "SendReport"):
+        """Add the outcome of another batch to this report.
+
+        Args:
+            other (SendReport): Report to add
+        """
+        self.sent += other.sent
+        self.failed.extend(other.failed)
+
+
+class SendMessagesError(RuntimeError):
+    """Raised when some messages could not be sent.
+
+    Args:
+        report (SendReport): Outcome of the send, including the failed messages
+    """
+
+    def __init__(self, report: SendReport):
+        super().__init__(
+            f"Failed to send {len(report.failed)} messages, sent {report.sent}"
+        )
+        self.report = report
+
+
+class _ClaimCheck(NamedTuple):
+    """A message to write to the claim check bucket before its pointer is sent."""
+
+    key: str
+    message: str
+
+
+def _message_size(message: str) -> int:
+    return len(message.encode("utf-8"))
+
 
-sqs_client = boto3.client("sqs")
+def _as_text(message: Union[bytes, str]) -> str:
+    return message.decode("utf-8") if isinstance(message, bytes) else message
+
+
+def _failed_message(index: int, error: dict) -> FailedMessage:
+    """Build a failed message from an SQS error or failed batch entry."""
+    return FailedMessage(index=index, code=error["Code"], message=error.get("Message", ""))
+
+
+def _client_error(error: botocore.exceptions.BotoCoreError) -> dict:
+    """Describe a botocore error, such as a connection error or timeout, like an SQS error."""
+    return {"Code": type(error).__name__, "Message": str(error)}
+
+
+def pack_envelope(items: List[bytes], packing: MessagePacking = MessagePacking.JSON) -> bytes:
+    """Pack serialized JSON messages into an envelope.
+
+    Args:
+        items (List[bytes]): Serialized JSON messages
+        packing (MessagePacking): JSON for an inline array, GZIP for a compressed array
+
+    Returns:
+        bytes: Envelope JSON document
+    """
+    array = b"[" + b",".join(items) + b"]"
+    if MessagePacking(packing) == MessagePacking.GZIP:
+        data = base64.b64encode(gzip.compress(array, compresslevel=6))
+        return b'{"envelope":%d,"count":%d,"encoding":"gzip","data":"%s"}' % (
+            ENVELOPE_VERSION,
+            len(items),
+            data,
+        )
+    return b'{"envelope":%d,"count":%d,"items":%s}' % (ENVELOPE_VERSION, len(items), array)
+
+
+def claim_check_pointer(bucket: str, key: str) -> bytes:
+    """Build the body of a message pointing to a payload stored in S3.
+
+    Args:
+        bucket (str): Bucket holding the payload
+        key (str): Key of the payload
+
+    Returns:
+        bytes: Pointer message body
+    """
+    return dumps({"claimCheck": {"bucket": bucket, "key": key}})
+
+
+def read_message(body: Union[bytes, str]) -> Union[bytes, str]:
+    """Get the payload of an SQS message body, reading it from S3 if it is a claim check.
+
+    Args:
+        body (Union[bytes, str]): Message body
+
+    Returns:
+        Union[bytes, str]: The body itself, or the payload the claim check points to
+
+    Raises:
+        botocore.exceptions.ClientError: If the payload cannot be read from S3
+    """
+    marker = _CLAIM_CHECK_MARKER if isinstance(body, bytes) else _CLAIM_CHECK_MARKER.decode()
+    if not body.startswith(marker):
+        return body
+
+    pointer = loads(body)["claimCheck"]
+    logger.debug("Reading claim check s3://%s/%s", pointer["bucket"], pointer["key"])
+    response = s3_client.get_object(Bucket=pointer["bucket"], Key=pointer["key"])
+    return response["Body"].read()
+
+
+def unpack_message(body: Union[bytes, str]) -> List[Any]:
+    """Unpack the messages in an SQS message body.
+
+    Args:
+        body (Union[bytes, str]): Body of an envelope, of a single plain JSON message or
+            of a claim check pointing to either
+
+    Returns:
+        List[Any]: Parsed messages of the envelope, or the plain message on its own
+
+    Raises:
+        json.JSONDecodeError: If the body or packed data is invalid JSON
+        binascii.Error: If compressed data is not valid base64
+        gzip.BadGzipFile: If compressed data is not valid gzip
+        botocore.exceptions.ClientError: If a claim checked payload cannot be read
+    """
+    value = loads(read_message(body))
+    if not isinstance(value, dict) or "envelope" not in value:
+        return [value]
+    if value.get("encoding") == "gzip":
+        return loads(gzip.decompress(base64.b64decode(value["data"])))
+    return value["items"]
+
+
+def _fit_envelopes(
+    first_index: int, items: List[bytes], packing: MessagePacking, max_bytes: int
+) -> Iterator[Tuple[int, int, bytes]]:
+    """Pack items into envelopes, halving until each fits in max_bytes.
+
+    A single item which does not fit is still yielded, so it fails when it is sent.
+    """
+    envelope = pack_envelope(items, packing)
+    if len(envelope) <= max_bytes or len(items) == 1:
+        yield first_index, len(items), envelope
+        return
+
+    middle = len(items) // 2
+    yield from _fit_envelopes(first_index, items[:middle], packing, max_bytes)
+    yield from _fit_envelopes(first_index + middle, items[middle:], packing, max_bytes)
+
+
+def iter_envelopes(
+    messages: Iterable[Union[bytes, str]],
+    packing: MessagePacking = MessagePacking.JSON,
+    max_items: int = ENVELOPE_MAX_ITEMS,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[Tuple[int, int, bytes]]:
+    """Pack serialized JSON messages into envelopes of at most max_bytes.
+
+    Args:
+        messages (Iterable[Union[bytes, str]]): Serialized JSON messages
+        packing (MessagePacking): JSON or GZIP envelopes
+        max_items (int): Maximum number of messages in an envelope
+        max_bytes (int): Maximum size of an envelope
+
+    Yields:
+        Tuple[int, int, bytes]: Index of the envelope's first message, number of
+                                messages in the envelope, and the envelope
+    """
+    packing = MessagePacking(packing)
+    limit = max_bytes
+    if packing == MessagePacking.GZIP:
+        limit = max(ENVELOPE_MAX_UNCOMPRESSED_BYTES, 4 * max_bytes)
+    first_index = 0
+    items = []
+    size = 0
+
+    for index, message in enumerate(messages):
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        if items and (len(items) == max_items or size + len(message) > limit):
+            yield from _fit_envelopes(first_index, items, packing, max_bytes)
+            first_index = index
+            items = []
+            size = 0
+        items.append(message)
+        # Allow for the separating comma
+        size += len(message) + 1
+
+    if items:
+        yield from _fit_envelopes(first_index, items, packing, max_bytes)
 
 
-# pylint: disable=too-few-public-methods
 class SQSQueue:
     """A class to handle interactions with an Amazon SQS queue.
 
     Args:
         queue_name (str): The URL of the SQS queue to interact with
+        claim_check_bucket (str, optional): Bucket to write messages larger than
+            claim_check_threshold to, sending a pointer in their place. Defaults to the
+            CLAIM_CHECK_BUCKET environment variable. Oversized messages fail to send
+            when there is no bucket.
+        claim_check_threshold (int): Size in bytes above which messages are claim checked
     """
 
-    def __init__(self, queue_name: str):
+    def __init__(
+        self,
+        queue_name: str,
+        claim_check_bucket: Optional[str] = None,
+        claim_check_threshold: int = CLAIM_CHECK_THRESHOLD,
+    ):
         self.queue_name = queue_name
+        self.claim_check_bucket = claim_check_bucket or os.getenv("CLAIM_CHECK_BUCKET")
+        self.claim_check_threshold = min(claim_check_threshold, MAX_BATCH_BYTES)
 
-    def send_message(self, message: str) -> None:
+    def send_message(self, message: Union[bytes, str]) -> None:
         """Send a message to the SQS queue.
-        
+
         Args:
-            message (str): The message body to send to the queue
-            
+            message (Union[bytes, str]): The message body to send to the queue,
+                bytes are sent as UTF-8 text
+
         Returns:
             None
         """
         logger.debug("Sending message to queue: %s", self.queue_name)
 
+        message = _as_text(message)
+        if self.claim_check_bucket and _message_size(message) > self.claim_check_threshold:
+            message = _as_text(self._check_in(message))
+
         try:
             sqs_client.send_message(QueueUrl=self.queue_name, MessageBody=message)
         except botocore.exceptions.ClientError as e:
             logger.warning("Failed to send message to queue: %s", e)
             raise e
+
+    def send_messages(
+        self,
+        messages: Iterable[Union[bytes, str]],
+        max_workers: int = MAX_BATCH_WORKERS,
+    ) -> SendReport:
+        """Send messages to the SQS queue in batches.
+
+        Messages are grouped into send_message_batch calls of up to 10 entries and
+        256 KiB, with up to max_workers batches in flight at once. Messages are read
+        from the iterable as batches are sent, so a generator is never held in memory
+        in full. Entries that fail through no fault of the sender are retried with
+        jittered exponential backoff, without resending the entries that succeeded.
+        Messages above the claim check threshold are written to S3 by the batch's
+        worker and sent as pointers, when a claim check bucket is configured.
+
+        Args:
+            messages (Iterable[Union[bytes, str]]): Message bodies, bytes are sent as
+                UTF-8 text
+            max_workers (int): Maximum number of batches in flight
+
+        Returns:
+            SendReport: Number of messages sent, and the index in messages, error code
+                        and error message of each message that could not be sent
+        """
+        report = SendReport()
+        batch_count = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for batch in self._batches(messages, report):
+                if len(pending) >= max_workers:
+                    report.merge(pending.popleft().result())
+                pending.append(executor.submit(self._send_batch, batch))
+                batch_count += 1
+
+            while pending:
+                report.merge(pending.popleft().result())
+
+        metrics.add_metric(name="SQSBatchesSent", unit="Count", value=batch_count)
+        metrics.add_metric(name="SQSMessagesFailed", unit="Count", value=len(report.failed))
+        logger.debug(
+            "Sent %s messages in %s batches to queue %s, %s failed",
+            report.sent,
+            batch_count,
+            self.queue_name,
+            len(report.failed),
+        )
+        return report
+
+    def send_packed(
+        self,
+        messages: Iterable[Union[bytes, str]],
+        packing: MessagePacking = MessagePacking.GZIP,
+        max_items: int = ENVELOPE_MAX_ITEMS,
+        max_workers: int = MAX_BATCH_WORKERS,
+    ) -> SendReport:
+        """Send serialized JSON messages packed into envelopes.
+
+        Envelopes are sent with send_messages. The report counts the packed messages
+        rather than the envelopes, so each message of a failed envelope is reported as
+        failed with the envelope's error. With a claim check bucket, envelopes are only
+        limited by max_items and are claim checked when they are too large to send,
+        rather than split into smaller envelopes.
+
+        Args:
+            messages (Iterable[Union[bytes, str]]): Serialized JSON messages
+            packing (MessagePacking): NONE to send each message on its own, or JSON or
+                GZIP envelopes
+            max_items (int): Maximum number of messages in an envelope
+            max_workers (int): Maximum number of batches in flight
+
+        Returns:
+            SendReport: Number of messages sent, and each message that could not be sent
+        """
+        if MessagePacking(packing) == MessagePacking.NONE:
+            return self.send_messages(messages, max_workers=max_workers)
+
+        spans = []
+
+        max_bytes = (
+            CLAIM_CHECK_MAX_ENVELOPE_BYTES
+            if self.claim_check_bucket
+            else self.claim_check_threshold
+        )
+
+        def envelopes() -> Iterator[bytes]:
+            for first_index, count, envelope in iter_envelopes(
+                messages, packing, max_items, max_bytes
+            ):
+                spans.append((first_index, count))
+                yield envelope
+
+        envelope_report = self.send_messages(envelopes(), max_workers=max_workers)
+
+        report = SendReport()
+        for failed in envelope_report.failed:
+            first_index, count = spans[failed.index]
+            report.failed.extend(
+                failed.model_copy(update={"index": index})
+                for index in range(first_index, first_index + count)
+            )
+        report.sent = sum(count for _, count in spans) - len(report.failed)
+
+        metrics.add_metric(name="SQSEnvelopesSent", unit="Count", value=envelope_report.sent)
+        return report
+
+    def _check_in(self, message: Union[bytes, str], key: Optional[str] = None) -> bytes:
+        """Write a message to the claim check bucket.
+
+        Args:
+            message (Union[bytes, str]): Message body
+            key (str, optional): Key to write to. Defaults to a new unique key.
+
+        Returns:
+            bytes: Pointer to send in place of the message
+
+        Raises:
+            botocore.exceptions.ClientError: If the message cannot be written
+        """
+        key = key or self._claim_check_key()
+        s3_client.put_object(
+            Bucket=self.claim_check_bucket,
+            Key=key,
+            Body=message.encode("utf-8") if isinstance(message, str) else message,
+            ContentType="application/json",
+        )
+        return claim_check_pointer(self.claim_check_bucket, key)
+
+    @staticmethod
+    def _claim_check_key() -> str:
+        return f"{CLAIM_CHECK_KEY_PREFIX}{uuid.uuid4()}.json"
+
+    def _batches(
+        self, messages: Iterable[Union[bytes, str]], report: SendReport
+    ) -> Iterator[List[Tuple[int, str, Optional[_ClaimCheck]]]]:
+        """Group messages into batches within the entry and size limits.
+
+        Messages above the claim check threshold are replaced by a pointer to a new
+        claim check key, and written to it when the batch is sent. Messages too large
+        to send on their own are recorded as failed in the report.
+
+        Args:
+            messages (Iterable[Union[bytes, str]]): Message bodies
+            report (SendReport): Report to record oversized messages in
+
+        Yields:
+            List[Tuple[int, str, Optional[_ClaimCheck]]]: Index and body of each message
+                in a batch, and the message to write to S3 if the body is a pointer
+        """
+        batch = []
+        batch_bytes = 0
+
+        for index, message in enumerate(messages):
+            message = _as_text(message)
+            size = _message_size(message)
+            claim_check = None
+            if self.claim_check_bucket and size > self.claim_check_threshold:
+                claim_check = _ClaimCheck(self._claim_check_key(), message)
+                message = _as_text(claim_check_pointer(self.claim_check_bucket, claim_check.key))
+                size = _message_size(message)
+            elif size > MAX_BATCH_BYTES:
+                report.failed.append(
+                    FailedMessage(
+                        index=index,
+                        code="MessageTooLong",
+                        message=f"Message is {size} bytes",
+                    )
+                )
+                continue
+
+            if len(batch) == MAX_BATCH_ENTRIES or batch_bytes + size > MAX_BATCH_BYTES:
+                yield batch
+                batch = []
+                batch_bytes = 0
+
+            batch.append((index, message, claim_check))
+            batch_bytes += size
+
+        if batch:
+            yield batch
+
+    def _check_in_batch(
+        self, batch: List[Tuple[int, str, Optional[_ClaimCheck]]], report: SendReport
+    ) -> Dict[int, str]:
+        """Write the claim checked messages of a batch to S3.
+
+        Args:
+            batch (List[Tuple[int, str, Optional[_ClaimCheck]]]): Index and body of each
+                message, and the message to write to S3 if the body is a pointer
+            report (SendReport): Report to add messages which cannot be written to
+
+        Returns:
+            Dict[int, str]: Body of each message to send, by index
+        """
+        remaining = {}
+        for index, message, claim_check in batch:
+            if claim_check is not None:
+                try:
+                    self._check_in(claim_check.message, claim_check.key)
+                except botocore.exceptions.ClientError as e:
+                    logger.warning("Failed to write claim check %s: %s", claim_check.key, e)
+                    report.failed.append(_failed_message(index, e.response["Error"]))
+                    continue
+                except botocore.exceptions.BotoCoreError as e:
+                    logger.warning("Failed to write claim check %s: %s", claim_check.key, e)
+                    report.failed.append(_failed_message(index, _client_error(e)))
+                    continue
+            remaining[index] = message
+        return remaining
+
+    def _send_batch(self, batch: List[Tuple[int, str, Optional[_ClaimCheck]]]) -> SendReport:
+        """Send one batch, retrying only the entries that failed transiently.
+
+        Claim checked messages are written to S3 first. A message which cannot be
+        written is reported as failed and its pointer is not sent.
+
+        Args:
+            batch (List[Tuple[int, str, Optional[_ClaimCheck]]]): Index and body of each
+                message, and the message to write to S3 if the body is a pointer
+
+        Returns:
+            SendReport: Outcome of the batch
+        """
+        report = SendReport()
+        remaining = self._check_in_batch(batch, report)
+        if not remaining:
+            return report
+
+        for attempt in range(SEND_MAX_ATTEMPTS):
+            retry = {}
+            try:
+                response = sqs_client.send_message_batch(
+                    QueueUrl=self.queue_name,
+                    Entries=[
+                        {"Id": str(index), "MessageBody": message}
+                        for index, message in remaining.items()
+                    ],
+                )
+            except botocore.exceptions.ClientError as e:
+                error = e.response["Error"]
+                if error.get("Type") == "Sender":
+                    logger.warning("Failed to send message batch to queue: %s", e)
+                    report.failed.extend(_failed_message(index, error) for index in remaining)
+                    return report
+                retry = remaining
+                failure = error
+            except botocore.exceptions.BotoCoreError as e:
+                # Connection errors and timeouts are retried like server errors
+                logger.debug("Failed to send message batch to queue: %s", e)
+                retry = remaining
+                failure = _client_error(e)
+            else:
+                report.sent += len(response.get("Successful", []))
+                for entry in response.get("Failed", []):
+                    index = int(entry["Id"])
+                    if entry.get("SenderFault"):
+                        report.failed.append(_failed_message(index, entry))
+                    else:
+                        retry[index] = remaining[index]
+                        failure = entry
+
+            if not retry:
+                return report
+
+            remaining = retry
+            if attempt + 1 < SEND_MAX_ATTEMPTS:
+                # Full jitter spreads retries from concurrent batches
+                delay = random.uniform(0, SEND_BASE_DELAY * (2 ** attempt))
+                logger.debug("Retrying %s messages in %.2fs", len(remaining), delay)
+                time.sleep(delay)
+
+        logger.warning(
+            "Failed to send %s messages after %s attempts", len(remaining), SEND_MAX_ATTEMPTS
+        )
+        report.failed.extend(_failed_message(index, failure) for index in remaining)
+        return report
@@ -0,0 +1,226 @@
+"""
+Module providing adaptive rate limiting for the Parliament API clients.
+
+Requests are paced by a token bucket per endpoint family, shared by every client of the
+family in the process. The rate backs off when the API responds with 429 or 503 and a
+Retry-After delay pauses every caller, then recovers as requests succeed.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from aws_lambda_powertools import Metrics
+
+metrics = Metrics()
+
+MAX_RETRY_AFTER = 60
+DEFAULT_RATE_LIMITS = {"questions": 10.0, "publications": 5.0, "committees": 5.0}
+MIN_RATE = 0.5
+RATE_DECREASE_FACTOR = 0.7
+RATE_INCREASE_STEP = 0.2
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a fixed rate up to its capacity.
+
+    The bucket is not thread safe; callers hold their own lock.
+
+    Args:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of tokens, the bucket starts full
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        """
+        Add the tokens accrued since the last refill.
+
+        Args:
+            now (float): Current time.monotonic() value
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """
+        Take a token if one is available.
+
+        Args:
+            now (float): Current time.monotonic() value
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter which adapts its rate to throttling responses.
+
+    The rate starts at the configured ceiling. Each throttling response reduces it
+    multiplicatively, at most once per second so a burst of 429s counts as one signal,
+    and each successful request raises it additively back towards the ceiling. A
+    Retry-After delay pauses every caller sharing the limiter.
+    """
+
+    def __init__(self, family: str, rate: float, burst: float = None):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            family (str): Endpoint family the limiter applies to, used in metric names
+            rate (float): Maximum requests per second
+            burst (float, optional): Bucket capacity. Defaults to one second of requests.
+        """
+        self.family = family
+        self.max_rate = rate
+        self.min_rate = min(MIN_RATE, rate)
+
+        self._bucket = TokenBucket(rate, burst if burst is not None else max(1.0, rate))
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        return self._bucket.rate
+
+    def try_acquire(self) -> float:
+        """
+        Take a token without waiting.
+
+        Returns:
+            float: 0 if a request may be sent now, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = self._blocked_until - now
+            if wait > 0:
+                return wait
+            return self._bucket.take(now)
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+        """
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Wait on the event loop, without blocking it, until a request may be sent.
+        """
+        while (wait := self.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """
+        Raise the rate towards the ceiling after a successful request.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._bucket.rate = min(
+                    self.max_rate, self.rate + RATE_INCREASE_STEP / self.rate
+                )
+
+    def on_throttle(self, retry_after: float = None):
+        """
+        Reduce the rate and pause requests after a throttling response.
+
+        Args:
+            retry_after (float, optional): Seconds the API asked us to wait. Defaults to None.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._bucket.refill(now)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now - self._last_decrease >= 1:
+                self._bucket.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+                self._last_decrease = now
+            rate = self.rate
+
+        metrics.add_metric(name="APIThrottled", unit="Count", value=1)
+        metrics.add_metric(
+            name=f"APIRateLimit{self.family.title()}", unit="Count/Second", value=rate
+        )
+
+    def record_metrics(self):
+        """
+        Add the current rate to the metrics.
+        """
+        metrics.add_metric(
+            name=f"APIRateLimit{self.family.title()}",
+            unit="Count/Second",
+            value=self.rate,
+        )
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(family: str) -> RateLimiter:
+    """
+    Get the module level rate limiter for an endpoint family, creating it on first use.
+
+    The rate in requests per second is read from the PARLIAMENT_API_RATE_<FAMILY>
+    environment variable, for example PARLIAMENT_API_RATE_QUESTIONS. A rate of 0
+    disables rate limiting for the family.
+
+    Args:
+        family (str): Endpoint family (questions, publications or committees)
+
+    Returns:
+        RateLimiter: Limiter shared by all clients of the family, or None if disabled
+    """
+    with _rate_limiters_lock:
+        if family not in _rate_limiters:
+            rate = float(
+                os.getenv(
+                    f"PARLIAMENT_API_RATE_{family.upper()}",
+                    str(DEFAULT_RATE_LIMITS.get(family, 0)),
+                )
+            )
+            _rate_limiters[family] = RateLimiter(family, rate) if rate > 0 else None
+        return _rate_limiters[family]
+
+
+def parse_retry_after(value: str) -> float:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value (str): Retry-After header value
+
+    Returns:
+        float: Seconds to wait, capped at MAX_RETRY_AFTER, or None if missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = retry_at.timestamp() - time.time()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -15,6 +15,7 @@ from botocore.exceptions import ClientError
 
 from aws_lambda_powertools import Logger, Metrics
 
+from circuit_breaker import CircuitState, get_circuit_breaker
 from models import Questions, Question
 
 logger = Logger()
@@ -27,6 +28,14 @@ bedrock_agent_runtime_client = boto3.client("bedrock-agent-runtime", config=conf
 s3_client = boto3.client("s3")
 glue_client = boto3.client("glue")
 
+BEDROCK_FAILURE_ERROR_CODES = (
+    "throttlingException",
+    "internalServerException",
+    "serviceUnavailableException",
+    "dependencyFailedException",
+    "badGatewayException",
+)
+
 
 # pylint: disable=too-few-public-methods
 class BedrockAgent:
@@ -70,8 +79,10 @@ class BedrockAgent:
 
         max_retries = 10
         base_delay = 1
+        circuit_breaker = get_circuit_breaker("BedrockAgent")
         
         for attempt in range(max_retries + 1):
+            circuit_breaker.before_call()
             try:
                 response = bedrock_agent_runtime_client.invoke_agent(
                     agentId=self.agent_id,
@@ -85,6 +96,7 @@ class BedrockAgent:
                     chunk = event["chunk"]
                     completion = completion + chunk["bytes"].decode()
 
+                circuit_breaker.record_success()
                 return {
                     "completion": completion,
                     "sessionId": session_id,
@@ -92,8 +104,17 @@ class BedrockAgent:
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
-                if error_code == 'throttlingException' and attempt < max_retries:
-                    # Exponential backoff with jitter
+                if error_code in BEDROCK_FAILURE_ERROR_CODES:
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+
+                if (
+                    error_code == 'throttlingException'
+                    and attempt < max_retries
+                    and circuit_breaker.state == CircuitState.CLOSED
+                ):
+                    # Exponential backoff with jitter, stopped once the circuit opens
                     delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
                     logger.warning(f"ThrottlingException on attempt {attempt + 1}, retrying in {delay:.2f}s")
                     time.sleep(delay)
@@ -101,6 +122,11 @@ class BedrockAgent:
                 
                 logger.warning("Couldn't invoke agent, %s", e)
                 raise e
+
+            except Exception:
+                # Any other error still ends the call, so a half-open probe is not lost
+                circuit_breaker.record_failure()
+                raise
         
         return None
 
@@ -171,8 +197,7 @@ class BedrockFlow:
                     key_elements = item["location"]["s3Location"]["uri"].split("/")[3:]
                     key = "/".join(key_elements)
                     s3_response = s3_client.get_object(Bucket=bucket_name, Key=key)
-                    content = s3_response["Body"].read().decode("utf-8")
-                    question = Question.from_dict(json.loads(content))
+                    question = Question.from_json(s3_response["Body"].read())
                     questions.add(question)
 
             except json.JSONDecodeError as e:
@@ -0,0 +1,194 @@
+"""
+Module providing the JSON serialization backend shared by models, queueing and storage.
+
+Plain data is serialized through a pluggable backend: orjson when it is installed, or
+the standard library json module otherwise. The backend can be forced with the
+SERIALIZATION_BACKEND environment variable ("orjson" or "json"). Both backends produce
+the same compact UTF-8 output.
+
+Pydantic models are serialized and parsed by pydantic-core directly to and from bytes,
+so model output is always identical to model_dump_json whichever backend is in use.
+"""
+
+import json
+import os
+from datetime import date
+from enum import Enum
+from typing import Any, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from aws_lambda_powertools import Logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = Logger()
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _default(value: Any) -> Any:
+    """Serialize the types the backends do not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONBackend:
+    """Serialization backend using the standard library json module."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize a value to compact UTF-8 JSON.
+
+        Args:
+            value (Any): Value to serialize
+
+        Returns:
+            bytes: JSON document
+
+        Raises:
+            TypeError: If the value cannot be serialized
+        """
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_default
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parse a JSON document.
+
+        Args:
+            data (Union[bytes, str]): JSON document
+
+        Returns:
+            Any: Parsed value
+
+        Raises:
+            json.JSONDecodeError: If the document is invalid
+        """
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """Serialization backend using orjson."""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_default)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+
+
+BACKENDS = {JSONBackend.name: JSONBackend, OrjsonBackend.name: OrjsonBackend}
+
+_selected_backend = {}
+
+
+def set_backend(name: str) -> JSONBackend:
+    """
+    Select the serialization backend.
+
+    Args:
+        name (str): Name of the backend, "orjson" or "json"
+
+    Returns:
+        JSONBackend: Selected backend
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown serialization backend: {name}")
+    if name == OrjsonBackend.name and orjson is None:
+        raise ValueError("orjson serialization backend is not installed")
+
+    backend = BACKENDS[name]()
+    _selected_backend["backend"] = backend
+    return backend
+
+
+def get_backend() -> JSONBackend:
+    """
+    Get the serialization backend, selecting it on first use.
+
+    Returns:
+        JSONBackend: Backend named by SERIALIZATION_BACKEND, otherwise orjson if it is
+                     installed, otherwise json
+    """
+    backend = _selected_backend.get("backend")
+    if backend is None:
+        default = OrjsonBackend.name if orjson is not None else JSONBackend.name
+        return set_backend(os.getenv("SERIALIZATION_BACKEND", default))
+    return backend
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON with the selected backend.
+
+    Args:
+        value (Any): Value to serialize. Models, enums and dates are supported.
+
+    Returns:
+        bytes: JSON document
+    """
+    return get_backend().dumps(value)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document with the selected backend.
+
+    Args:
+        data (Union[bytes, str]): JSON document
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    return get_backend().loads(data)
+
+
+def model_to_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model to bytes, identical to model_dump_json().encode().
+
+    Args:
+        model (BaseModel): Model to serialize
+
+    Returns:
+        bytes: JSON document
+    """
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def model_from_json(model_class: Type[ModelT], data: Union[bytes, str]) -> ModelT:
+    """
+    Parse and validate a model from a JSON document in a single pass.
+
+    Args:
+        model_class (Type[ModelT]): Model class to build
+        data (Union[bytes, str]): JSON document
+
+    Returns:
+        ModelT: Validated model
+
+    Raises:
+        pydantic.ValidationError: If the document is invalid JSON or fails validation
+    """
+    return model_class.model_validate_json(data)
@@ -3,25 +3,90 @@ Module for handling storage of questions and publications in Amazon S3 and param
 
 This module provides the S3Storage class which handles saving question and publication 
 objects to S3, including their associated metadata, and the SSMStorage class for storing
-parameters in SSM Parameter Store. It uses boto3 for AWS operations and includes logging 
-and metrics via AWS Lambda Powertools.
+parameters in SSM Parameter Store. It uses boto3 for AWS operations, or the in-process
+service backend selected by SERVICE_BACKEND, and includes logging and metrics via AWS
+Lambda Powertools.
 """
 
-import json
+import hashlib
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import boto3
 import boto3.exceptions
 import botocore.exceptions
+from botocore.config import Config
+from pydantic import BaseModel
 from aws_lambda_powertools import Logger, Metrics
 
-from models import Question, Publication
+import backends
+from models import Question, Publication, PublicationDocument, PublicationFile
+from serialization import dumps, loads
 
 logger = Logger()
 metrics = Metrics()
 
-s3_client = boto3.client("s3")
-ssm_client = boto3.client("ssm")
+MAX_SAVE_WORKERS = 16
+# Each worker buffers at most one multipart part, so memory is bounded by workers x part size
+MAX_PUBLICATION_FILE_WORKERS = 8
+SAVE_MAX_ATTEMPTS = 4
+SAVE_BASE_DELAY = 0.1
+RETRYABLE_S3_ERROR_CODES = (
+    "SlowDown",
+    "RequestTimeout",
+    "InternalError",
+    "ServiceUnavailable",
+    "500",
+    "503",
+)
+
+# Sized so every save_questions worker has its own connection
+s3_client = backends.client("s3", config=Config(max_pool_connections=MAX_SAVE_WORKERS))
+ssm_client = backends.client("ssm")
+
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+CONTENT_HASH_METADATA_KEY = "content-sha256"
+
+
+def content_hash(body: Union[bytes, str]) -> str:
+    """Hash a canonical serialization for change detection.
+
+    Args:
+        body (Union[bytes, str]): Serialized object, str is hashed as UTF-8
+
+    Returns:
+        str: Hex encoded SHA-256 digest of the body
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+def is_retryable_save_error(error: Exception) -> bool:
+    """Check if a failed S3 write is worth retrying.
+
+    Args:
+        error (Exception): Error raised by the write
+
+    Returns:
+        bool: True for throttling, server and connection errors
+    """
+    if isinstance(error, botocore.exceptions.ClientError):
+        return error.response["Error"]["Code"] in RETRYABLE_S3_ERROR_CODES
+    return isinstance(
+        error, (botocore.exceptions.BotoCoreError, boto3.exceptions.S3UploadFailedError)
+    )
+
+
+class SaveReport(BaseModel):
+    """Model representing the outcome of saving a batch of objects."""
+
+    written: List[str] = []
+    skipped: List[str] = []
+    failed: Dict[str, str] = {}
 
 
 class SSMStorage:
@@ -75,16 +140,80 @@ class SSMStorage:
 
         return datetime.strptime(response["Parameter"]["Value"], "%Y-%m-%d")
 
+    def get_value(self) -> Optional[str]:
+        """Retrieve the raw parameter value from SSM Parameter Store.
+
+        Returns:
+            str: Parameter value, or None if the parameter does not exist
+
+        Raises:
+            botocore.exceptions.ClientError: If retrieving from SSM fails
+        """
+        try:
+            response = ssm_client.get_parameter(Name=self.ssm_parameter_key)
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] == "ParameterNotFound":
+                return None
+            logger.warning("Failed to retrieve parameter from SSM: %s", e)
+            raise e
+
+        return response["Parameter"]["Value"]
+
+    def delete_parameter(self):
+        """Delete the parameter from SSM Parameter Store, if it exists.
+
+        Raises:
+            botocore.exceptions.ClientError: If deleting from SSM fails
+        """
+        try:
+            ssm_client.delete_parameter(Name=self.ssm_parameter_key)
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] == "ParameterNotFound":
+                return
+            logger.warning("Failed to delete parameter from SSM: %s", e)
+            raise e
+
 class S3Storage:
     """Class for handling storage of questions and publications in S3."""
 
-    def __init__(self, bucket_name):
+    def __init__(self, bucket_name, part_size: int = MULTIPART_PART_SIZE):
         """Initialize S3Storage with bucket name.
 
         Args:
             bucket_name (str): Name of the S3 bucket to use for storage
+            part_size (int): Size of each part of a multipart upload, at least 5 MiB
         """
         self.bucket_name = bucket_name
+        self.part_size = part_size
+
+    def question_key(self, question: Question) -> str:
+        """Build the S3 key for a question.
+
+        Args:
+            question (Question): Question object
+
+        Returns:
+            str: Key following the pattern question_type=written/year=YYYY/month=MM/day=DD/question_id.json
+        """
+        return f"question_type=written/year={question.date_tabled.year:04d}/month={question.date_tabled.month:02d}/day={question.date_tabled.day:02d}/{question.id}.json" # pylint: disable=line-too-long
+
+    def get_content_hash(self, key: str) -> Optional[str]:
+        """Get the content hash stored in an object's metadata.
+
+        Args:
+            key (str): Key of the object
+
+        Returns:
+            str: Content hash, or None if the object does not exist, has no hash or cannot be read
+        """
+        try:
+            response = s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                logger.warning("Failed to read metadata for %s: %s", key, e)
+            return None
+
+        return response.get("Metadata", {}).get(CONTENT_HASH_METADATA_KEY)
 
     def save_question(self, question: Question):
         """Save a question object to S3 in JSON format.
@@ -92,6 +221,10 @@ class S3Storage:
         The question is saved with a key following the pattern:
         question_type=written/year=YYYY/month=MM/day=DD/question_id.json
 
+        A SHA-256 hash of the JSON is stored in the object metadata. If the stored
+        object already has the same hash the write is skipped, so unchanged questions
+        do not trigger knowledge base ingestion or crawls.
+
         Args:
             question (Question): Question object to save
 
@@ -101,12 +234,37 @@ class S3Storage:
         Raises:
             boto3.exceptions.S3UploadFailedError: If upload to S3 fails or response is invalid
         """
-        key = f"question_type=written/year={question.date_tabled.year:04d}/month={question.date_tabled.month:02d}/day={question.date_tabled.day:02d}/{question.id}.json" # pylint: disable=line-too-long
-        logger.debug("Saving %s to S3", key)
-        metrics.add_metric(name="QuestionSaveS3", unit="Count", value=1)
+        if self._put_question(question):
+            metrics.add_metric(name="QuestionSaveS3", unit="Count", value=1)
+        return question.id
+
+    def _put_question(self, question: Question) -> bool:
+        """Write a question to S3 unless the stored object is unchanged.
 
+        Args:
+            question (Question): Question object to save
+
+        Returns:
+            bool: True if the question was written, False if it was skipped
+
+        Raises:
+            boto3.exceptions.S3UploadFailedError: If upload to S3 fails or response is invalid
+        """
+        key = self.question_key(question)
+        body = question.to_json()
+        body_hash = content_hash(body)
+
+        if self.get_content_hash(key) == body_hash:
+            logger.debug("Skipping unchanged %s", key)
+            metrics.add_metric(name="QuestionSaveSkipped", unit="Count", value=1)
+            return False
+
+        logger.debug("Saving %s to S3", key)
         response = s3_client.put_object(
-            Body=question.model_dump_json(), Bucket=self.bucket_name, Key=key
+            Body=body,
+            Bucket=self.bucket_name,
+            Key=key,
+            Metadata={CONTENT_HASH_METADATA_KEY: body_hash},
         )
 
         if (
@@ -115,19 +273,194 @@ class S3Storage:
         ):
             raise boto3.exceptions.S3UploadFailedError
 
-        return question.id
+        metrics.add_metric(name="QuestionSaveWritten", unit="Count", value=1)
+        return True
+
+    def _put_question_with_retry(self, question: Question) -> bool:
+        """Write a question to S3, retrying transient errors with jittered backoff.
 
-    def save_publication(self, file: dict, publication: Publication, web_base_uri: str):
-        """Save a publication file and its metadata to S3.
+        Args:
+            question (Question): Question object to save
 
-        Saves both the publication file and a separate metadata JSON file with the same key
-        plus '.metadata.json' suffix. The files are saved under a key following the pattern:
-        document_type=publication/committee_id=<id>/<filename>
+        Returns:
+            bool: True if the question was written, False if it was skipped
+
+        Raises:
+            Exception: The last error if the write is not retryable or every attempt failed
+        """
+        for attempt in range(SAVE_MAX_ATTEMPTS):
+            try:
+                return self._put_question(question)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if attempt + 1 == SAVE_MAX_ATTEMPTS or not is_retryable_save_error(e):
+                    raise e
+                # Full jitter spreads retries from concurrent workers
+                delay = random.uniform(0, SAVE_BASE_DELAY * (2 ** attempt))
+                logger.debug("Retrying question %s in %.2fs: %s", question.id, delay, e)
+                time.sleep(delay)
+        return False
+
+    def save_questions(
+        self, questions: Iterable[Question], max_workers: int = MAX_SAVE_WORKERS
+    ) -> SaveReport:
+        """Save a batch of questions to S3 concurrently.
+
+        Each question is saved as by save_question, on a bounded thread pool sharing the
+        S3 client's connection pool. Transient errors are retried per object with
+        jittered exponential backoff, and a question that still fails does not stop
+        the rest of the batch.
 
         Args:
-            file (dict): Dictionary containing publication file data in 'data' key
+            questions (Iterable[Question]): Questions to save, the last of any with the
+                same key is saved
+            max_workers (int): Maximum number of concurrent writes
+
+        Returns:
+            SaveReport: Keys written, keys skipped as unchanged, and failed keys with
+                        their errors
+        """
+        questions = {self.question_key(question): question for question in questions}
+        report = SaveReport()
+        if not questions:
+            return report
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(questions))) as executor:
+            futures = {
+                key: executor.submit(self._put_question_with_retry, question)
+                for key, question in questions.items()
+            }
+            for key, future in futures.items():
+                try:
+                    if future.result():
+                        report.written.append(key)
+                    else:
+                        report.skipped.append(key)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning("Failed to save %s to S3: %s", key, e)
+                    report.failed[key] = str(e)
+
+        metrics.add_metric(name="QuestionSaveS3", unit="Count", value=len(report.written))
+        metrics.add_metric(name="QuestionSaveFailed", unit="Count", value=len(report.failed))
+        logger.info(
+            "Saved questions: %s written, %s skipped, %s failed",
+            len(report.written),
+            len(report.skipped),
+            len(report.failed),
+        )
+        return report
+
+    def publication_key(
+        self,
+        publication: Publication,
+        file: Optional[PublicationFile] = None,
+        document: Optional[PublicationDocument] = None,
+    ) -> str:
+        """Build the S3 key for a publication file.
+
+        The publication and document IDs are part of the key, so files with the same name
+        in different publications or documents do not overwrite each other.
+
+        Args:
+            publication (Publication): Publication object containing the file name
+            file (PublicationFile, optional): File of the publication. Defaults to the
+                first file of the document.
+            document (PublicationDocument, optional): Document the file belongs to.
+                Defaults to the first document.
+
+        Returns:
+            str: Key following the pattern
+                document_type=publication/committee_id=<id>/publication_id=<id>/document_id=<id>/<filename>
+        """
+        document = document or publication.documents[0]
+        file_name = (file or document.files[0]).filename
+        return (
+            f"document_type=publication/committee_id={publication.committee_id}"
+            f"/publication_id={publication.id}/document_id={document.id}/{file_name}"
+        )
+
+    def legacy_publication_key(self, publication: Publication) -> str:
+        """Build the S3 key a publication was saved under before keys included its IDs.
+
+        Only the first file of the first document was saved, keyed by the committee ID
+        and file name.
+
+        Args:
+            publication (Publication): Publication object containing the file name
+
+        Returns:
+            str: Key following the pattern document_type=publication/committee_id=<id>/<filename>
+        """
+        file_name = publication.documents[0].files[0].filename
+        return f"document_type=publication/committee_id={publication.committee_id}/{file_name}"
+
+    def remove_legacy_publication(self, publication: Publication, web_base_uri: str) -> bool:
+        """Delete the copy of a publication saved under its legacy key, and its metadata.
+
+        The legacy key is shared by every publication of the committee with the same
+        file name, so the object is only deleted if its metadata has this publication's
+        canonical URL.
+
+        Args:
+            publication (Publication): Publication object containing metadata
+            web_base_uri (str): Base URI for constructing canonical URLs
+
+        Returns:
+            bool: True if a legacy copy of the publication was deleted
+        """
+        legacy_key = self.legacy_publication_key(publication)
+        try:
+            response = s3_client.get_object(
+                Bucket=self.bucket_name, Key=f"{legacy_key}.metadata.json"
+            )
+            metadata = loads(response["Body"].read())
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                logger.warning("Failed to read metadata for %s: %s", legacy_key, e)
+            return False
+        except ValueError as e:
+            logger.warning("Invalid metadata for %s: %s", legacy_key, e)
+            return False
+
+        expected = self.build_publication_metadata(publication, web_base_uri)
+        canonical_url = metadata.get("metadataAttributes", {}).get("canonicalURL")
+        if canonical_url != expected["metadataAttributes"]["canonicalURL"]:
+            return False
+
+        try:
+            s3_client.delete_object(Bucket=self.bucket_name, Key=legacy_key)
+            s3_client.delete_object(Bucket=self.bucket_name, Key=f"{legacy_key}.metadata.json")
+        except botocore.exceptions.ClientError as e:
+            logger.warning("Failed to delete legacy publication %s: %s", legacy_key, e)
+            return False
+
+        logger.info("Deleted legacy publication %s", legacy_key)
+        metrics.add_metric(name="PublicationLegacyKeyDeleted", unit="Count", value=1)
+        return True
+
+    def save_publication_stream(
+        self,
+        chunks: Iterable[bytes],
+        publication: Publication,
+        web_base_uri: str,
+        *,
+        document: Optional[PublicationDocument] = None,
+        file: Optional[PublicationFile] = None,
+    ):
+        """Save a publication file streamed in chunks, and its metadata, to S3.
+
+        Chunks are buffered into parts of self.part_size bytes and sent as a multipart upload,
+        so memory use is bounded by the part size rather than the file size. Files smaller
+        than one part are saved with a single put_object. The file is saved under the key from
+        publication_key, with its metadata in a file with the same key plus '.metadata.json' suffix.
+
+        Args:
+            chunks (Iterable[bytes]): Chunks of the publication file
             publication (Publication): Publication object containing metadata
             web_base_uri (str): Base URI for constructing canonical URLs
+            document (PublicationDocument, optional): Document the file belongs to.
+                Defaults to the first document.
+            file (PublicationFile, optional): File being saved. Defaults to the first
+                file of the first document.
 
         Returns:
             dict: Response from S3 put_object operation for metadata file
@@ -135,24 +468,170 @@ class S3Storage:
         Raises:
             botocore.exceptions.ClientError: If upload of either file or metadata to S3 fails
         """
+        object_key = self.publication_key(publication, file, document)
+        part_size = self.part_size
+        upload_id = None
+        parts = []
+        buffer = bytearray()
+
         try:
-            file_content = file["data"]
-            committee_id = publication.committee_id
-            file_name = publication.documents[0].files[0].filename
-            object_key = f"document_type=publication/committee_id={str(committee_id)}/{file_name}"
-            response = s3_client.put_object(
-                Bucket=self.bucket_name, Key=object_key, Body=file_content
-            )
-        except botocore.exceptions.ClientError as e:
+            for chunk in chunks:
+                buffer.extend(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        upload_id = s3_client.create_multipart_upload(
+                            Bucket=self.bucket_name, Key=object_key
+                        )["UploadId"]
+                    parts.append(
+                        self._upload_part(object_key, upload_id, len(parts) + 1, buffer[:part_size])
+                    )
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                s3_client.put_object(
+                    Bucket=self.bucket_name, Key=object_key, Body=bytes(buffer)
+                )
+            else:
+                if buffer:
+                    parts.append(
+                        self._upload_part(object_key, upload_id, len(parts) + 1, buffer)
+                    )
+                s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception as e:
             logger.warning("Failed to save publication to S3: %s", e)
+            if upload_id is not None:
+                s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=object_key, UploadId=upload_id
+                )
             raise e
 
+        metrics.add_metric(name="PublicationUploadParts", unit="Count", value=max(len(parts), 1))
+
+        return self.save_publication_metadata(object_key, publication, web_base_uri, document)
+
+    def save_publication_files(
+        self,
+        publication: Publication,
+        open_file: Callable[[PublicationDocument, PublicationFile], Iterable[bytes]],
+        web_base_uri: str,
+        max_workers: int = MAX_PUBLICATION_FILE_WORKERS,
+    ) -> SaveReport:
+        """Save every file of every document of a publication, with metadata, to S3.
+
+        Files are downloaded and uploaded concurrently on a bounded thread pool, each
+        with save_publication_stream and its own .metadata.json file. A file that fails
+        does not stop the others. Once the first file is saved, any copy of the
+        publication under its legacy key is deleted with remove_legacy_publication.
+
+        Args:
+            publication (Publication): Publication object containing the documents
+            open_file (Callable[[PublicationDocument, PublicationFile], Iterable[bytes]]):
+                Returns the chunks of a document file, e.g.
+                ParliamentPublicationsAPIClient.iter_document_file
+            web_base_uri (str): Base URI for constructing canonical URLs
+            max_workers (int): Maximum number of files transferred at once
+
+        Returns:
+            SaveReport: Keys written and failed keys with their errors
+        """
+        files = {
+            self.publication_key(publication, file, document): (document, file)
+            for document, file in publication.iter_files()
+        }
+        report = SaveReport()
+        if not files:
+            logger.warning("Publication %s has no files", publication.id)
+            return report
+
+        def save_file(document: PublicationDocument, file: PublicationFile) -> dict:
+            return self.save_publication_stream(
+                open_file(document, file),
+                publication,
+                web_base_uri,
+                document=document,
+                file=file,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            futures = {
+                key: executor.submit(save_file, document, file)
+                for key, (document, file) in files.items()
+            }
+            for key, future in futures.items():
+                try:
+                    future.result()
+                    report.written.append(key)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning("Failed to save %s to S3: %s", key, e)
+                    report.failed[key] = str(e)
+
+        # Publications saved before keys included their IDs are moved once re-ingested
+        if (
+            publication.documents[0].files
+            and self.publication_key(publication) in report.written
+        ):
+            self.remove_legacy_publication(publication, web_base_uri)
+
+        metrics.add_metric(name="PublicationFilesSaved", unit="Count", value=len(report.written))
+        metrics.add_metric(name="PublicationFilesFailed", unit="Count", value=len(report.failed))
+        return report
+
+    def _upload_part(
+        self, object_key: str, upload_id: str, part_number: int, data: bytearray
+    ) -> dict:
+        """Upload one part of a multipart upload.
+
+        Args:
+            object_key (str): Key of the object being uploaded
+            upload_id (str): ID of the multipart upload
+            part_number (int): Number of the part, starting at 1
+            data (bytearray): Content of the part
+
+        Returns:
+            dict: Part number and ETag for completing the upload
+        """
+        response = s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=bytes(data),
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def save_publication_metadata(
+        self,
+        object_key: str,
+        publication: Publication,
+        web_base_uri: str,
+        document: Optional[PublicationDocument] = None,
+    ) -> dict:
+        """Save the metadata file for a publication file saved under object_key.
+
+        Args:
+            object_key (str): Key of the publication file
+            publication (Publication): Publication object containing metadata
+            web_base_uri (str): Base URI for constructing canonical URLs
+            document (PublicationDocument, optional): Document the file belongs to.
+                Defaults to the first document.
+
+        Returns:
+            dict: Response from S3 put_object operation for metadata file
+
+        Raises:
+            botocore.exceptions.ClientError: If upload of the metadata to S3 fails
+        """
         try:
-            metadata = self.build_publication_metadata(publication, web_base_uri)
+            metadata = self.build_publication_metadata(publication, web_base_uri, document)
             response = s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=f"{object_key}.metadata.json",
-                Body=json.dumps(metadata),
+                Body=dumps(metadata),
             )
         except botocore.exceptions.ClientError as e:
             logger.warning("Failed to save publication metadata to S3: %s", e)
@@ -161,7 +640,10 @@ class S3Storage:
         return response
 
     def build_publication_metadata(
-        self, publication: Publication, web_base_uri: str
+        self,
+        publication: Publication,
+        web_base_uri: str,
+        document: Optional[PublicationDocument] = None,
     ) -> dict:
         """Build metadata dictionary for a publication.
 
@@ -171,12 +653,14 @@ class S3Storage:
         Args:
             publication (Publication): Publication object to build metadata for
             web_base_uri (str): Base URI for constructing canonical URLs
+            document (PublicationDocument, optional): Document whose web page is the
+                canonical URL. Defaults to the first document.
 
         Returns:
             dict: Metadata dictionary with committee ID and canonical URL attributes
                  in the format required for S3 storage with embedding flags
         """
-        url = f"{web_base_uri}{publication.documents[0].web_uri_path}"
+        url = f"{web_base_uri}{(document or publication.documents[0]).web_uri_path}"
 
         metadata = {
             "metadataAttributes": {
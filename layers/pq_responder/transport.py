@@ -0,0 +1,172 @@
+"""
+Module providing the pooled HTTP transport shared by the Parliament API clients.
+
+All clients draw keep-alive connections from a single requests session, created on first
+use and reused across warm Lambda invocations, with the same retry policy and connect and
+read timeouts. Connection reuse is reported as pool hit and miss metrics.
+"""
+
+import functools
+import threading
+
+import requests
+import requests.adapters
+from urllib3.util import Retry
+
+from aws_lambda_powertools import Metrics
+
+metrics = Metrics()
+
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+RETRY_STATUS_FORCELIST = (500, 502, 504)
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.4
+
+
+class ParliamentAPITransport:
+    """
+    Pooled, keep-alive HTTP transport shared by the Parliament API clients.
+
+    A single HTTPAdapter is mounted on each client's base URI, so every client
+    draws connections from the same pool and has the same retry policy and
+    connect/read timeouts applied.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        timeout: tuple = (CONNECT_TIMEOUT, READ_TIMEOUT),
+    ):
+        """
+        Initialize the transport with a session and pooled adapter.
+
+        Args:
+            pool_connections (int): Number of hosts to keep connection pools for
+            pool_maxsize (int): Maximum number of connections kept per host
+            timeout (tuple): Connect and read timeouts in seconds
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        retries = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        self.adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+        )
+
+        self._lock = threading.Lock()
+        self._recorded_stats = {"requests": 0, "connections": 0}
+
+    def mount(self, base_uri: str):
+        """
+        Apply the pooled adapter to all requests made under a base URI.
+
+        Args:
+            base_uri (str): Base URI for the API
+        """
+        with self._lock:
+            if self.session.adapters.get(base_uri) is not self.adapter:
+                self.session.mount(base_uri, self.adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request using the shared session and default timeouts.
+
+        Args:
+            url (str): URL to retrieve
+            **kwargs: Additional arguments passed to requests.Session.get
+
+        Returns:
+            requests.Response: Response from the API
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def pool_stats(self) -> dict:
+        """
+        Get connection reuse counters for the connection pools.
+
+        Returns:
+            dict: Number of requests, pool hits (requests served by a reused
+                  connection) and pool misses (new connections opened)
+        """
+        pool_manager = self.adapter.poolmanager
+        num_requests = 0
+        num_connections = 0
+
+        with pool_manager.pools.lock:
+            pools = [pool_manager.pools[key] for key in pool_manager.pools.keys()]
+
+        for pool in pools:
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+
+        return {
+            "requests": num_requests,
+            "connections": num_connections,
+            "hits": max(num_requests - num_connections, 0),
+            "misses": num_connections,
+        }
+
+    def record_pool_metrics(self):
+        """
+        Add the pool hits and misses since the last call to the metrics.
+        """
+        stats = self.pool_stats()
+
+        with self._lock:
+            requests_delta = stats["requests"] - self._recorded_stats["requests"]
+            misses = stats["connections"] - self._recorded_stats["connections"]
+            self._recorded_stats = {
+                "requests": stats["requests"],
+                "connections": stats["connections"],
+            }
+
+        if requests_delta > 0:
+            metrics.add_metric(
+                name="APIConnectionPoolHit",
+                unit="Count",
+                value=max(requests_delta - misses, 0),
+            )
+            metrics.add_metric(
+                name="APIConnectionPoolMiss", unit="Count", value=max(misses, 0)
+            )
+
+
+_transport_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_transport() -> ParliamentAPITransport:
+    return ParliamentAPITransport()
+
+
+def get_transport() -> ParliamentAPITransport:
+    """
+    Get the module level transport, creating it on first use.
+
+    Returns:
+        ParliamentAPITransport: Transport shared by all clients in the process
+    """
+    with _transport_lock:
+        return _create_transport()
+
+
+def reset_transport():
+    """
+    Remove the module level transport, so the next client creates a new one.
+    """
+    with _transport_lock:
+        _create_transport.cache_clear()
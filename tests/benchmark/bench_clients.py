@@ -0,0 +1,199 @@
+"""
+Throughput benchmarks for the Parliament API clients against the local stub API.
+
+The stub runs in its own process so it does not compete with the clients for the GIL,
+and each scenario runs in a fresh process so its peak RSS is reported in isolation.
+
+Scenarios:
+    questions          ParliamentQuestionsAPIClient.iter_questions_by_date
+    question-lookups   ParliamentQuestionsAPIClient.get_full_questions on truncated questions
+    publications       ParliamentPublicationsAPIClient.get_committee_publications_list
+    publication-files  ParliamentPublicationsAPIClient.iter_document_file
+
+Usage:
+    python tests/benchmark/bench_clients.py --latency 0.02 --total-questions 20000
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "benchmark")
+os.environ.setdefault("POWERTOOLS_METRICS_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "ERROR")
+
+# pylint: disable=wrong-import-position
+from tests.benchmark.stub_server import StubConfig, StubServer
+
+START_DATE = date(2024, 1, 1)
+END_DATE = date(2024, 1, 31)
+SCENARIOS = ["questions", "question-lookups", "publications", "publication-files"]
+
+
+def run_stub(config: StubConfig, base_uri_queue: multiprocessing.Queue):
+    """Serve the stub API in a child process, reporting its base URI."""
+    server = StubServer(config)
+    base_uri_queue.put(server.base_uri)
+    server.serve_forever()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MiB (ru_maxrss is KiB on Linux)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(scenario: str, base_uri: str, args: dict) -> dict:
+    """
+    Run one scenario against the stub.
+
+    Returns:
+        dict: Requests ("pages"), rows and elapsed seconds for the scenario
+    """
+    # pylint: disable=import-outside-toplevel
+    import parliament_api_client
+    from models import House, PublicationDocument, PublicationFile, Question, Questions
+
+    parliament_api_client.TAKE = args["page_size"]
+    start = time.perf_counter()
+
+    if scenario == "questions":
+        client = parliament_api_client.ParliamentQuestionsAPIClient(base_uri)
+        rows = sum(
+            1
+            for _ in client.iter_questions_by_date(
+                parliament_api_client.DateType.ANSWERED, START_DATE, END_DATE
+            )
+        )
+        pages = -(-args["total_questions"] // args["page_size"])
+
+    elif scenario == "question-lookups":
+        client = parliament_api_client.ParliamentQuestionsAPIClient(base_uri)
+        questions = Questions(
+            questions=[
+                Question(
+                    id=question_id,
+                    question="Truncated...",
+                    answer="Truncated...",
+                    date_tabled=START_DATE,
+                    house=House.COMMONS,
+                )
+                for question_id in range(1, args["lookups"] + 1)
+            ]
+        )
+        rows = len(client.get_full_questions(questions).questions)
+        pages = rows
+
+    elif scenario == "publications":
+        client = parliament_api_client.ParliamentPublicationsAPIClient(base_uri)
+        publications = client.get_committee_publications_list(203, START_DATE, END_DATE)
+        rows = len(publications.publications)
+        pages = -(-args["total_publications"] // args["page_size"])
+
+    elif scenario == "publication-files":
+        client = parliament_api_client.ParliamentPublicationsAPIClient(base_uri)
+        rows = 0
+        for publication_id in range(1, args["documents"] + 1):
+            document = PublicationDocument(id=publication_id, publication_id=publication_id)
+            for chunk in client.iter_document_file(document, PublicationFile(filename=f"{publication_id}.pdf")):
+                rows += len(chunk)
+        pages = args["documents"]
+
+    else:
+        raise ValueError(f"Unknown scenario: {scenario}")
+
+    return {
+        "scenario": scenario,
+        "pages": pages,
+        "rows": rows,
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the benchmark options."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--scenario", choices=SCENARIOS, action="append")
+    arg_parser.add_argument("--latency", type=float, default=0.01)
+    arg_parser.add_argument("--page-size", type=int, default=1000)
+    arg_parser.add_argument("--total-questions", type=int, default=20000)
+    arg_parser.add_argument("--total-publications", type=int, default=2000)
+    arg_parser.add_argument("--lookups", type=int, default=200)
+    arg_parser.add_argument("--documents", type=int, default=20)
+    arg_parser.add_argument("--document-size", type=int, default=1024 * 1024)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument("--error-status", type=int, default=503)
+    arg_parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="Client rate limit per endpoint family in requests/sec, 0 for none",
+    )
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return arg_parser.parse_args(argv)
+
+
+def main():
+    """Start the stub, run each scenario in a fresh process and print the results."""
+    args = parse_args()
+    for family in ("QUESTIONS", "PUBLICATIONS", "COMMITTEES"):
+        os.environ[f"PARLIAMENT_API_RATE_{family}"] = str(args.rate)
+
+    config = StubConfig(
+        latency=args.latency,
+        page_size=args.page_size,
+        total_questions=args.total_questions,
+        total_publications=args.total_publications,
+        document_size=args.document_size,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=0 if args.error_rate else None,
+    )
+
+    context = multiprocessing.get_context("spawn")
+    base_uri_queue = context.Queue()
+    stub = context.Process(target=run_stub, args=(config, base_uri_queue), daemon=True)
+    stub.start()
+
+    results = []
+    try:
+        base_uri = base_uri_queue.get(timeout=30)
+        for scenario in args.scenario or SCENARIOS:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(
+                    executor.submit(run_scenario, scenario, base_uri, vars(args)).result()
+                )
+    finally:
+        stub.terminate()
+        stub.join()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'scenario':<18} {'pages':>7} {'rows':>10} {'seconds':>8} "
+        f"{'pages/s':>9} {'rows/s':>12} {'peak RSS MB':>12}"
+    )
+    for result in results:
+        print(
+            f"{result['scenario']:<18} {result['pages']:>7} {result['rows']:>10} "
+            f"{result['seconds']:>8.2f} {result['pages'] / result['seconds']:>9.1f} "
+            f"{result['rows'] / result['seconds']:>12,.0f} {result['peak_rss_mb']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for decoding pages of Parliament API question results.
+
+Compares the fast decoder used by ParliamentQuestionsAPIClient with full pydantic
+validation and dateutil parsing of every row, using pages built from
+tests/mock_data/mock_api_questions.py.
+
+Usage:
+    python tests/benchmark/bench_decode.py [--rows 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "benchmark")
+
+# pylint: disable=wrong-import-position
+from decoding import _validate_api_question, decode_api_questions
+from tests.mock_data.mock_api_questions import MockAPIQuestions
+
+
+def build_page(rows: int) -> list:
+    """Build a page of API results by repeating the mock results with unique IDs."""
+    results = MockAPIQuestions().mock_api_questions["results"]
+    page = []
+    for index in range(rows):
+        api_question = results[index % len(results)]
+        page.append({"value": {**api_question["value"], "id": index + 1}})
+    return page
+
+
+def main():
+    """Run the benchmark and print rows per second for each decoder."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    page = build_page(args.rows)
+
+    fast = list(decode_api_questions(page))
+    validated = [_validate_api_question(api_question["value"]) for api_question in page]
+    assert [q.model_dump_json() for q in fast] == [q.model_dump_json() for q in validated]
+
+    timings = {
+        "validated": min(
+            timeit.repeat(
+                lambda: [_validate_api_question(api_question["value"]) for api_question in page],
+                number=1,
+                repeat=args.repeat,
+            )
+        ),
+        "fast": min(
+            timeit.repeat(lambda: list(decode_api_questions(page)), number=1, repeat=args.repeat)
+        ),
+    }
+
+    for name, seconds in timings.items():
+        print(f"{name:>10}: {seconds * 1000:8.2f} ms/page {args.rows / seconds:12,.0f} rows/s")
+    print(f"   speedup: {timings['validated'] / timings['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
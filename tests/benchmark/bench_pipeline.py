@@ -0,0 +1,348 @@
+"""
+End-to-end benchmark of the questions pipeline, run in-process against local backends.
+
+The real Lambda handlers are run in this process. The queue, buckets and parameters
+are provided by the in-process service backends in layers/pq_responder/backends.py,
+and the Parliament API is the stub in tests/benchmark/stub_server.py, which runs in its
+own process:
+    api_get_questions  fetches answered questions from the stub and queues them
+    QuestionQueue      in-process SQS queue
+    save_question      consumers poll the queue, as the SQS event source mapping
+                       would, and invoke the handler with an SQS event
+    QuestionsBucket    in-process S3 bucket
+
+Consumers start before the producer so, as in production, questions are saved while
+later pages are still being fetched. A message whose invocation fails is returned to
+the queue and dropped after --max-receives attempts, as it would be to the dead letter
+queue. Knowledge base ingestion is not emulated. The stub ignores dates, so with
+--shard-size every shard queues the same questions and fewer are stored than queued.
+
+Reported:
+    end-to-end questions/s  questions stored / wall time from first fetch to last save
+    per stage latency       api_get_questions invocation, time each message waited in
+                            the queue, each save_question invocation, and end-to-end
+                            latency of each message from being sent to being saved
+    memory                  peak RSS of this process and bytes held by the backend
+
+Usage:
+    python tests/benchmark/bench_pipeline.py --total-questions 5000 --packing gzip
+    python tests/benchmark/bench_pipeline.py --backend local --consumers 4 --latency 0.05
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+# pylint: disable=wrong-import-position
+from tests.benchmark.bench_clients import END_DATE, START_DATE, peak_rss_mb, run_stub
+from tests.benchmark.stub_server import StubConfig
+from tests.mock_data.mock_lambda_context import LambdaContext
+
+QUEUE_URL = "https://sqs.local/000000000000/QuestionQueue"
+QUESTIONS_BUCKET = "questions-bucket"
+CLAIM_CHECK_BUCKET = "claim-check-bucket"
+LAST_RUN_PARAMETER = "/benchmark/QuestionsAPIGetQuestionsLastRun"
+POLL_INTERVAL = 0.005
+
+
+def configure_environment(args: argparse.Namespace, base_uri: str, backend_dir: str):
+    """Set the handler and backend environment before the layer modules are imported."""
+    os.environ.update(
+        {
+            "SERVICE_BACKEND": args.backend,
+            "SERVICE_BACKEND_DIR": backend_dir,
+            "QUESTION_API_BASE_URI": base_uri,
+            "QUESTION_QUEUE": QUEUE_URL,
+            "QUESTIONS_BUCKET": QUESTIONS_BUCKET,
+            "CLAIM_CHECK_BUCKET": CLAIM_CHECK_BUCKET,
+            "LAST_RUN_PARAMETER": LAST_RUN_PARAMETER,
+            "BACKFILL_CHECKPOINT_PREFIX": "/benchmark/QuestionsBackfill",
+            "QUESTION_MESSAGE_PACKING": args.packing,
+        }
+    )
+    for family in ("QUESTIONS", "PUBLICATIONS", "COMMITTEES"):
+        os.environ[f"PARLIAMENT_API_RATE_{family}"] = str(args.rate)
+
+
+def sent_at(message_id: str) -> float:
+    """Send time of an in-process SQS message, encoded in its ID, in perf_counter seconds."""
+    age = time.time_ns() - int(message_id.split("-", 1)[0])
+    return time.perf_counter() - age / 1e9
+
+
+def sqs_event(messages: List[dict]) -> dict:
+    """Build the SQS event the event source mapping would deliver for received messages."""
+    return {
+        "Records": [
+            {
+                "messageId": message["MessageId"],
+                "receiptHandle": message["ReceiptHandle"],
+                "body": message["Body"],
+                "attributes": {"ApproximateReceiveCount": "1"},
+                "messageAttributes": {},
+                "md5OfBody": message["MD5OfBody"],
+                "eventSource": "aws:sqs",
+                "eventSourceARN": "arn:aws:sqs:us-east-1:000000000000:QuestionQueue",
+                "awsRegion": "us-east-1",
+            }
+            for message in messages
+        ]
+    }
+
+
+class Consumers:
+    """Poll the queue and invoke the save_question handler, like the event source mapping."""
+
+    def __init__(self, handler, sqs_client, args: argparse.Namespace):
+        self.handler = handler
+        self.sqs_client = sqs_client
+        self.args = args
+        self.producer_done = threading.Event()
+        self.lock = threading.Lock()
+        self.invocations = []
+        self.queue_waits = []
+        self.end_to_end = []
+        self.failed_invocations = 0
+        self.dropped_messages = 0
+        self.receive_counts = {}
+        self.last_saved = None
+
+    def run(self):
+        """Invoke the handler until the producer is done and the queue is empty."""
+        while True:
+            response = self.sqs_client.receive_message(
+                QueueUrl=QUEUE_URL, MaxNumberOfMessages=self.args.batch_size
+            )
+            messages = response.get("Messages", [])
+            if not messages:
+                if self.producer_done.is_set():
+                    return
+                time.sleep(POLL_INTERVAL)
+                continue
+            self.invoke(messages)
+
+    def invoke(self, messages: List[dict]):
+        """Invoke the handler for one batch, deleting or returning its messages."""
+        received = time.perf_counter()
+        waits = [received - sent_at(message["MessageId"]) for message in messages]
+        context = LambdaContext({"aws_request_id": str(uuid.uuid4())})
+        try:
+            payload = self.handler(sqs_event(messages), context)
+            failed_ids = {item["itemIdentifier"] for item in payload["batchItemFailures"]}
+        except Exception:  # pylint: disable=broad-exception-caught
+            failed_ids = {message["MessageId"] for message in messages}
+        saved = time.perf_counter()
+
+        with self.lock:
+            self.invocations.append(saved - received)
+            self.queue_waits.extend(waits)
+            if failed_ids:
+                self.failed_invocations += 1
+            retry = []
+            for message, wait in zip(messages, waits):
+                handle = message["ReceiptHandle"]
+                if message["MessageId"] not in failed_ids:
+                    self.end_to_end.append(saved - received + wait)
+                    self.last_saved = saved
+                    self.sqs_client.delete_message(QueueUrl=QUEUE_URL, ReceiptHandle=handle)
+                    continue
+                self.receive_counts[handle] = self.receive_counts.get(handle, 0) + 1
+                if self.receive_counts[handle] >= self.args.max_receives:
+                    self.dropped_messages += 1
+                    self.sqs_client.delete_message(QueueUrl=QUEUE_URL, ReceiptHandle=handle)
+                else:
+                    retry.append(handle)
+            if retry:
+                self.sqs_client.release_messages(QueueUrl=QUEUE_URL, ReceiptHandles=retry)
+
+
+def summarize(values: List[float]) -> dict:
+    """Percentiles of a list of latencies in milliseconds."""
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def run_pipeline(args: argparse.Namespace, base_uri: str, backend_dir: str) -> dict:
+    """Run the producer and consumers against the stub and report throughput."""
+    configure_environment(args, base_uri, backend_dir)
+
+    # pylint: disable=import-outside-toplevel
+    import backends
+    import parliament_api_client
+    from functions.api_get_questions.app import lambda_handler as get_questions
+    from functions.save_question.app import lambda_handler as save_question
+
+    parliament_api_client.TAKE = args.page_size
+    store = backends.get_store()
+    sqs_client = backends.client("sqs")
+    backends.client("ssm").put_parameter(
+        Name=LAST_RUN_PARAMETER, Value="null", Type="String", Overwrite=True
+    )
+
+    event = {"startDate": START_DATE.isoformat(), "endDate": END_DATE.isoformat()}
+    if args.shard_size:
+        event["shardSize"] = args.shard_size
+
+    consumers = Consumers(save_question, sqs_client, args)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.consumers) as executor:
+        workers = [executor.submit(consumers.run) for _ in range(args.consumers)]
+        try:
+            payload = get_questions(event, LambdaContext())
+            produced = time.perf_counter()
+        finally:
+            consumers.producer_done.set()
+        for worker in workers:
+            worker.result()
+
+    finished = consumers.last_saved or time.perf_counter()
+    stored = len(store.keys(f"s3/{QUESTIONS_BUCKET}", "question_type=written/"))
+    queued = payload["body"].get("Count", 0) if isinstance(payload["body"], dict) else 0
+
+    return {
+        "backend": args.backend,
+        "packing": args.packing,
+        "consumers": args.consumers,
+        "producer_status": payload["statusCode"],
+        "questions_queued": queued,
+        "questions_stored": stored,
+        "messages": len(consumers.queue_waits),
+        "failed_invocations": consumers.failed_invocations,
+        "dropped_messages": consumers.dropped_messages,
+        "seconds": finished - start,
+        "questions_per_second": stored / (finished - start),
+        "stages": {
+            "api_get_questions": {
+                "seconds": produced - start,
+                "questions_per_second": queued / (produced - start),
+            },
+            "queue_wait": summarize(consumers.queue_waits),
+            "save_question": summarize(consumers.invocations),
+            "end_to_end": summarize(consumers.end_to_end),
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "backend_mb": store.size() / (1024 * 1024),
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the benchmark options."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--backend", choices=["memory", "local"], default="memory")
+    arg_parser.add_argument("--backend-dir", help="Directory for the local backend")
+    arg_parser.add_argument("--packing", choices=["none", "json", "gzip"], default="gzip")
+    arg_parser.add_argument("--shard-size", choices=["day", "week"])
+    arg_parser.add_argument("--consumers", type=int, default=2, help="Concurrent save_question invocations")
+    arg_parser.add_argument("--batch-size", type=int, default=1, help="SQS event source batch size")
+    arg_parser.add_argument("--max-receives", type=int, default=3)
+    arg_parser.add_argument("--latency", type=float, default=0.01)
+    arg_parser.add_argument("--page-size", type=int, default=1000)
+    arg_parser.add_argument("--total-questions", type=int, default=5000)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="Client rate limit per endpoint family in requests/sec, 0 for none",
+    )
+    arg_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return arg_parser.parse_args(argv)
+
+
+def print_report(result: dict):
+    """Print the results as a table."""
+    print(
+        f"{result['backend']} backend, {result['packing']} packing, "
+        f"{result['consumers']} consumers"
+    )
+    print(
+        f"queued {result['questions_queued']:,} questions in {result['messages']:,} messages, "
+        f"stored {result['questions_stored']:,} in {result['seconds']:.2f}s: "
+        f"{result['questions_per_second']:,.0f} questions/s end to end"
+    )
+    if result["failed_invocations"] or result["dropped_messages"]:
+        print(
+            f"{result['failed_invocations']} failed invocations, "
+            f"{result['dropped_messages']} messages dropped"
+        )
+    producer = result["stages"]["api_get_questions"]
+    print(
+        f"api_get_questions: {producer['seconds']:.2f}s, "
+        f"{producer['questions_per_second']:,.0f} questions/s"
+    )
+    print(f"\n{'stage':<16} {'count':>8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for stage in ("queue_wait", "save_question", "end_to_end"):
+        latency = result["stages"][stage]
+        if not latency["count"]:
+            print(f"{stage:<16} {0:>8}")
+            continue
+        print(
+            f"{stage:<16} {latency['count']:>8} {latency['mean_ms']:>9.1f} {latency['p50_ms']:>9.1f} "
+            f"{latency['p95_ms']:>9.1f} {latency['p99_ms']:>9.1f} {latency['max_ms']:>9.1f}"
+        )
+    print(f"\npeak RSS {result['peak_rss_mb']:.1f} MiB, backend holds {result['backend_mb']:.1f} MiB")
+
+
+def main():
+    """Start the stub, run the pipeline in this process and print the results."""
+    args = parse_args()
+    config = StubConfig(
+        latency=args.latency,
+        page_size=args.page_size,
+        total_questions=args.total_questions,
+        error_rate=args.error_rate,
+        retry_after=0 if args.error_rate else None,
+    )
+
+    context = multiprocessing.get_context("spawn")
+    base_uri_queue = context.Queue()
+    stub = context.Process(target=run_stub, args=(config, base_uri_queue), daemon=True)
+    stub.start()
+
+    backend_dir = args.backend_dir or tempfile.mkdtemp(prefix="pq-responder-bench-")
+    try:
+        base_uri = base_uri_queue.get(timeout=30)
+        # Metrics are printed as EMF whenever 100 accumulate, as they would be to CloudWatch
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            result = run_pipeline(args, base_uri, backend_dir)
+    finally:
+        stub.terminate()
+        stub.join()
+        if not args.backend_dir:
+            shutil.rmtree(backend_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Memory and time benchmark for holding large batches of questions.
+
+Compares validated Question models, Question.model_construct and slotted QuestionRecord
+instances for a batch of questions built from tests/mock_data/mock_api_questions.py,
+along with the cost of converting between records and models at the edges.
+
+Usage:
+    python tests/benchmark/bench_question_records.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "benchmark")
+
+# pylint: disable=wrong-import-position
+from models import QuestionRecord, Questions
+from decoding import (
+    _validate_api_question,
+    decode_api_question_records,
+    decode_api_questions,
+)
+from tests.benchmark.bench_decode import build_page
+
+
+def measure(build, repeat: int) -> tuple:
+    """
+    Measure the fastest build time and the memory retained by the built objects.
+
+    Returns:
+        tuple: Best seconds, retained MiB and the objects from the last build
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = build()
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, retained / (1024 * 1024), result
+
+
+def main():
+    """Run the benchmark and print time, rows per second and memory for each representation."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    page = build_page(args.rows)
+
+    builds = {
+        "validated": lambda: [
+            _validate_api_question(api_question["value"]) for api_question in page
+        ],
+        "constructed": lambda: list(decode_api_questions(page)),
+        "records": lambda: decode_api_question_records(page),
+    }
+
+    results = {name: measure(build, args.repeat) for name, build in builds.items()}
+    questions = results["constructed"][2]
+    records = results["records"][2]
+    assert [record.to_dict() for record in records] == [q.to_dict() for q in questions]
+
+    conversions = {
+        "records->questions": lambda: Questions.from_records(records),
+        "questions->records": lambda: [QuestionRecord.from_question(q) for q in questions],
+        "records->dicts": lambda: [record.to_dict() for record in records],
+        "questions->dicts": lambda: [q.to_dict() for q in questions],
+    }
+
+    print(f"{'build':<20} {'ms':>10} {'rows/s':>12} {'MiB':>8} {'bytes/row':>10}")
+    for name, (seconds, mib, _) in results.items():
+        print(
+            f"{name:<20} {seconds * 1000:>10.1f} {args.rows / seconds:>12,.0f} "
+            f"{mib:>8.1f} {mib * 1024 * 1024 / args.rows:>10.0f}"
+        )
+
+    print(f"\n{'conversion':<20} {'ms':>10} {'rows/s':>12}")
+    for name, convert in conversions.items():
+        seconds = measure(convert, args.repeat)[0]
+        print(f"{name:<20} {seconds * 1000:>10.1f} {args.rows / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
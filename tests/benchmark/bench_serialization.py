@@ -0,0 +1,99 @@
+"""
+Benchmark of end-to-end question serialization cost per batch of questions.
+
+Measures the round trip a question makes through the pipeline: serialized once to be
+queued, once to be written to S3 and hashed, then parsed back into a Question by the
+consumer. "before" is the previous path, model_dump_json on the producer and json.loads
+with Question.from_dict on the consumer. "after" is Question.to_json and
+Question.from_json through the serialization module, for each available backend.
+
+Usage:
+    python tests/benchmark/bench_serialization.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "benchmark")
+
+# pylint: disable=wrong-import-position
+import serialization
+from models import Question
+from decoding import decode_api_questions
+from tests.benchmark.bench_decode import build_page
+
+
+def before(questions: list) -> list:
+    """Serialize to queue and S3 and parse back, as the pipeline did previously."""
+    parsed = []
+    for question in questions:
+        message = question.model_dump_json()
+        body = question.model_dump_json()
+        hashlib.sha256(body.encode("utf-8")).hexdigest()
+        parsed.append(Question.from_dict(json.loads(message)))
+    return parsed
+
+
+def after(questions: list) -> list:
+    """Serialize to queue and S3 and parse back through the serialization module."""
+    parsed = []
+    for question in questions:
+        message = question.to_json()
+        body = question.to_json()
+        hashlib.sha256(body).hexdigest()
+        parsed.append(Question.from_json(message))
+    return parsed
+
+
+def main():
+    """Run the benchmark and print the cost per batch for each path."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    questions = list(decode_api_questions(build_page(args.rows)))
+    dicts = [question.to_dict() for question in questions]
+    assert after(questions) == questions
+
+    timings = {
+        "before": min(
+            timeit.repeat(lambda: before(questions), number=1, repeat=args.repeat)
+        )
+    }
+    for name in serialization.BACKENDS:
+        try:
+            backend = serialization.set_backend(name)
+        except ValueError:
+            continue
+        timings[f"after ({name})"] = min(
+            timeit.repeat(lambda: after(questions), number=1, repeat=args.repeat)
+        )
+        timings[f"dicts ({name})"] = min(
+            timeit.repeat(
+                lambda backend=backend: [backend.loads(backend.dumps(d)) for d in dicts],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+
+    for name, seconds in timings.items():
+        print(
+            f"{name:>16}: {seconds * 1000:8.1f} ms per {args.rows:,} questions "
+            f"{args.rows / seconds:12,.0f} questions/s"
+        )
+    print(
+        f"{'speedup':>16}: "
+        f"{timings['before'] / min(v for k, v in timings.items() if k.startswith('after')):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Local stub of the Parliament questions, publications and committees APIs.
+
+Responses are built from tests/mock_data and paginated with the same skip and take
+parameters as the real APIs, so the API clients can be benchmarked without touching
+the real services. Latency, page size, result counts and error injection are
+configurable.
+
+The stub serves every API under one base URI, for example http://127.0.0.1:8000/api/:
+    GET questions?skip=&take=                        Page of written questions
+    GET questions/{id}                               Single written question
+    GET publications/?skip=&take=                    Page of committee publications
+    GET committees/{id}                              Committee with sub-committees
+    GET Publications/{id}/Document/{id}/OriginalFormat  Base64 encoded document
+
+Usage:
+    python tests/benchmark/stub_server.py --port 8000 --latency 0.05 --total-questions 5000
+"""
+
+import argparse
+import base64
+import functools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel
+
+sys.path.append(os.getcwd())
+
+# pylint: disable=wrong-import-position
+from tests.mock_data.mock_api_question import MockAPIQuestion
+from tests.mock_data.mock_api_questions import MockAPIQuestions
+from tests.mock_data.mock_committee_education import MockEducationCommittee
+from tests.mock_data.mock_publication_list import MockPublicationList
+
+API_PATH = "/api/"
+
+QUESTIONS_PATTERN = re.compile(r"^questions$")
+QUESTION_PATTERN = re.compile(r"^questions/(\d+)$")
+PUBLICATIONS_PATTERN = re.compile(r"^publications/?$")
+COMMITTEE_PATTERN = re.compile(r"^committees/(\d+)$")
+DOCUMENT_PATTERN = re.compile(r"^Publications/(\d+)/Document/(\d+)/OriginalFormat$")
+
+
+class StubConfig(BaseModel):
+    """Configuration of the stub API responses."""
+
+    latency: float = 0.0
+    page_size: int = 1000
+    total_questions: int = 1000
+    total_publications: int = 100
+    document_size: int = 64 * 1024
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: Optional[int] = None
+    seed: int = 0
+
+
+class StubResponses:
+    """
+    Builds and caches the encoded response bodies for a configuration.
+
+    Rows are copies of the mock data with unique IDs, so paginated results can be
+    checked for gaps and duplicates.
+    """
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.question_rows = MockAPIQuestions().mock_api_questions["results"]
+        self.question = MockAPIQuestion().mock_api_question
+        self.publication_rows = MockPublicationList().mock_publication_list["items"]
+        self.committee = MockEducationCommittee().education_committee
+
+    @functools.lru_cache(maxsize=256)
+    def questions_page(self, skip: int, take: int) -> bytes:
+        """Encode a page of questions."""
+        results = []
+        for index in range(skip, min(skip + take, self.config.total_questions)):
+            row = self.question_rows[index % len(self.question_rows)]
+            results.append({**row, "value": {**row["value"], "id": index + 1}})
+        return json.dumps(
+            {"totalResults": self.config.total_questions, "results": results}
+        ).encode("utf-8")
+
+    def question_by_id(self, question_id: int) -> bytes:
+        """Encode a single question."""
+        return json.dumps(
+            {**self.question, "value": {**self.question["value"], "id": question_id}}
+        ).encode("utf-8")
+
+    @functools.lru_cache(maxsize=256)
+    def publications_page(self, skip: int, take: int) -> bytes:
+        """Encode a page of publications."""
+        items = []
+        for index in range(skip, min(skip + take, self.config.total_publications)):
+            item = self.publication_rows[index % len(self.publication_rows)]
+            items.append({**item, "id": index + 1})
+        return json.dumps(
+            {"totalResults": self.config.total_publications, "items": items}
+        ).encode("utf-8")
+
+    def committee_by_id(self, committee_id: int) -> bytes:
+        """Encode a committee. Only the mock committee's own ID has sub-committees."""
+        sub_committees = (
+            self.committee["subCommittees"]
+            if committee_id == self.committee["id"]
+            else []
+        )
+        return json.dumps(
+            {**self.committee, "id": committee_id, "subCommittees": sub_committees}
+        ).encode("utf-8")
+
+    @functools.cached_property
+    def document(self) -> bytes:
+        """Encode a document of document_size bytes."""
+        data = bytes(index % 251 for index in range(self.config.document_size))
+        return json.dumps({"data": base64.b64encode(data).decode("ascii")}).encode(
+            "utf-8"
+        )
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the stub responses."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve a GET request after the configured latency, or an injected error."""
+        config = self.server.config
+        if config.latency:
+            time.sleep(config.latency)
+
+        self.server.count_request()
+        if self.server.should_fail():
+            headers = {}
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+            self._send(config.error_status, b'{"error": "injected"}', headers)
+            return
+
+        parsed = urlparse(self.path)
+        if not parsed.path.startswith(API_PATH):
+            self._send(404, b'{"error": "not found"}')
+            return
+
+        body = self._route(parsed.path[len(API_PATH) :], parse_qs(parsed.query))
+        if body is None:
+            self._send(404, b'{"error": "not found"}')
+        else:
+            self._send(200, body)
+
+    def _route(self, path: str, query: dict) -> Optional[bytes]:
+        responses = self.server.responses
+        skip = int(query.get("skip", ["0"])[0])
+        take = min(
+            int(query.get("take", [str(self.server.config.page_size)])[0]),
+            self.server.config.page_size,
+        )
+
+        if QUESTIONS_PATTERN.match(path):
+            return responses.questions_page(skip, take)
+        if match := QUESTION_PATTERN.match(path):
+            return responses.question_by_id(int(match.group(1)))
+        if PUBLICATIONS_PATTERN.match(path):
+            return responses.publications_page(skip, take)
+        if match := COMMITTEE_PATTERN.match(path):
+            return responses.committee_by_id(int(match.group(1)))
+        if DOCUMENT_PATTERN.match(path):
+            return responses.document
+        return None
+
+    def _send(self, status: int, body: bytes, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging."""
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for the stub API.
+
+    Args:
+        config (StubConfig): Response configuration
+        host (str): Interface to listen on
+        port (int): Port to listen on, 0 for any free port
+    """
+
+    daemon_threads = True
+
+    def __init__(self, config: StubConfig, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), StubRequestHandler)
+        self.config = config
+        self.responses = StubResponses(config)
+        self.requests_served = 0
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_uri(self) -> str:
+        """Base URI of the stub API, ending with "/"."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    def count_request(self):
+        """Count a served request."""
+        with self._lock:
+            self.requests_served += 1
+
+    def should_fail(self) -> bool:
+        """Decide whether to inject an error into the current request."""
+        if not self.config.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+    def start(self) -> str:
+        """
+        Serve requests on a background thread.
+
+        Returns:
+            str: Base URI of the stub API
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_uri
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the stub configuration from the command line."""
+    arg_parser = argparse.ArgumentParser(description="Stub Parliament API server")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8000)
+    for name, field in StubConfig.model_fields.items():
+        arg_parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=float if field.annotation in (float, Optional[float]) else int,
+            default=field.default,
+        )
+    return arg_parser.parse_args(argv)
+
+
+def main():
+    """Run the stub server until interrupted."""
+    args = parse_args()
+    config = StubConfig(
+        **{name: getattr(args, name) for name in StubConfig.model_fields}
+    )
+    server = StubServer(config, host=args.host, port=args.port)
+    print(f"Serving stub Parliament API at {server.base_uri}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
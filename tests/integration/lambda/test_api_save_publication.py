@@ -20,4 +20,4 @@ class TestApiSavePublication:
         context = LambdaContext({})
         response = lambda_handler(event, context)
 
-        assert response["statusCode"] == 200
+        assert response == {"batchItemFailures": []}
@@ -1,10 +1,26 @@
 import pytest
 import os 
+import sys
 
 import boto3
 
 from moto import mock_aws
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Close every circuit so failures in one test do not fail fast in the next."""
+    yield
+    circuit_breaker = sys.modules.get('circuit_breaker')
+    if circuit_breaker:
+        circuit_breaker.reset_circuit_breakers()
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    """Drop buffered metrics, so they never reach the automatic flush at 100 metrics."""
+    yield
+    from aws_lambda_powertools import Metrics
+    Metrics().clear_metrics()
+
 @pytest.fixture()
 def aws_credentials():
     """Mocked AWS Credentials for moto."""
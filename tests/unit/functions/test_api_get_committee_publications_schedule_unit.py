@@ -0,0 +1,85 @@
+import pytest
+import os
+import sys
+
+sys.path.append('.')
+sys.path.append(os.path.join(os.getcwd(), 'layers', 'pq_responder'))
+
+from datetime import date, timedelta
+from unittest.mock import patch, MagicMock
+
+from functions.api_get_committee_publications_schedule.app import lambda_handler
+from tests.mock_data.mock_publication_list import MockPublicationList
+
+WATERMARK_PREFIX = '/test/PublicationsLastRun'
+
+
+class TestAPIGetCommitteePublicationsSchedule:
+
+    @pytest.fixture()
+    def schedule_environment(self, sqs_client, ssm_client, mock_parliament_committees_api_uri, monkeypatch):
+        queue = sqs_client.create_queue(QueueName='PublicationQueue')
+        monkeypatch.setenv('COMMITTEE_API_BASE_URI', mock_parliament_committees_api_uri)
+        monkeypatch.setenv('PUBLICATION_QUEUE', queue['QueueUrl'])
+        monkeypatch.setenv('COMMITTEE_IDS', '203,351')
+        monkeypatch.setenv('WATERMARK_PARAMETER_PREFIX', WATERMARK_PREFIX)
+        monkeypatch.setenv('DEFAULT_DAYS_TO_RETRIEVE', '30')
+        return queue['QueueUrl']
+
+    @patch('parliament_api_client.requests.Session.get')
+    def test_watermarks_advance_after_queueing(self, mock_get, mock_lambda_context, sqs_client, ssm_client, schedule_environment):
+        mock_response = MagicMock()
+        mock_response.json.return_value = MockPublicationList().mock_publication_list
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+        last_week = date.today() - timedelta(days=7)
+        ssm_client.put_parameter(Name=f'{WATERMARK_PREFIX}/203', Value=last_week.isoformat(), Type='String')
+
+        payload = lambda_handler({}, mock_lambda_context)
+
+        total_results = MockPublicationList().mock_publication_list['totalResults']
+        assert payload['statusCode'] == 200
+        assert payload['body'] == {'Count': 2 * total_results, 'Failed': []}
+
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        assert any(f'CommitteeId=203&StartDate={last_week.isoformat()}T00:00:00' in url for url in urls)
+        for committee_id in (203, 351):
+            watermark = ssm_client.get_parameter(Name=f'{WATERMARK_PREFIX}/{committee_id}')
+            assert watermark['Parameter']['Value'] == date.today().isoformat()
+
+        response = sqs_client.get_queue_attributes(QueueUrl=schedule_environment, AttributeNames=['ApproximateNumberOfMessages'])
+        assert int(response['Attributes']['ApproximateNumberOfMessages']) == 2 * total_results
+
+    @patch('functions.api_get_committee_publications_schedule.app.SQSQueue')
+    @patch('parliament_api_client.requests.Session.get')
+    def test_watermark_not_advanced_when_queueing_fails(self, mock_get, mock_queue, mock_lambda_context, ssm_client, schedule_environment):
+        from queueing import FailedMessage, SendReport
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = MockPublicationList().mock_publication_list
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+        mock_queue.return_value.send_messages.return_value = SendReport(
+            failed=[FailedMessage(index=0, code='AccessDenied', message='Denied')]
+        )
+
+        payload = lambda_handler({}, mock_lambda_context)
+
+        assert payload['statusCode'] == 500
+        assert sorted(payload['body']['Failed']) == [203, 351]
+        with pytest.raises(ssm_client.exceptions.ParameterNotFound):
+            ssm_client.get_parameter(Name=f'{WATERMARK_PREFIX}/203')
+
+    @patch('functions.api_get_committee_publications_schedule.app.sync_committee')
+    def test_unexpected_error_fails_only_its_committee(self, mock_sync, mock_lambda_context, schedule_environment):
+        def sync_committee(*, committee_id, **kwargs):
+            if committee_id == 203:
+                raise KeyError('totalResults')
+            return 3
+
+        mock_sync.side_effect = sync_committee
+
+        payload = lambda_handler({}, mock_lambda_context)
+
+        assert payload['statusCode'] == 500
+        assert payload['body'] == {'Count': 3, 'Failed': [203]}
@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 # from moto import mock_sqs
 
 from functions.api_get_questions.app import lambda_handler
+from queueing import FailedMessage, SendReport
 
 class TestAPIGetQuestions:
 
@@ -55,4 +56,63 @@ class TestAPIGetQuestions:
         
         mock_requests.return_value = mock_response
         payload = lambda_handler(event, context)
-        assert payload['statusCode'] == 500
\ No newline at end of file
+        assert payload['statusCode'] == 500
+
+    @patch('queueing.SQSQueue.send_packed')
+    @patch('parliament_api_client.requests.Session.get')
+    def test_api_get_questions_send_failure_keeps_last_run(self, mock_requests, mock_send_packed, mock_lambda_context, mock_parliament_questions_api_uri, mock_api_questions, ssm_client, create_sqs_queue, create_last_run_parameter):
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_api_questions
+        mock_response.status_code = 200
+        mock_requests.return_value = mock_response
+        mock_send_packed.return_value = SendReport(sent=1, failed=[FailedMessage(index=1, code='InternalError')])
+
+        event = {
+            'startDate': '2024-01-01',
+            'endDate': '2024-01-07'
+        }
+        payload = lambda_handler(event, mock_lambda_context)
+        assert payload['statusCode'] == 500
+
+        last_run = ssm_client.get_parameter(Name=os.environ['LAST_RUN_PARAMETER'])
+        assert last_run['Parameter']['Value'] == 'null'
+
+    @patch('parliament_api_client.requests.Session.get')
+    def test_api_get_questions_sharded(self, mock_requests, mock_lambda_context, mock_parliament_questions_api_uri, mock_api_questions, sqs_client, ssm_client, create_sqs_queue, create_last_run_parameter):
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_api_questions
+        mock_response.status_code = 200
+        mock_requests.return_value = mock_response
+        os.environ['BACKFILL_CHECKPOINT_PREFIX'] = '/test/QuestionsBackfill'
+
+        event = {
+            'startDate': '2024-01-01',
+            'endDate': '2024-01-07',
+            'shardSize': 'day'
+        }
+        payload = lambda_handler(event, mock_lambda_context)
+        assert payload['statusCode'] == 200
+        assert payload['body']['Count'] == 7 * mock_api_questions['totalResults']
+
+        with pytest.raises(ssm_client.exceptions.ParameterNotFound):
+            ssm_client.get_parameter(Name='/test/QuestionsBackfill/2024-01-01_2024-01-07')
+        last_run = ssm_client.get_parameter(Name=os.environ['LAST_RUN_PARAMETER'])
+        assert last_run['Parameter']['Value'] == '2024-01-07'
+
+    @patch('parliament_api_client.requests.Session.get')
+    def test_api_get_questions_sharded_resume(self, mock_requests, mock_lambda_context, mock_parliament_questions_api_uri, mock_api_questions, sqs_client, ssm_client, create_sqs_queue, create_last_run_parameter):
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_api_questions
+        mock_response.status_code = 200
+        mock_requests.return_value = mock_response
+        os.environ['BACKFILL_CHECKPOINT_PREFIX'] = '/test/QuestionsBackfill'
+        ssm_client.put_parameter(Name='/test/QuestionsBackfill/2024-01-01_2024-01-07', Value='2024-01-05', Type='String')
+
+        event = {
+            'startDate': '2024-01-01',
+            'endDate': '2024-01-07',
+            'shardSize': 'day'
+        }
+        payload = lambda_handler(event, mock_lambda_context)
+        assert payload['statusCode'] == 200
+        assert payload['body']['Count'] == 2 * mock_api_questions['totalResults']
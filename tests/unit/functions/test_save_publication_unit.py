@@ -0,0 +1,59 @@
+import copy
+import pytest
+import os
+import sys
+sys.path.append('.')
+sys.path.append(os.path.join(os.getcwd(), 'layers', 'pq_responder'))
+
+from unittest.mock import patch
+
+from tests.mock_data.mock_sqs_publication import MockSQSPublication
+
+BUCKET_NAME = 'content-bucket'
+
+
+@pytest.fixture()
+def content_bucket(s3_client, aws_region, mock_parliament_committees_api_uri):
+    s3_client.create_bucket(
+        Bucket=BUCKET_NAME,
+        CreateBucketConfiguration={'LocationConstraint': aws_region},
+    )
+    os.environ['CONTENT_BUCKET'] = BUCKET_NAME
+    os.environ['COMMITTEE_API_BASE_URI'] = mock_parliament_committees_api_uri
+    os.environ['COMMITTEE_BASE_URI'] = 'https://committees.parliament.uk/'
+    return BUCKET_NAME
+
+
+@pytest.fixture()
+def publication_event():
+    event = MockSQSPublication().mock_sqs_complete_publication
+    invalid_record = copy.deepcopy(event['Records'][0])
+    invalid_record['messageId'] = 'b3c3a6f6-5f6e-4b8e-9d0a-2f1e0c7a9d11'
+    invalid_record['body'] = '{"committee_id": 203'
+    event['Records'].append(invalid_record)
+    return event
+
+
+class TestSavePublication():
+
+    @patch('parliament_api_client.ParliamentPublicationsAPIClient.iter_document_file', return_value=[b'data'])
+    def test_save_publication_failure_reported(self, mock_iter_document_file, publication_event, mock_lambda_context, s3_client, content_bucket):
+        from functions.save_publication.app import lambda_handler
+
+        payload = lambda_handler(publication_event, mock_lambda_context)
+
+        assert payload == {'batchItemFailures': [{'itemIdentifier': 'b3c3a6f6-5f6e-4b8e-9d0a-2f1e0c7a9d11'}]}
+        keys = [item['Key'] for item in s3_client.list_objects_v2(Bucket=content_bucket)['Contents']]
+        assert keys == [
+            'document_type=publication/committee_id=203/publication_id=41590/document_id=205047/HC 970 - Persistent absence - v3-Online.pdf',
+            'document_type=publication/committee_id=203/publication_id=41590/document_id=205047/HC 970 - Persistent absence - v3-Online.pdf.metadata.json',
+        ]
+
+    @patch('parliament_api_client.ParliamentPublicationsAPIClient.iter_document_file', side_effect=ValueError('data field is incomplete'))
+    def test_save_publication_failure_raises(self, mock_iter_document_file, publication_event, mock_lambda_context, s3_client, content_bucket):
+        from functions.save_publication.app import lambda_handler, PublicationsNotSavedError
+
+        with pytest.raises(PublicationsNotSavedError):
+            lambda_handler(publication_event, mock_lambda_context)
+
+        assert 'Contents' not in s3_client.list_objects_v2(Bucket=content_bucket)
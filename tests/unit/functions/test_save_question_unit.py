@@ -1,5 +1,7 @@
+import copy
 import pytest
 import json
+import requests
 import os
 import sys
 sys.path.append('.')
@@ -32,7 +34,7 @@ class TestSaveQuestion():
         context = mock_lambda_context
         
         payload = lambda_handler(event, context)
-        assert payload['statusCode'] == 200
+        assert payload == {'batchItemFailures': []}
 
         json_question = json.loads(event['Records'][0]['body'])
         question = Question(
@@ -62,13 +64,14 @@ class TestSaveQuestion():
         mock_response.text = json.dumps(mock_api_question)
         mock_response.json.return_value = mock_api_question
         mock_response.status_code = 200
+        mock_response.headers = {}
 
         event = mock_sqs_incomplete_question
         context = mock_lambda_context
         
         mock_requests.return_value = mock_response
         payload = lambda_handler(event, context)
-        assert payload['statusCode'] == 200
+        assert payload == {'batchItemFailures': []}
 
         json_question = json.loads(event['Records'][0]['body'])
         question = Question(
@@ -87,3 +90,69 @@ class TestSaveQuestion():
             assert s3_object['ResponseMetadata']['HTTPStatusCode'] == 200
         else:
             assert s3_object['Body'].read().decode('utf-8') == json.dumps(question.to_dict())
+
+    @patch('parliament_api_client.requests.Session.get')
+    def test_save_question_failure_reported(self, mock_requests, mock_sqs_complete_question, mock_sqs_incomplete_question, mock_lambda_context, mock_parliament_questions_api_uri, s3_client, create_question_s3_bucket):
+        from functions.save_question.app import lambda_handler
+
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.headers = {}
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+        mock_requests.return_value = mock_response
+
+        incomplete_record = copy.deepcopy(mock_sqs_incomplete_question['Records'][0])
+        incomplete_question = json.loads(incomplete_record['body'])
+        incomplete_question['id'] = 1679417
+        incomplete_record['body'] = json.dumps(incomplete_question)
+        incomplete_record['messageId'] = 'b3c3a6f6-5f6e-4b8e-9d0a-2f1e0c7a9d11'
+        event = {'Records': [mock_sqs_complete_question['Records'][0], incomplete_record]}
+
+        payload = lambda_handler(event, mock_lambda_context)
+
+        assert payload == {'batchItemFailures': [{'itemIdentifier': incomplete_record['messageId']}]}
+        keys = [item['Key'] for item in s3_client.list_objects_v2(Bucket=os.environ['QUESTIONS_BUCKET'])['Contents']]
+        assert keys == ['question_type=written/year=2024/month=01/day=05/1679416.json']
+
+    @patch('parliament_api_client.requests.Session.get')
+    def test_save_question_failure_raises(self, mock_requests, mock_sqs_complete_question, mock_sqs_incomplete_question, mock_lambda_context, mock_parliament_questions_api_uri, s3_client, create_question_s3_bucket):
+        from functions.save_question.app import lambda_handler, QuestionsNotSavedError
+
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.headers = {}
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+        mock_requests.return_value = mock_response
+
+        complete_question = json.loads(mock_sqs_complete_question['Records'][0]['body'])
+        incomplete_question = json.loads(mock_sqs_incomplete_question['Records'][0]['body'])
+        incomplete_question['id'] = 1679417
+        event = copy.deepcopy(mock_sqs_complete_question)
+        event['Records'][0]['body'] = json.dumps({'envelope': 1, 'items': [complete_question, incomplete_question]})
+
+        with pytest.raises(QuestionsNotSavedError):
+            lambda_handler(event, mock_lambda_context)
+
+        keys = [item['Key'] for item in s3_client.list_objects_v2(Bucket=os.environ['QUESTIONS_BUCKET'])['Contents']]
+        assert keys == ['question_type=written/year=2024/month=01/day=05/1679416.json']
+
+    def test_save_question_unreadable_message_reported(self, mock_sqs_complete_question, mock_lambda_context, s3_client, create_question_s3_bucket, mock_parliament_questions_api_uri):
+        from functions.save_question.app import lambda_handler
+        from queueing import claim_check_pointer
+
+        invalid_record = copy.deepcopy(mock_sqs_complete_question['Records'][0])
+        invalid_record['messageId'] = 'b3c3a6f6-5f6e-4b8e-9d0a-2f1e0c7a9d11'
+        invalid_record['body'] = '{"envelope": 1, "items": ['
+        expired_record = copy.deepcopy(mock_sqs_complete_question['Records'][0])
+        expired_record['messageId'] = 'c4d4b7a7-6a7f-4c9f-8e1b-3a2f1d8b0e22'
+        expired_record['body'] = claim_check_pointer(os.environ['QUESTIONS_BUCKET'], 'claim-check/expired.json').decode()
+        event = {'Records': [mock_sqs_complete_question['Records'][0], invalid_record, expired_record]}
+
+        payload = lambda_handler(event, mock_lambda_context)
+
+        assert payload == {'batchItemFailures': [
+            {'itemIdentifier': invalid_record['messageId']},
+            {'itemIdentifier': expired_record['messageId']},
+        ]}
+        keys = [item['Key'] for item in s3_client.list_objects_v2(Bucket=os.environ['QUESTIONS_BUCKET'])['Contents']]
+        assert keys == ['question_type=written/year=2024/month=01/day=05/1679416.json']
@@ -0,0 +1,180 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+from datetime import date, timedelta
+
+import aiohttp
+import pytest
+
+import async_parliament_api_client
+import parliament_api_client
+import rate_limiting
+
+from async_parliament_api_client import (
+    AsyncParliamentCommitteesAPIClient,
+    AsyncParliamentPublicationsAPIClient,
+    AsyncParliamentQuestionsAPIClient,
+    run_sync,
+)
+from circuit_breaker import CircuitOpenError, get_circuit_breaker
+from models import House, PublicationDocument, PublicationFile, Question, Questions
+from parliament_api_client import (
+    DateType,
+    ParliamentCommitteesAPIClient,
+    ParliamentPublicationsAPIClient,
+    ParliamentQuestionsAPIClient,
+)
+from tests.benchmark.stub_server import StubConfig, StubServer
+
+START_DATE = date(2024, 1, 1)
+END_DATE = date(2024, 1, 7)
+
+
+@pytest.fixture()
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(rate_limiting, "_rate_limiters", {})
+    for family in ("QUESTIONS", "PUBLICATIONS", "COMMITTEES"):
+        monkeypatch.setenv(f"PARLIAMENT_API_RATE_{family}", "0")
+
+
+@pytest.fixture()
+def page_size(monkeypatch):
+    monkeypatch.setattr(parliament_api_client, "TAKE", 50)
+    monkeypatch.setattr(async_parliament_api_client, "TAKE", 50)
+    return 50
+
+
+class TestAsyncParliamentAPIClients:
+    def test_validation(self):
+        """
+        Test that the async clients validate the base URI and dates like the sync clients
+        """
+        with pytest.raises(ValueError):
+            AsyncParliamentQuestionsAPIClient("not a uri")
+
+        client = AsyncParliamentQuestionsAPIClient("https://example.com/api/")
+        with pytest.raises(ValueError):
+            client.iter_questions_by_date(DateType.TABLED, END_DATE, START_DATE)
+        with pytest.raises(ValueError):
+            run_sync(
+                AsyncParliamentPublicationsAPIClient(
+                    "https://example.com/api/"
+                ).get_committee_publications_list(
+                    203, START_DATE, date.today() + timedelta(days=1)
+                )
+            )
+
+    def test_questions_match_sync_client(self, no_rate_limit, page_size):
+        """
+        Test that every page of questions is fetched once, in order, as the same models
+        """
+        async def get_questions(base_uri):
+            async with AsyncParliamentQuestionsAPIClient(base_uri) as client:
+                return await client.get_questions_by_date(DateType.ANSWERED, START_DATE, END_DATE)
+
+        with StubServer(StubConfig(page_size=page_size, total_questions=420)) as server:
+            questions = run_sync(get_questions(server.base_uri))
+            requests_served = server.requests_served
+            expected = ParliamentQuestionsAPIClient(server.base_uri).get_questions_by_date(
+                DateType.ANSWERED, START_DATE, END_DATE
+            )
+
+        assert requests_served == 9
+        assert [question.id for question in questions.questions] == list(range(1, 421))
+        assert questions.questions == expected.questions
+
+    def test_full_questions_fan_out(self, no_rate_limit):
+        """
+        Test that truncated questions are retrieved concurrently and complete ones are not
+        """
+        truncated = [
+            Question(id=question_id, question="Question...", date_tabled=START_DATE, house=House.COMMONS)
+            for question_id in range(1, 101)
+        ]
+        complete = Question(
+            id=1000, question="Complete question", answer="Answer", date_tabled=START_DATE, house=House.COMMONS
+        )
+
+        async def get_full_questions(base_uri):
+            async with AsyncParliamentQuestionsAPIClient(base_uri) as client:
+                return await client.get_full_questions(Questions(questions=truncated + [complete]))
+
+        with StubServer(StubConfig()) as server:
+            questions = run_sync(get_full_questions(server.base_uri))
+            requests_served = server.requests_served
+
+        assert requests_served == 100
+        assert [question.id for question in questions.questions] == list(range(1, 101)) + [1000]
+        assert questions.questions[-1] == complete
+
+    def test_publications_committees_and_files(self, no_rate_limit, page_size):
+        """
+        Test the publications and committees clients against the stub shapes
+        """
+        document = PublicationDocument(id=1, publication_id=1)
+        file = PublicationFile(filename="1.pdf")
+
+        async def fetch(base_uri):
+            async with AsyncParliamentPublicationsAPIClient(
+                base_uri
+            ) as publications, AsyncParliamentCommitteesAPIClient(base_uri) as committees:
+                publication_list = await publications.get_publications_for_committees(
+                    [203, 204], START_DATE, END_DATE
+                )
+                chunks = [chunk async for chunk in publications.iter_document_file(document, file, 100)]
+                committee_tree = await committees.get_committee_tree(203)
+            return publication_list, chunks, committee_tree
+
+        with StubServer(StubConfig(total_publications=120, page_size=page_size, document_size=1000)) as server:
+            publication_list, chunks, committee_tree = run_sync(fetch(server.base_uri))
+            expected_publications = ParliamentPublicationsAPIClient(
+                server.base_uri
+            ).get_publications_for_committees([203, 204], START_DATE, END_DATE)
+            expected_tree = ParliamentCommitteesAPIClient(server.base_uri).get_committee_tree(203)
+
+        assert publication_list == expected_publications
+        assert len(publication_list.publications) == 120
+        assert len(chunks) > 1
+        assert b"".join(chunks) == bytes(index % 251 for index in range(1000))
+        assert committee_tree == expected_tree
+
+    def test_injected_errors_raise(self, no_rate_limit):
+        """
+        Test that injected client errors surface as response errors without retries
+        """
+        async def get_question(base_uri):
+            async with AsyncParliamentQuestionsAPIClient(base_uri) as client:
+                return await client.get_question_by_id(1)
+
+        with StubServer(StubConfig(error_rate=1.0, error_status=404)) as server:
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                run_sync(get_question(server.base_uri))
+            requests_served = server.requests_served
+
+        assert error.value.status == 404
+        assert requests_served == 1
+
+    def test_server_errors_open_circuit(self, monkeypatch, no_rate_limit):
+        """
+        Test that server errors are retried, then open the circuit shared with the sync client
+        """
+        monkeypatch.setattr(async_parliament_api_client, "RETRY_BACKOFF_FACTOR", 0)
+
+        failure_threshold = get_circuit_breaker("ParliamentAPIQuestions").failure_threshold
+
+        async def get_question(base_uri):
+            async with AsyncParliamentQuestionsAPIClient(base_uri) as client:
+                for _ in range(failure_threshold):
+                    with pytest.raises(aiohttp.ClientResponseError):
+                        await client.get_question_by_id(1)
+
+        with StubServer(StubConfig(error_rate=1.0, error_status=500)) as server:
+            run_sync(get_question(server.base_uri))
+            requests_served = server.requests_served
+
+            with pytest.raises(CircuitOpenError):
+                ParliamentQuestionsAPIClient(server.base_uri).get_question_by_id(1)
+
+        assert requests_served == failure_threshold * (async_parliament_api_client.RETRY_TOTAL + 1)
@@ -0,0 +1,143 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+import pytest
+
+from datetime import date
+from unittest.mock import patch
+
+import backends
+import queueing
+import storage
+
+from backends import FileStore, InProcessS3Client, InProcessSQSClient, InProcessSSMClient, MemoryStore
+from models import House, Publication, Question
+from queueing import MessagePacking, SQSQueue, unpack_message
+from storage import S3Storage, SSMStorage
+
+QUEUE_URL = "https://sqs.us-west-2.amazonaws.com/123456789012/QuestionQueue"
+PART_SIZE = 5 * 1024 * 1024
+
+
+@pytest.fixture(params=["memory", "local"])
+def store(request, tmp_path):
+    return MemoryStore() if request.param == "memory" else FileStore(str(tmp_path))
+
+
+@pytest.fixture()
+def in_process_clients(store):
+    with patch.object(storage, "s3_client", InProcessS3Client(store)), patch.object(
+        storage, "ssm_client", InProcessSSMClient(store)
+    ), patch.object(queueing, "sqs_client", InProcessSQSClient(store)), patch.object(
+        queueing, "s3_client", storage.s3_client
+    ):
+        yield
+
+
+def build_questions(count):
+    return [
+        Question(
+            id=question_id,
+            question=f"Question {question_id}",
+            answer=f"Answer {question_id}",
+            date_tabled=date(2024, 1, 1 + question_id % 28),
+            house=House.COMMONS,
+        )
+        for question_id in range(1, count + 1)
+    ]
+
+
+class TestInProcessBackends:
+    def test_save_questions_detects_unchanged(self, store, in_process_clients):
+        """
+        Test that stored content hashes are read back, so unchanged questions are skipped
+        """
+        questions = build_questions(20)
+        repository = S3Storage("questions_bucket")
+
+        first = repository.save_questions(questions)
+        second = repository.save_questions(questions)
+
+        assert len(first.written) == 20 and not first.failed
+        assert len(second.skipped) == 20 and not second.written
+        assert len(store.keys("s3/questions_bucket", "question_type=written/")) == 20
+
+    def test_save_publication_stream_multipart(self, in_process_clients):
+        """
+        Test that multipart uploads are joined in part order
+        """
+        publication = Publication.from_dict(
+            {
+                "committee_id": 203,
+                "id": 1,
+                "description": "Report",
+                "documents": [{"id": 2, "publication_id": 1, "files": [{"filename": "report.pdf"}]}],
+            }
+        )
+        data = os.urandom(PART_SIZE * 2 + 10)
+        repository = S3Storage("content_bucket", part_size=PART_SIZE)
+
+        repository.save_publication_stream(
+            (data[i:i + 65536] for i in range(0, len(data), 65536)), publication, "https://example.com"
+        )
+
+        response = storage.s3_client.get_object(Bucket="content_bucket", Key=repository.publication_key(publication))
+        assert response["Body"].read() == data
+
+    def test_ssm_parameters(self, in_process_clients):
+        """
+        Test that missing parameters read as None, saved parameters read back and deleted ones are gone
+        """
+        parameter = SSMStorage("/stack/QuestionsAPIGetQuestionsLastRun")
+
+        assert parameter.get_value() is None
+        parameter.save_parameter("2024-01-31")
+        assert parameter.get_value() == "2024-01-31"
+        parameter.delete_parameter()
+        assert parameter.get_value() is None
+        parameter.delete_parameter()
+
+    def test_queue_round_trip(self, in_process_clients):
+        """
+        Test that packed messages are received once, in order, and removed when deleted
+        """
+        messages = [question.to_json() for question in build_questions(1200)]
+
+        report = SQSQueue(QUEUE_URL).send_packed(messages, packing=MessagePacking.GZIP)
+
+        received = []
+        while True:
+            response = queueing.sqs_client.receive_message(QueueUrl=QUEUE_URL, MaxNumberOfMessages=10)
+            if not response.get("Messages"):
+                break
+            for message in response["Messages"]:
+                received.extend(item["id"] for item in unpack_message(message["Body"]))
+                queueing.sqs_client.delete_message(QueueUrl=QUEUE_URL, ReceiptHandle=message["ReceiptHandle"])
+
+        attributes = queueing.sqs_client.get_queue_attributes(QueueUrl=QUEUE_URL)["Attributes"]
+        assert report.sent == 1200
+        assert received == list(range(1, 1201))
+        assert attributes == {"ApproximateNumberOfMessages": "0", "ApproximateNumberOfMessagesNotVisible": "0"}
+
+
+class TestClient:
+    def test_client_follows_service_backend(self, monkeypatch, tmp_path):
+        """
+        Test that SERVICE_BACKEND selects the client and in-process clients share a store
+        """
+        monkeypatch.setenv("SERVICE_BACKEND", "local")
+        monkeypatch.setenv("SERVICE_BACKEND_DIR", str(tmp_path))
+
+        s3_client = backends.client("s3")
+        backends.client("s3").put_object(Bucket="bucket", Key="key", Body=b"data")
+
+        assert isinstance(s3_client, InProcessS3Client)
+        assert s3_client.get_object(Bucket="bucket", Key="key")["Body"].read() == b"data"
+        with pytest.raises(ValueError):
+            backends.client("bedrock-agent")
+
+        monkeypatch.setenv("SERVICE_BACKEND", "unknown")
+        with pytest.raises(ValueError):
+            backends.client("s3")
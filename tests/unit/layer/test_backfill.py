@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append('.')
+sys.path.append(os.path.join(os.getcwd(), 'layers', 'pq_responder'))
+
+from datetime import date
+
+from backfill import ShardCheckpoint, ShardSize, run_shards, split_date_range
+
+
+class TestSplitDateRange:
+
+    def test_split_by_day(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 3), ShardSize.DAY)
+        assert [(s.start_date, s.end_date) for s in shards] == [
+            (date(2024, 1, 1), date(2024, 1, 1)),
+            (date(2024, 1, 2), date(2024, 1, 2)),
+            (date(2024, 1, 3), date(2024, 1, 3)),
+        ]
+
+    def test_split_by_week_with_partial_last_shard(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 10), ShardSize.WEEK)
+        assert [(s.start_date, s.end_date) for s in shards] == [
+            (date(2024, 1, 1), date(2024, 1, 7)),
+            (date(2024, 1, 8), date(2024, 1, 10)),
+        ]
+
+    def test_split_empty_range(self):
+        assert split_date_range(date(2024, 1, 2), date(2024, 1, 1), ShardSize.DAY) == []
+
+
+class TestShardCheckpoint:
+
+    def test_watermark_only_advances_over_contiguous_shards(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 3), ShardSize.DAY)
+        advances = []
+        checkpoint = ShardCheckpoint(shards, advances.append)
+
+        checkpoint.complete(shards[1])
+        assert advances == []
+
+        checkpoint.complete(shards[0])
+        assert advances == [date(2024, 1, 2)]
+
+        checkpoint.complete(shards[2])
+        assert advances == [date(2024, 1, 2), date(2024, 1, 3)]
+
+    def test_resume_skips_completed_shards(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 5), ShardSize.DAY)
+        checkpoint = ShardCheckpoint(shards, lambda _: None, completed_through=date(2024, 1, 3))
+        assert [s.start_date for s in checkpoint.pending_shards()] == [date(2024, 1, 4), date(2024, 1, 5)]
+
+
+class TestRunShards:
+
+    def test_run_shards_counts_items(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 5), ShardSize.DAY)
+        advances = []
+        checkpoint = ShardCheckpoint(shards, advances.append)
+
+        assert run_shards(checkpoint, lambda shard: shard.index + 1) == 15
+        assert advances[-1] == date(2024, 1, 5)
+
+    def test_run_shards_failure_keeps_contiguous_watermark(self):
+        shards = split_date_range(date(2024, 1, 1), date(2024, 1, 4), ShardSize.DAY)
+        advances = []
+        checkpoint = ShardCheckpoint(shards, advances.append)
+        first_done = threading.Event()
+
+        def process(shard):
+            if shard.index == 0:
+                first_done.set()
+                return 1
+            first_done.wait(timeout=5)
+            if shard.index == 1:
+                raise RuntimeError('Shard failed')
+            return 1
+
+        with pytest.raises(RuntimeError):
+            run_shards(checkpoint, process, max_workers=1)
+
+        assert advances == [date(2024, 1, 1)]
+        assert checkpoint.pending_shards()[0].start_date == date(2024, 1, 2)
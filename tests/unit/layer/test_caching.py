@@ -0,0 +1,107 @@
+from caching import (
+    CachedResponse,
+    DiskResponseCache,
+    MemoryResponseCache,
+    TieredResponseCache,
+)
+from parliament_api_client import ParliamentQuestionsAPIClient
+from mock_data.mock_api_question import MockAPIQuestion
+
+from unittest.mock import MagicMock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq-responder"))
+
+
+def mock_question_response(status_code=200, headers=None):
+    mock_response = MagicMock()
+    mock_response.json.return_value = MockAPIQuestion().mock_api_question
+    mock_response.status_code = status_code
+    mock_response.headers = headers or {}
+    return mock_response
+
+
+class TestResponseCaches:
+    def test_memory_cache_evicts_least_recently_used(self):
+        """
+        Test that the memory cache keeps at most max_entries responses
+        """
+        cache = MemoryResponseCache(max_entries=2)
+        for url in ["a", "b"]:
+            cache.set(CachedResponse(url=url, body={}))
+        cache.get("a")
+        cache.set(CachedResponse(url="c", body={}))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_memory_cache_ttl(self):
+        """
+        Test that responses older than the ttl are stale
+        """
+        cache = MemoryResponseCache(ttl=60)
+        response = CachedResponse(url="a", body={}, stored_at=0)
+
+        assert not cache.is_fresh(response)
+        assert cache.is_fresh(response.refreshed())
+
+    def test_disk_cache_prunes_in_batches(self, tmp_path):
+        """
+        Test that the disk cache keeps at most max_entries responses without scanning on every write
+        """
+        cache = DiskResponseCache(cache_dir=str(tmp_path), max_entries=100)
+        with patch("caching.os.scandir", wraps=os.scandir) as mock_scandir:
+            for index in range(300):
+                cache.set(CachedResponse(url=str(index), body={}))
+
+        assert len(os.listdir(tmp_path)) <= 100
+        assert cache.get("299") is not None
+        assert mock_scandir.call_count < 300 / 10
+
+    def test_tiered_cache_promotes_from_disk(self, tmp_path):
+        """
+        Test that a response found on disk is copied into memory
+        """
+        memory_cache = MemoryResponseCache()
+        disk_cache = DiskResponseCache(cache_dir=str(tmp_path))
+        disk_cache.set(CachedResponse(url="a", body={"value": 1}, etag='"1"'))
+
+        cache = TieredResponseCache([memory_cache, disk_cache])
+
+        assert cache.get("a").body == {"value": 1}
+        assert memory_cache.get("a").etag == '"1"'
+
+
+class TestClientResponseCache:
+    def test_fresh_response_is_not_requested_again(self, mock_parliament_questions_api_uri):
+        """
+        Test that a fresh cached response is used without a request
+        """
+        cache = MemoryResponseCache()
+        with patch("requests.Session.get", return_value=mock_question_response()) as mock_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri, cache=cache)
+            first = client.get_question_by_id(1679416)
+            second = client.get_question_by_id(1679416)
+
+        assert mock_get.call_count == 1
+        assert first == second
+
+    def test_stale_response_is_revalidated(self, mock_parliament_questions_api_uri):
+        """
+        Test that a stale response is revalidated with its ETag and reused on 304
+        """
+        cache = MemoryResponseCache(ttl=0)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.side_effect = [
+                mock_question_response(headers={"ETag": '"abc"'}),
+                mock_question_response(status_code=304),
+            ]
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri, cache=cache)
+            first = client.get_question_by_id(1679416)
+            second = client.get_question_by_id(1679416)
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert first == second
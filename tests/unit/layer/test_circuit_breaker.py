@@ -0,0 +1,212 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+import pytest
+import requests
+
+from datetime import date
+
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError, ReadTimeoutError
+
+import circuit_breaker
+import repositories
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, get_circuit_breaker
+from models import Publication
+from parliament_api_client import ParliamentPublicationsAPIClient, ParliamentQuestionsAPIClient
+from repositories import BedrockAgent
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        """
+        Test that the circuit opens at the failure threshold and then fails fast
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """
+        Test that only consecutive failures count towards the threshold
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_one_probe(self):
+        """
+        Test that after the recovery timeout a single probe is allowed and success closes the circuit
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        """
+        Test that a failed probe opens the circuit again
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()
+
+        breaker.recovery_timeout = 60
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_lost_probe_expires(self):
+        """
+        Test that a probe which never finishes stops blocking new probes after the probe timeout
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=1, recovery_timeout=0, probe_timeout=60)
+        breaker.record_failure()
+        breaker.before_call()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        with patch.object(circuit_breaker.time, "monotonic", return_value=circuit_breaker.time.monotonic() + 60):
+            breaker.before_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_call_classifies_exceptions(self):
+        """
+        Test that only exceptions classified as failures count towards the threshold
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=1)
+
+        with pytest.raises(KeyError):
+            breaker.call(lambda: {}["missing"], is_failure=lambda e: not isinstance(e, KeyError))
+        assert breaker.state == CircuitState.CLOSED
+
+        with pytest.raises(ValueError):
+            breaker.call(int, "invalid")
+        assert breaker.state == CircuitState.OPEN
+
+    def test_transitions_emit_metrics(self):
+        """
+        Test that state transitions are emitted as metrics named after the dependency
+        """
+        breaker = CircuitBreaker("Test", failure_threshold=1)
+
+        with patch.object(circuit_breaker.metrics, "add_metric") as mock_add_metric:
+            breaker.record_failure()
+
+        mock_add_metric.assert_called_once_with(name="TestCircuitOpen", unit="Count", value=1)
+
+    def test_registry_shares_breakers(self, monkeypatch):
+        """
+        Test that breakers are shared per dependency and configured from the environment
+        """
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "3")
+
+        breaker = get_circuit_breaker("Shared")
+
+        assert get_circuit_breaker("Shared") is breaker
+        assert breaker.failure_threshold == 3
+
+
+class TestCircuitBreakerIntegration:
+    def test_parliament_api_fails_fast_when_open(self, monkeypatch, mock_parliament_questions_api_uri):
+        """
+        Test that server errors open the Parliament API circuit and later requests are not sent
+        """
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error")
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            for _ in range(2):
+                with pytest.raises(requests.exceptions.HTTPError):
+                    client.get_question_by_id(1)
+            with pytest.raises(CircuitOpenError):
+                client.get_question_by_id(1)
+
+        assert mock_get.call_count == 2
+
+    def test_publication_requests_fail_fast_when_open(self, monkeypatch, mock_parliament_questions_api_uri):
+        """
+        Test that publication requests raise CircuitOpenError, not an error from closing a response
+        """
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "1")
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error", response=mock_response)
+        publication = Publication.from_dict(
+            {
+                "committee_id": 203,
+                "id": 1,
+                "description": "Report",
+                "documents": [{"id": 2, "publication_id": 1, "files": [{"filename": "report.pdf"}]}],
+            }
+        )
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            client = ParliamentPublicationsAPIClient(mock_parliament_questions_api_uri)
+            document = publication.documents[0]
+            with pytest.raises(requests.exceptions.HTTPError):
+                list(client.iter_document_file(document, document.files[0]))
+            with pytest.raises(CircuitOpenError):
+                client.get_committee_publications_list(203, date(2024, 1, 1), date(2024, 1, 31))
+            with pytest.raises(CircuitOpenError):
+                list(client.iter_document_file(document, document.files[0]))
+
+        assert mock_get.call_count == 1
+
+    def test_bedrock_agent_probe_fails_on_any_error(self, monkeypatch):
+        """
+        Test that an error other than ClientError during a probe opens the circuit again
+        """
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "1")
+        monkeypatch.setenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "0")
+        breaker = get_circuit_breaker("BedrockAgent")
+        breaker.record_failure()
+
+        with patch.object(repositories.bedrock_agent_runtime_client, "invoke_agent", side_effect=ReadTimeoutError(endpoint_url="https://example.com")):
+            agent = BedrockAgent(agent_id="agent", agent_alias_id="alias")
+            with pytest.raises(ReadTimeoutError):
+                agent.suggest_answer("prompt")
+
+        breaker.recovery_timeout = 60
+        assert breaker.state == CircuitState.OPEN
+
+    def test_bedrock_agent_stops_retrying_when_open(self, monkeypatch):
+        """
+        Test that throttling stops being retried once the Bedrock Agent circuit opens
+        """
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
+        throttled = ClientError({"Error": {"Code": "throttlingException", "Message": "Slow down"}}, "InvokeAgent")
+
+        with patch.object(repositories.bedrock_agent_runtime_client, "invoke_agent", side_effect=throttled) as mock_invoke, \
+                patch.object(repositories.time, "sleep") as mock_sleep:
+            agent = BedrockAgent(agent_id="agent", agent_alias_id="alias")
+            with pytest.raises(ClientError):
+                agent.suggest_answer("prompt")
+            with pytest.raises(CircuitOpenError):
+                agent.suggest_answer("prompt")
+
+        assert mock_invoke.call_count == 2
+        assert mock_sleep.call_count == 1
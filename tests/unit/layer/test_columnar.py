@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from columnar import QuestionsBatch, read_parquet
+from models import House, Question, Questions
+from mock_data.mock_api_questions import MockAPIQuestions
+
+
+def make_question(question_id, house=House.COMMONS, date_tabled=date(2024, 1, 1)):
+    return Question(
+        id=question_id,
+        house=house,
+        date_tabled=date_tabled,
+        question="Question?",
+        answer=None if question_id % 2 else "Answer.",
+    )
+
+
+@pytest.fixture
+def batch():
+    return QuestionsBatch.from_questions(
+        [
+            make_question(1),
+            make_question(2, house=House.LORDS),
+            make_question(3, date_tabled=date(2024, 2, 10)),
+            make_question(4, house=House.LORDS, date_tabled=date(2024, 2, 11)),
+        ]
+    )
+
+
+class TestQuestionsBatch:
+    def test_from_api_results_matches_questions(self):
+        """
+        Test that a batch built from API results converts back to the same questions
+        """
+        results = MockAPIQuestions().mock_api_questions["results"]
+
+        batch = QuestionsBatch.from_api_results(results)
+
+        assert len(batch) == len(results)
+        assert batch.to_dict_list() == QuestionsBatch.from_questions(
+            batch.to_questions()
+        ).to_dict_list()
+
+    def test_to_dict_list_matches_questions(self, batch):
+        """
+        Test that the batch serialises like Questions.to_dict_list
+        """
+        questions = batch.to_questions()
+
+        assert isinstance(questions, Questions)
+        assert batch.to_dict_list() == questions.to_dict_list()
+
+    def test_slice_is_zero_copy(self, batch):
+        """
+        Test that slicing shares the batch's buffers
+        """
+        sliced = batch.slice(1, 2)
+
+        assert [row["id"] for row in sliced.to_dict_list()] == [2, 3]
+        assert (
+            sliced.table["id"].chunk(0).buffers()[1].address
+            == batch.table["id"].chunk(0).buffers()[1].address
+        )
+
+    def test_filter_by_house_and_date(self, batch):
+        """
+        Test filtering by house and an inclusive date tabled range
+        """
+        assert [q["id"] for q in batch.filter(house=House.LORDS).to_dict_list()] == [2, 4]
+        assert [
+            q["id"]
+            for q in batch.filter(
+                start_date=date(2024, 1, 2), end_date=date(2024, 2, 10)
+            ).to_dict_list()
+        ] == [3]
+        assert batch.filter() is batch
+
+    def test_write_parquet_partitions_like_question_keys(self, batch, tmp_path):
+        """
+        Test that Parquet files use the question_type/year/month/day layout and read back
+        """
+        batch.write_parquet(str(tmp_path))
+
+        partitions = sorted(
+            str(path.parent.relative_to(tmp_path)) for path in tmp_path.rglob("*.parquet")
+        )
+        assert partitions == [
+            "question_type=written/year=2024/month=01/day=01",
+            "question_type=written/year=2024/month=02/day=10",
+            "question_type=written/year=2024/month=02/day=11",
+        ]
+
+        read_back = read_parquet(str(tmp_path)).to_dict_list()
+        assert sorted(read_back, key=lambda q: q["id"]) == batch.to_dict_list()
+
+    def test_write_parquet_keeps_other_questions_in_partition(self, batch, tmp_path):
+        """
+        Test that writing part of a partition keeps its other questions and updates rewritten ones
+        """
+        batch.write_parquet(str(tmp_path))
+        question = make_question(1)
+        question.answer = "Updated answer"
+        QuestionsBatch.from_questions([question]).write_parquet(str(tmp_path))
+
+        read_back = sorted(read_parquet(str(tmp_path)).to_dict_list(), key=lambda q: q["id"])
+        assert [q["id"] for q in read_back] == [q["id"] for q in batch.to_dict_list()]
+        assert read_back[0]["answer"] == "Updated answer"
+        assert read_back[1:] == batch.to_dict_list()[1:]
@@ -0,0 +1,113 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+import base64
+import pytest
+
+from datetime import date
+
+from decoding import Base64FieldDecoder, decode_api_question, decode_api_question_record
+from models import House, Question, QuestionRecord, Questions
+from mock_data.mock_api_questions import MockAPIQuestions
+from mock_data.mock_api_question import MockAPIQuestion
+
+
+class TestDecodeAPIQuestion:
+    def test_fast_path_matches_validated_question(self):
+        """
+        Test that the fast decoder builds the same question as full validation
+        """
+        for api_question in MockAPIQuestions().mock_api_questions["results"]:
+            value = api_question["value"]
+            expected = Question(
+                id=value["id"],
+                house=House(value["house"].lower()),
+                date_tabled=date.fromisoformat(value["dateTabled"][:10]),
+                question=value["questionText"],
+                answer=value["answerText"],
+            )
+
+            assert decode_api_question(api_question) == expected
+
+    def test_falls_back_to_validation(self):
+        """
+        Test that rows failing the fast path are still decoded by full validation
+        """
+        value = {
+            **MockAPIQuestion().mock_api_question["value"],
+            "id": "123",
+            "house": "LORDS",
+            "dateTabled": "2024/01/05",
+        }
+
+        question = decode_api_question({"value": value})
+
+        assert question.id == 123
+        assert question.house == House.LORDS
+        assert question.date_tabled == date(2024, 1, 5)
+
+    def test_invalid_row_raises(self):
+        """
+        Test that rows failing full validation raise an error
+        """
+        value = {**MockAPIQuestion().mock_api_question["value"], "house": "Senate"}
+
+        with pytest.raises(ValueError):
+            decode_api_question({"value": value})
+
+    def test_record_matches_question(self):
+        """
+        Test that question records round trip to the same question and dictionary
+        """
+        for api_question in MockAPIQuestions().mock_api_questions["results"]:
+            question = decode_api_question(api_question)
+            record = decode_api_question_record(api_question)
+
+            assert isinstance(record, QuestionRecord)
+            assert record == QuestionRecord.from_question(question)
+            assert record.to_question() == question
+            assert record.to_dict() == question.to_dict()
+            assert record.complete_question == question.complete_question
+            assert record.complete_answer == question.complete_answer
+
+    def test_records_round_trip_through_questions(self):
+        """
+        Test that Questions converts to records and back without changing its output
+        """
+        questions = Questions(
+            questions=[
+                decode_api_question(api_question)
+                for api_question in MockAPIQuestions().mock_api_questions["results"]
+            ]
+        )
+
+        records = questions.to_records()
+
+        assert not hasattr(records[0], "__dict__")
+        assert Questions.from_records(records).to_dict_list() == questions.to_dict_list()
+
+
+class TestBase64FieldDecoder:
+    def test_missing_field(self):
+        """
+        Test that the decoder raises KeyError when the document has no data field
+        """
+        decoder = Base64FieldDecoder("data")
+        decoder.feed(b'{"name": "data", "nested": {"data": "AAAA"}}')
+        with pytest.raises(KeyError):
+            decoder.close()
+
+    def test_field_split_across_chunks(self):
+        """
+        Test that the field name, escapes and base64 quanta may be split across chunks
+        """
+        document = b'{"name": "report", "data": "' + base64.b64encode(bytes(range(64))).replace(b"/", b"\\/") + b'", "size": 64}'
+        decoder = Base64FieldDecoder("data")
+
+        data = b"".join(decoder.feed(document[i:i + 3]) for i in range(0, len(document), 3))
+        decoder.close()
+
+        assert data == bytes(range(64))
+        assert decoder.complete
@@ -0,0 +1,66 @@
+from datetime import date
+
+from models import House, IndexedQuestions, Question, Questions
+
+
+def make_question(question_id, question="Question?", answer="Answer."):
+    return Question(
+        id=question_id,
+        house=House.COMMONS,
+        date_tabled=date(2024, 1, 1),
+        question=question,
+        answer=answer,
+    )
+
+
+class TestIndexedQuestions:
+    def test_add_keeps_most_complete_version_in_first_position(self):
+        """
+        Test that duplicates are dropped unless they are more complete
+        """
+        questions = IndexedQuestions()
+        questions.add(make_question(1, question="Truncated..."))
+        questions.add(make_question(2))
+        questions.add(make_question(1))
+        questions.add(make_question(1, answer="Truncated..."))
+
+        assert [question.id for question in questions] == [1, 2]
+        assert questions.get(1) == make_question(1)
+        assert 2 in questions
+        assert make_question(3) not in questions
+
+    def test_init_deduplicates(self):
+        """
+        Test that questions passed to the constructor are indexed and deduplicated
+        """
+        questions = IndexedQuestions(questions=[make_question(1), make_question(1)])
+
+        assert len(questions) == 1
+        assert questions.get(1) == make_question(1)
+
+    def test_union_and_difference(self):
+        """
+        Test set style union and difference keep insertion order
+        """
+        tabled = IndexedQuestions(questions=[make_question(1), make_question(2, answer=None)])
+        answered = IndexedQuestions(questions=[make_question(3), make_question(2)])
+
+        assert [q.id for q in tabled | answered] == [1, 2, 3]
+        assert [q.id for q in answered - tabled] == [3]
+        assert [q.id for q in tabled - [make_question(1)]] == [2]
+        assert len(tabled) == 2
+
+    def test_serialises_like_questions(self):
+        """
+        Test that an indexed collection serialises exactly like Questions
+        """
+        items = [make_question(2), make_question(1, answer="Truncated...")]
+
+        assert (
+            IndexedQuestions(questions=items).to_dict_list()
+            == Questions(questions=items).to_dict_list()
+        )
+        assert (
+            IndexedQuestions(questions=items).model_dump_json()
+            == Questions(questions=items).model_dump_json()
+        )
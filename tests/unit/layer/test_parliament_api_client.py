@@ -1,17 +1,23 @@
 from datetime import date, timedelta
 
 from parliament_api_client import (
+    TAKE,
     DateType,
     ParliamentQuestionsAPIClient,
     ParliamentCommitteesAPIClient,
     ParliamentPublicationsAPIClient,
 )
+from transport import reset_transport
+from models import House, Publication, Publications, Question, QuestionRecord, Questions
 from mock_data.mock_committee_education import MockEducationCommittee
 from mock_data.mock_publication_list import MockPublicationList
 from mock_data.mock_api_questions import MockAPIQuestions
+from mock_data.mock_api_question import MockAPIQuestion
 
 from unittest.mock import Mock, MagicMock, patch
 
+import base64
+import time
 import pytest
 import requests
 import os
@@ -47,6 +53,7 @@ class TestParliamentCommitteesApiClient:
             raise requests.exceptions.RequestException("Failed to create session")
 
         monkeypatch.setattr(requests, "Session", mock_session)
+        reset_transport()
         with pytest.raises(requests.exceptions.RequestException):
             ParliamentCommitteesAPIClient(mock_parliament_committees_api_uri)
 
@@ -143,6 +150,100 @@ class TestParliamentCommitteesApiClient:
         assert len(committee_publication_list.publications) > 0
 
 
+    def test_get_committee_tree_visits_each_committee_once(
+        self, mock_parliament_committees_api_uri
+    ):
+        """
+        Test that the committee tree is walked level by level without repeating shared committees
+        """
+        tree = {1: [2, 3], 2: [4], 3: [4, 1], 4: []}
+        client = ParliamentCommitteesAPIClient(mock_parliament_committees_api_uri)
+
+        with patch.object(
+            client,
+            "get_sub_committees",
+            side_effect=lambda committee_id: [{"id": i, "name": str(i)} for i in tree[committee_id]],
+        ) as mock_get_sub_committees:
+            committee_ids = client.get_committee_tree(1)
+
+        assert committee_ids == [1, 2, 3, 4]
+        assert mock_get_sub_committees.call_count == 4
+
+    def test_get_publications_for_committees_deduplicates(
+        self, mock_parliament_committees_api_uri
+    ):
+        """
+        Test that publications shared between committees are only returned once
+        """
+        def publications_for(committee_id, start_date, end_date):
+            publications = Publications(committee_api_base_uri=mock_parliament_committees_api_uri)
+            for publication_id in {1: [10, 11], 2: [11, 12]}[committee_id]:
+                publications.append(Publication(committee_id=committee_id, id=publication_id, description=""))
+            return publications
+
+        client = ParliamentPublicationsAPIClient(mock_parliament_committees_api_uri)
+        with patch.object(client, "get_committee_publications_list", side_effect=publications_for):
+            publications = client.get_publications_for_committees([1, 2], START_DATE, END_DATE)
+
+        assert [publication.id for publication in publications.publications] == [10, 11, 12]
+        assert publications.publications[1].committee_id == 1
+
+    def test_iter_document_file_streams_decoded_data(
+        self, mock_parliament_committees_api_uri
+    ):
+        """
+        Test that iter_document_file decodes the data field across chunk boundaries
+        """
+        file_data = bytes(range(256)) * 64
+        encoded = base64.b64encode(file_data).decode().replace("/", "\\/")
+        body = ('{"fileName": "data", "data": "%s", "contentType": "application/pdf"}' % encoded).encode()
+
+        mock_response = MagicMock()
+        mock_response.iter_content.side_effect = lambda chunk_size: (
+            body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+        )
+        publication = Publication.from_dict(
+            {"committee_id": 203, "id": 1, "description": "", "documents": [{"id": 2, "publication_id": 1, "files": [{"filename": "a.pdf"}]}]}
+        )
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            client = ParliamentPublicationsAPIClient(mock_parliament_committees_api_uri)
+            document = publication.documents[0]
+            chunks = list(client.iter_document_file(document, document.files[0], chunk_size=1000))
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert len(chunks) > 1
+        assert b"".join(chunks) == file_data
+
+    def test_iter_document_file_uses_file_data_format(
+        self, mock_parliament_committees_api_uri
+    ):
+        """
+        Test that iter_document_file requests the document file in its data format
+        """
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b'{"data": "AAEC"}']
+        publication = Publication.from_dict(
+            {
+                "committee_id": 203,
+                "id": 1,
+                "description": "",
+                "documents": [
+                    {"id": 2, "publication_id": 1, "files": [{"filename": "a.pdf"}]},
+                    {"id": 3, "publication_id": 1, "files": [{"filename": "b.pdf", "data_format": "Pdf"}]},
+                ],
+            }
+        )
+        document, file = list(publication.iter_files())[1]
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            client = ParliamentPublicationsAPIClient(mock_parliament_committees_api_uri)
+            data = b"".join(client.iter_document_file(document, file))
+
+        assert mock_get.call_args.args[0].endswith("Publications/1/Document/3/Pdf")
+        assert data == bytes([0, 1, 2])
+
+
 class TestParliamentQuestionsApiClient:
 
     def test_init_creates_session_with_base_uri(
@@ -167,6 +268,7 @@ class TestParliamentQuestionsApiClient:
             raise requests.exceptions.RequestException("Failed to create session")
 
         monkeypatch.setattr(requests, "Session", mock_session)
+        reset_transport()
         with pytest.raises(requests.exceptions.RequestException):
             ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
 
@@ -338,3 +440,94 @@ class TestParliamentQuestionsApiClient:
             mock_get.return_value = mock_response
             with pytest.raises(ValueError):
                 list(client.get_questions_by_date(date_type=DATE_TYPE, start_date=START_DATE, end_date=END_DATE))
+
+    def test_get_questions_by_date_multiple_pages_in_order(
+        self, mock_parliament_questions_api_uri
+    ):
+        """
+        Test that remaining pages are fetched after the first and merged in offset order
+        """
+        api_questions = MockAPIQuestions().mock_api_questions
+        total_results = 3 * TAKE + 1
+
+        def mock_get(url, *args, **kwargs):
+            skip = int(url.split("skip=")[1].split("&")[0])
+            result = api_questions["results"][0]
+            response = MagicMock()
+            response.json.return_value = {
+                "totalResults": total_results,
+                "results": [
+                    {"value": {**result["value"], "id": skip + i}}
+                    for i in range(min(TAKE, total_results - skip))
+                ],
+            }
+            return response
+
+        with patch("requests.Session.get", side_effect=mock_get) as patched_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            questions = client.get_questions_by_date(date_type=DATE_TYPE, start_date=START_DATE, end_date=END_DATE)
+
+        assert patched_get.call_count == 4
+        assert [question.id for question in questions] == list(range(total_results))
+
+    def test_iter_questions_by_date_is_lazy(self, mock_parliament_questions_api_uri):
+        """
+        Test that iter_questions_by_date validates eagerly but only requests pages when iterated
+        """
+        mock_response = MagicMock()
+        mock_response.json.return_value = MockAPIQuestions().mock_api_questions
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            questions = client.iter_questions_by_date(date_type=DATE_TYPE, start_date=START_DATE, end_date=END_DATE)
+            assert mock_get.call_count == 0
+
+            first_question = next(questions)
+            assert first_question.id == 1679703
+            assert len(list(questions)) == 19
+
+        with pytest.raises(ValueError):
+            client.iter_questions_by_date(date_type=DATE_TYPE, start_date=END_DATE, end_date=START_DATE)
+
+    def test_iter_question_records_by_date(self, mock_parliament_questions_api_uri):
+        """
+        Test that iter_question_records_by_date yields records matching iter_questions_by_date
+        """
+        mock_response = MagicMock()
+        mock_response.json.return_value = MockAPIQuestions().mock_api_questions
+
+        with patch("requests.Session.get", return_value=mock_response):
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            questions = list(client.iter_questions_by_date(date_type=DATE_TYPE, start_date=START_DATE, end_date=END_DATE))
+            records = list(client.iter_question_records_by_date(date_type=DATE_TYPE, start_date=START_DATE, end_date=END_DATE))
+
+        assert all(isinstance(record, QuestionRecord) for record in records)
+        assert [record.to_question() for record in records] == questions
+
+
+    def test_get_full_questions_only_fetches_incomplete(self, mock_parliament_questions_api_uri):
+        """
+        Test that only truncated questions are retrieved and the batch keeps its order
+        """
+        api_question = MockAPIQuestion().mock_api_question
+        complete = Question(id=1, house=House.COMMONS, date_tabled=START_DATE, question="Complete?", answer="Yes")
+        incomplete = [
+            Question(id=question_id, house=House.COMMONS, date_tabled=START_DATE, question="Truncated...", answer="")
+            for question_id in (2, 3)
+        ]
+
+        def mock_get(url, *args, **kwargs):
+            response = MagicMock()
+            response.json.return_value = {
+                "value": {**api_question["value"], "id": int(url.rsplit("/", 1)[1])}
+            }
+            return response
+
+        with patch("requests.Session.get", side_effect=mock_get) as patched_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            questions = client.get_full_questions(Questions(questions=[incomplete[0], complete, incomplete[1]]))
+
+        assert patched_get.call_count == 2
+        assert [question.id for question in questions] == [2, 1, 3]
+        assert questions.questions[1] is complete
+        assert questions.questions[0].question == api_question["value"]["questionText"]
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+import requests
+
+import parliament_api_client
+import rate_limiting
+
+from parliament_api_client import (
+    DateType,
+    ParliamentCommitteesAPIClient,
+    ParliamentPublicationsAPIClient,
+    ParliamentQuestionsAPIClient,
+)
+from models import PublicationDocument, PublicationFile
+from tests.benchmark.stub_server import StubConfig, StubServer
+
+
+@pytest.fixture()
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(rate_limiting, "_rate_limiters", {})
+    for family in ("QUESTIONS", "PUBLICATIONS", "COMMITTEES"):
+        monkeypatch.setenv(f"PARLIAMENT_API_RATE_{family}", "0")
+
+
+class TestParliamentAPIClientsAgainstStub:
+    def test_questions_paginate_without_gaps(self, monkeypatch, no_rate_limit):
+        """
+        Test that every page of questions is fetched over HTTP exactly once and in order
+        """
+        monkeypatch.setattr(parliament_api_client, "TAKE", 50)
+
+        with StubServer(StubConfig(page_size=50, total_questions=420)) as server:
+            client = ParliamentQuestionsAPIClient(server.base_uri)
+            questions = client.get_questions_by_date(
+                date_type=DateType.ANSWERED, start_date=date(2024, 1, 1), end_date=date(2024, 1, 7)
+            )
+            requests_served = server.requests_served
+
+        assert [question.id for question in questions.questions] == list(range(1, 421))
+        assert requests_served == 9
+
+    def test_publications_committees_and_files(self, no_rate_limit):
+        """
+        Test the publications and committees clients against the stub shapes
+        """
+        with StubServer(StubConfig(total_publications=7, document_size=1000)) as server:
+            publications = ParliamentPublicationsAPIClient(server.base_uri)
+            publication_list = publications.get_committee_publications_list(
+                203, date(2024, 1, 1), date(2024, 1, 7)
+            )
+            document = PublicationDocument(id=1, publication_id=1)
+            data = b"".join(publications.iter_document_file(document, PublicationFile(filename="1.pdf")))
+
+            committees = ParliamentCommitteesAPIClient(server.base_uri)
+            sub_committees = committees.get_sub_committees(203)
+            committee_tree = committees.get_committee_tree(203)
+
+        assert len(publication_list.publications) == 7
+        assert data == bytes(index % 251 for index in range(1000))
+        assert len(sub_committees) > 0
+        assert committee_tree == [203] + [sub_committee["id"] for sub_committee in sub_committees]
+
+    def test_injected_errors_raise(self, no_rate_limit):
+        """
+        Test that injected server errors surface as HTTP errors after retries
+        """
+        with StubServer(StubConfig(error_rate=1.0, error_status=404)) as server:
+            client = ParliamentQuestionsAPIClient(server.base_uri)
+            with pytest.raises(requests.exceptions.HTTPError):
+                client.get_question_by_id(1)
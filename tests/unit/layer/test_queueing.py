@@ -0,0 +1,212 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+from unittest.mock import patch
+
+import pytest
+
+from botocore.exceptions import EndpointConnectionError
+
+import queueing
+
+from queueing import (
+    MAX_BATCH_BYTES,
+    MessagePacking,
+    SQSQueue,
+    iter_envelopes,
+    pack_envelope,
+    read_message,
+    unpack_message,
+)
+
+
+@pytest.fixture()
+def queue_url(sqs_client):
+    return sqs_client.create_queue(QueueName="TestQueue")["QueueUrl"]
+
+
+def receive_all(sqs_client, queue_url):
+    bodies = []
+    while True:
+        response = sqs_client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10)
+        if not response.get("Messages"):
+            return bodies
+        bodies.extend(message["Body"] for message in response["Messages"])
+
+
+class TestSQSQueueSendMessages:
+    def test_send_messages_in_batches(self, sqs_client, queue_url):
+        """
+        Test that messages are sent in batches of at most 10 and all arrive
+        """
+        messages = (f'{{"id": {index}}}'.encode() for index in range(95))
+
+        with patch.object(queueing.sqs_client, "send_message_batch", wraps=queueing.sqs_client.send_message_batch) as mock_batch:
+            report = SQSQueue(queue_url).send_messages(messages, max_workers=3)
+
+        assert report.sent == 95
+        assert report.failed == []
+        assert mock_batch.call_count == 10
+        assert sorted(receive_all(sqs_client, queue_url)) == sorted(f'{{"id": {index}}}' for index in range(95))
+
+    def test_send_messages_splits_batches_by_size(self, queue_url):
+        """
+        Test that batches stay within the payload limit and oversized messages fail
+        """
+        large = "x" * (MAX_BATCH_BYTES // 3)
+        messages = [large] * 4 + ["x" * (MAX_BATCH_BYTES + 1)]
+
+        with patch.object(queueing.sqs_client, "send_message_batch", wraps=queueing.sqs_client.send_message_batch) as mock_batch:
+            report = SQSQueue(queue_url).send_messages(messages)
+
+        assert report.sent == 4
+        assert [(failed.index, failed.code) for failed in report.failed] == [(4, "MessageTooLong")]
+        assert sorted(len(call.kwargs["Entries"]) for call in mock_batch.call_args_list) == [1, 3]
+
+    def test_send_messages_retries_only_failed_entries(self, queue_url):
+        """
+        Test that transient entry failures are retried alone and sender faults are reported
+        """
+        calls = []
+
+        def send_message_batch(QueueUrl, Entries):
+            calls.append([entry["Id"] for entry in Entries])
+            failed = []
+            if len(calls) == 1:
+                failed = [
+                    {"Id": "1", "SenderFault": False, "Code": "InternalError"},
+                    {"Id": "2", "SenderFault": True, "Code": "InvalidMessageContents"},
+                ]
+            failed_ids = {entry["Id"] for entry in failed}
+            return {
+                "Successful": [{"Id": entry["Id"]} for entry in Entries if entry["Id"] not in failed_ids],
+                "Failed": failed,
+            }
+
+        with patch.object(queueing.sqs_client, "send_message_batch", side_effect=send_message_batch), \
+                patch("queueing.time.sleep"):
+            report = SQSQueue(queue_url).send_messages(["a", "b", "c", "d"])
+
+        assert calls == [["0", "1", "2", "3"], ["1"]]
+        assert report.sent == 3
+        assert [(failed.index, failed.code) for failed in report.failed] == [(2, "InvalidMessageContents")]
+
+
+    def test_send_messages_reports_connection_errors(self, queue_url):
+        """
+        Test that connection errors are retried and then reported as failed, not raised
+        """
+        error = EndpointConnectionError(endpoint_url="https://sqs.us-west-2.amazonaws.com")
+
+        with patch.object(queueing.sqs_client, "send_message_batch", side_effect=error) as mock_batch, \
+                patch("queueing.time.sleep"):
+            report = SQSQueue(queue_url).send_messages(["a", "b"])
+
+        assert mock_batch.call_count == queueing.SEND_MAX_ATTEMPTS
+        assert report.sent == 0
+        assert [(failed.index, failed.code) for failed in report.failed] == [
+            (0, "EndpointConnectionError"),
+            (1, "EndpointConnectionError"),
+        ]
+
+
+class TestEnvelopes:
+    @pytest.mark.parametrize("packing", [MessagePacking.JSON, MessagePacking.GZIP])
+    def test_pack_and_unpack(self, packing):
+        """
+        Test that envelopes unpack to their messages and plain messages unpack alone
+        """
+        items = [b'{"id":1}', b'{"id":2,"text":"caf\xc3\xa9"}']
+
+        envelope = pack_envelope(items, packing)
+
+        assert unpack_message(envelope) == [{"id": 1}, {"id": 2, "text": "café"}]
+        assert unpack_message(envelope.decode("utf-8")) == unpack_message(envelope)
+        assert unpack_message('{"id": 3}') == [{"id": 3}]
+
+    @pytest.mark.parametrize("packing", [MessagePacking.JSON, MessagePacking.GZIP])
+    def test_iter_envelopes_respects_limits(self, packing):
+        """
+        Test that envelopes cover every message in order within the item and size limits
+        """
+        messages = [f'{{"id":{index},"pad":"{os.urandom(200).hex()}"}}' for index in range(100)]
+
+        envelopes = list(iter_envelopes(messages, packing, max_items=30, max_bytes=4096))
+
+        assert all(len(envelope) <= 4096 and count <= 30 for _, count, envelope in envelopes)
+        assert [first for first, _, _ in envelopes] == [
+            sum(count for _, count, _ in envelopes[:position]) for position in range(len(envelopes))
+        ]
+        unpacked = [item["id"] for _, _, envelope in envelopes for item in unpack_message(envelope)]
+        assert unpacked == list(range(100))
+
+    def test_send_packed_counts_messages(self, sqs_client, queue_url):
+        """
+        Test that packed messages are sent in a few envelopes and counted individually
+        """
+        messages = [f'{{"id":{index}}}' for index in range(1200)] + ['{"pad":"%s"}' % ("x" * MAX_BATCH_BYTES)]
+
+        report = SQSQueue(queue_url).send_packed(messages, packing=MessagePacking.JSON)
+
+        bodies = receive_all(sqs_client, queue_url)
+        assert len(bodies) == 3
+        assert sorted(item["id"] for body in bodies for item in unpack_message(body)) == list(range(1200))
+        assert report.sent == 1200
+        assert [(failed.index, failed.code) for failed in report.failed] == [(1200, "MessageTooLong")]
+
+
+@pytest.fixture()
+def claim_check_bucket(s3_client, aws_region):
+    s3_client.create_bucket(
+        Bucket="claim-check-bucket",
+        CreateBucketConfiguration={"LocationConstraint": aws_region},
+    )
+    return "claim-check-bucket"
+
+
+class TestClaimCheck:
+    def test_oversized_messages_are_claim_checked(self, sqs_client, s3_client, queue_url, claim_check_bucket):
+        """
+        Test that only messages over the threshold are written to S3 and read back transparently
+        """
+        large = '{"pad":"%s"}' % ("x" * MAX_BATCH_BYTES)
+        queue = SQSQueue(queue_url, claim_check_bucket=claim_check_bucket)
+
+        report = queue.send_messages(['{"id":1}', large])
+
+        bodies = receive_all(sqs_client, queue_url)
+        assert report.sent == 2 and not report.failed
+        assert all(len(body) < 1024 for body in bodies)
+        payloads = [read_message(body) for body in bodies]
+        assert sorted(payload if isinstance(payload, str) else payload.decode() for payload in payloads) == sorted(
+            ['{"id":1}', large]
+        )
+        keys = [obj["Key"] for obj in s3_client.list_objects_v2(Bucket=claim_check_bucket)["Contents"]]
+        assert len(keys) == 1 and keys[0].startswith("claim-check/")
+
+    def test_send_packed_does_not_split_envelopes(self, sqs_client, queue_url, claim_check_bucket):
+        """
+        Test that a large envelope is claim checked whole rather than split
+        """
+        messages = [f'{{"id":{index},"pad":"{os.urandom(500).hex()}"}}' for index in range(400)]
+        queue = SQSQueue(queue_url, claim_check_bucket=claim_check_bucket)
+
+        report = queue.send_packed(messages, packing=MessagePacking.JSON)
+
+        bodies = receive_all(sqs_client, queue_url)
+        assert report.sent == 400 and len(bodies) == 1
+        assert [item["id"] for item in unpack_message(bodies[0])] == list(range(400))
+
+    def test_failed_claim_check_is_reported(self, sqs_client, s3_client, queue_url):
+        """
+        Test that a message whose payload cannot be written is reported and its pointer not sent
+        """
+        queue = SQSQueue(queue_url, claim_check_bucket="missing-bucket")
+
+        report = queue.send_messages(['{"id":1}', '{"pad":"%s"}' % ("x" * MAX_BATCH_BYTES)])
+
+        assert report.sent == 1
+        assert [(failed.index, failed.code) for failed in report.failed] == [(1, "NoSuchBucket")]
+        assert receive_all(sqs_client, queue_url) == ['{"id":1}']
@@ -0,0 +1,114 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+import asyncio
+import time
+import pytest
+
+from unittest.mock import MagicMock, patch
+
+import rate_limiting
+
+from mock_data.mock_api_question import MockAPIQuestion
+from parliament_api_client import ParliamentCommitteesAPIClient, ParliamentQuestionsAPIClient
+from rate_limiting import RateLimiter, parse_retry_after
+
+
+class TestRateLimiter:
+    def test_acquire_paces_requests_after_burst(self):
+        """
+        Test that requests beyond the burst wait for tokens at the configured rate
+        """
+        limiter = RateLimiter("questions", rate=50, burst=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_acquire_async_shares_bucket(self):
+        """
+        Test that async callers wait on the event loop for tokens from the same bucket
+        """
+        limiter = RateLimiter("questions", rate=50, burst=1)
+        limiter.acquire()
+
+        async def acquire_all():
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(5)))
+
+        start = time.monotonic()
+        asyncio.run(acquire_all())
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_throttle_decreases_rate_once_per_second(self):
+        """
+        Test that a burst of throttling responses only reduces the rate once
+        """
+        limiter = RateLimiter("questions", rate=10)
+
+        limiter.on_throttle()
+        limiter.on_throttle()
+
+        assert limiter.rate == pytest.approx(10 * rate_limiting.RATE_DECREASE_FACTOR)
+
+    def test_success_increases_rate_up_to_ceiling(self):
+        """
+        Test that successful requests restore the rate without exceeding the configured rate
+        """
+        limiter = RateLimiter("questions", rate=10)
+        limiter.on_throttle()
+
+        for _ in range(1000):
+            limiter.on_success()
+
+        assert limiter.rate == 10
+
+    def test_parse_retry_after(self):
+        """
+        Test Retry-After parsing for seconds, HTTP dates and invalid values
+        """
+        assert parse_retry_after("2") == 2
+        assert parse_retry_after("3600") == rate_limiting.MAX_RETRY_AFTER
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_rate_limiters_shared_per_family(self, monkeypatch):
+        """
+        Test that clients share a limiter per endpoint family configured from the environment
+        """
+        monkeypatch.setattr(rate_limiting, "_rate_limiters", {})
+        monkeypatch.setenv("PARLIAMENT_API_RATE_QUESTIONS", "2.5")
+        monkeypatch.setenv("PARLIAMENT_API_RATE_COMMITTEES", "0")
+
+        first = ParliamentQuestionsAPIClient("https://example.com/api/")
+        second = ParliamentQuestionsAPIClient("https://example.com/other/")
+        committees = ParliamentCommitteesAPIClient("https://example.com/api/")
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter.max_rate == 2.5
+        assert committees.rate_limiter is None
+
+    def test_throttled_request_is_retried(self, monkeypatch, mock_parliament_questions_api_uri):
+        """
+        Test that a 429 response slows the limiter and the request is retried
+        """
+        monkeypatch.setattr(rate_limiting, "_rate_limiters", {})
+        throttled = MagicMock()
+        throttled.status_code = 429
+        throttled.headers = {"Retry-After": "0"}
+        success = MagicMock()
+        success.status_code = 200
+        success.json.return_value = MockAPIQuestion().mock_api_question
+
+        with patch("requests.Session.get", side_effect=[throttled, success]) as mock_get:
+            client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+            question = client.get_question_by_id(1)
+
+        assert question.id == MockAPIQuestion().mock_api_question["value"]["id"]
+        assert mock_get.call_count == 2
+        assert client.rate_limiter.rate < client.rate_limiter.max_rate
@@ -0,0 +1,93 @@
+import json
+from datetime import date
+
+import pytest
+
+import serialization
+
+from models import House, Publication, PublicationDocument, PublicationFile, Question
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    previous = serialization.get_backend().name
+    yield serialization.set_backend(request.param)
+    serialization.set_backend(previous)
+
+
+@pytest.fixture
+def question():
+    return Question(
+        id=1,
+        house=House.LORDS,
+        date_tabled=date(2024, 1, 5),
+        question='Ask about "quotes", émigrés and\nnew lines / slashes  ',
+        answer=None,
+    )
+
+
+class TestSerialization:
+    def test_backends_produce_compact_utf8(self, backend, question):
+        """
+        Test that each backend serialises plain data identically to pydantic
+        """
+        assert backend.dumps(question.to_dict()) == question.model_dump_json().encode("utf-8")
+        assert backend.dumps({"house": House.COMMONS, "date": date(2024, 1, 5)}) == (
+            b'{"house":"commons","date":"2024-01-05"}'
+        )
+        assert backend.loads(backend.dumps(question.to_dict())) == question.to_dict()
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        """
+        Test that every backend raises the standard library decode error
+        """
+        with pytest.raises(json.JSONDecodeError):
+            backend.loads(b"{not json")
+
+    def test_unknown_backend(self):
+        """
+        Test that selecting an unknown backend raises an error
+        """
+        with pytest.raises(ValueError):
+            serialization.set_backend("pickle")
+
+    def test_question_round_trip(self, question):
+        """
+        Test that questions serialise like model_dump_json and parse back
+        """
+        body = question.to_json()
+
+        assert body == question.model_dump_json().encode("utf-8")
+        assert Question.from_json(body) == question
+        assert Question.from_json(body.decode("utf-8")) == question
+
+    def test_question_from_json_falls_back(self):
+        """
+        Test that documents failing validation are parsed like the previous consumers
+        """
+        body = '{"id": "7", "house": "Commons", "date_tabled": "2024-01-05T10:30:00", "question": "Q?", "answer": "A."}'
+
+        question = Question.from_json(body)
+
+        assert question.id == 7
+        assert question.house == House.COMMONS
+        assert question.date_tabled == date(2024, 1, 5)
+
+    def test_publication_round_trip(self):
+        """
+        Test that publications, including computed fields, round trip through JSON
+        """
+        publication = Publication(committee_id=203, id=10, description="Report")
+        document = PublicationDocument(id=20)
+        document.append(PublicationFile(filename="report.pdf"))
+        publication.append(document)
+
+        body = publication.to_json()
+
+        assert body == publication.model_dump_json().encode("utf-8")
+        assert Publication.from_json(body) == publication
+
+        with pytest.raises(json.JSONDecodeError):
+            Publication.from_json(b"{not json")
@@ -0,0 +1,248 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+import pytest
+
+from datetime import date
+from unittest.mock import patch
+
+import botocore.exceptions
+import storage
+
+from models import House, Publication, Question
+from storage import CONTENT_HASH_METADATA_KEY, S3Storage, content_hash
+
+BUCKET_NAME = "content_bucket"
+PART_SIZE = 5 * 1024 * 1024
+
+
+@pytest.fixture()
+def content_bucket(s3_client, aws_region):
+    s3_client.create_bucket(
+        Bucket=BUCKET_NAME,
+        CreateBucketConfiguration={"LocationConstraint": aws_region},
+    )
+    return BUCKET_NAME
+
+
+@pytest.fixture()
+def publication():
+    return Publication.from_dict(
+        {
+            "committee_id": 203,
+            "id": 46016,
+            "description": "Letter",
+            "documents": [
+                {"id": 229090, "publication_id": 46016, "files": [{"filename": "letter.pdf"}]}
+            ],
+        }
+    )
+
+
+class TestS3StoragePublicationStream:
+    def test_save_publication_stream_multipart(self, s3_client, content_bucket, publication):
+        """
+        Test that a file larger than one part is saved with a multipart upload
+        """
+        chunk = os.urandom(1024 * 1024)
+        chunks = [chunk] * 6
+
+        storage = S3Storage(content_bucket, part_size=PART_SIZE)
+        storage.save_publication_stream(chunks, publication, "https://example.com/")
+
+        key = storage.publication_key(publication)
+        s3_object = s3_client.get_object(Bucket=content_bucket, Key=key)
+        assert s3_object["Body"].read() == chunk * 6
+        assert s3_object["ETag"].endswith('-2"')
+        assert s3_client.head_object(Bucket=content_bucket, Key=f"{key}.metadata.json")
+
+    def test_save_publication_stream_small_file(self, s3_client, content_bucket, publication):
+        """
+        Test that a file smaller than one part is saved with a single put_object
+        """
+        storage = S3Storage(content_bucket)
+        storage.save_publication_stream([b"small ", b"file"], publication, "https://example.com/")
+
+        key = storage.publication_key(publication)
+        s3_object = s3_client.get_object(Bucket=content_bucket, Key=key)
+        assert s3_object["Body"].read() == b"small file"
+
+    def test_save_publication_stream_aborts_on_error(self, s3_client, content_bucket, publication):
+        """
+        Test that a failed stream aborts the multipart upload and saves nothing
+        """
+        def failing_chunks():
+            yield os.urandom(PART_SIZE)
+            raise ValueError("data field is incomplete")
+
+        storage = S3Storage(content_bucket, part_size=PART_SIZE)
+        with pytest.raises(ValueError):
+            storage.save_publication_stream(failing_chunks(), publication, "https://example.com/")
+
+        assert s3_client.list_multipart_uploads(Bucket=content_bucket).get("Uploads", []) == []
+        assert s3_client.list_objects_v2(Bucket=content_bucket)["KeyCount"] == 0
+
+    def test_save_publication_files_saves_every_document_file(self, s3_client, content_bucket):
+        """
+        Test that every file of every document is saved with its own metadata file
+        """
+        publication = Publication.from_dict(
+            {
+                "committee_id": 203,
+                "id": 46016,
+                "description": "Evidence",
+                "documents": [
+                    {"id": 1, "publication_id": 46016, "files": [{"filename": "one.pdf"}]},
+                    {"id": 2, "publication_id": 46016, "files": [{"filename": "two.pdf"}, {"filename": "two.docx"}]},
+                    {"id": 3, "publication_id": 46016, "files": [{"filename": "broken.pdf"}]},
+                    {"id": 4, "publication_id": 46016, "files": [{"filename": "one.pdf"}]},
+                ],
+            }
+        )
+
+        def open_file(document, file):
+            if file.filename == "broken.pdf":
+                raise ValueError("data field is incomplete")
+            return [f"{document.id}/{file.filename}".encode()]
+
+        s3_storage = S3Storage(content_bucket)
+        report = s3_storage.save_publication_files(publication, open_file, "https://example.com/", max_workers=2)
+
+        prefix = "document_type=publication/committee_id=203/publication_id=46016/document_id="
+        assert report.written == [f"{prefix}1/one.pdf", f"{prefix}2/two.pdf", f"{prefix}2/two.docx", f"{prefix}4/one.pdf"]
+        assert list(report.failed) == [f"{prefix}3/broken.pdf"]
+        for key in report.written:
+            assert s3_client.get_object(Bucket=content_bucket, Key=key)["Body"].read() == key[len(prefix):].encode()
+        metadata = s3_client.get_object(Bucket=content_bucket, Key=f"{prefix}2/two.docx.metadata.json")["Body"].read()
+        assert b"https://example.com/publications/46016/documents/2/default" in metadata
+
+    def test_save_publication_files_removes_legacy_key(self, s3_client, content_bucket, publication):
+        """
+        Test that a copy saved under the legacy key is deleted only if it is this publication's
+        """
+        other = publication.model_copy(deep=True)
+        other.id = 46017
+        other.documents[0].publication_id = 46017
+        s3_storage = S3Storage(content_bucket)
+        legacy_key = s3_storage.legacy_publication_key(publication)
+
+        def save_legacy(legacy_publication):
+            s3_client.put_object(Bucket=content_bucket, Key=legacy_key, Body=b"legacy")
+            s3_storage.save_publication_metadata(legacy_key, legacy_publication, "https://example.com/")
+
+        save_legacy(other)
+        s3_storage.save_publication_files(publication, lambda document, file: [b"data"], "https://example.com/")
+        assert s3_client.head_object(Bucket=content_bucket, Key=legacy_key)
+
+        save_legacy(publication)
+        s3_storage.save_publication_files(publication, lambda document, file: [b"data"], "https://example.com/")
+        keys = [item["Key"] for item in s3_client.list_objects_v2(Bucket=content_bucket)["Contents"]]
+        assert legacy_key == "document_type=publication/committee_id=203/letter.pdf"
+        assert keys == [
+            "document_type=publication/committee_id=203/publication_id=46016/document_id=229090/letter.pdf",
+            "document_type=publication/committee_id=203/publication_id=46016/document_id=229090/letter.pdf.metadata.json",
+        ]
+
+
+@pytest.fixture()
+def question():
+    return Question(
+        id=1679703,
+        question="To ask the Secretary of State...",
+        answer="An answer",
+        date_tabled=date(2024, 1, 5),
+        house=House.COMMONS,
+    )
+
+
+class TestS3StorageQuestionChangeDetection:
+    def test_save_question_stores_hash(self, s3_client, content_bucket, question):
+        """
+        Test that a new question is written with its content hash in the metadata
+        """
+        S3Storage(content_bucket).save_question(question)
+
+        key = "question_type=written/year=2024/month=01/day=05/1679703.json"
+        response = s3_client.get_object(Bucket=content_bucket, Key=key)
+        body = response["Body"].read().decode("utf-8")
+        assert body == question.model_dump_json()
+        assert response["Metadata"][CONTENT_HASH_METADATA_KEY] == content_hash(body)
+
+    def test_save_unchanged_question_skips_write(self, s3_client, content_bucket, question):
+        """
+        Test that saving an identical question again does not rewrite the object
+        """
+        s3_storage = S3Storage(content_bucket)
+        s3_storage.save_question(question)
+
+        with patch.object(storage.s3_client, "put_object", wraps=storage.s3_client.put_object) as mock_put:
+            assert s3_storage.save_question(question) == question.id
+            mock_put.assert_not_called()
+
+            s3_storage.save_question(question.model_copy(update={"answer": "A revised answer"}))
+            mock_put.assert_called_once()
+
+    def test_save_question_without_stored_hash_rewrites(self, s3_client, content_bucket, question):
+        """
+        Test that objects written before change detection are rewritten once with a hash
+        """
+        s3_storage = S3Storage(content_bucket)
+        key = s3_storage.question_key(question)
+        s3_client.put_object(Bucket=content_bucket, Key=key, Body=question.model_dump_json())
+
+        s3_storage.save_question(question)
+
+        response = s3_client.head_object(Bucket=content_bucket, Key=key)
+        assert CONTENT_HASH_METADATA_KEY in response["Metadata"]
+
+
+class TestS3StorageSaveQuestions:
+    def test_save_questions_reports_written_and_skipped(self, s3_client, content_bucket, question):
+        """
+        Test that a batch is saved concurrently and unchanged questions are skipped
+        """
+        s3_storage = S3Storage(content_bucket)
+        s3_storage.save_question(question)
+        new_questions = [question.model_copy(update={"id": question_id}) for question_id in range(1, 21)]
+
+        report = s3_storage.save_questions([question, *new_questions], max_workers=4)
+
+        assert report.skipped == [s3_storage.question_key(question)]
+        assert report.written == [s3_storage.question_key(q) for q in new_questions]
+        assert report.failed == {}
+        for new_question in new_questions:
+            body = s3_client.get_object(Bucket=content_bucket, Key=s3_storage.question_key(new_question))["Body"]
+            assert body.read() == new_question.to_json()
+
+    def test_save_questions_retries_transient_errors(self, s3_client, content_bucket, question):
+        """
+        Test that throttled writes are retried and permanent errors are reported as failed
+        """
+        s3_storage = S3Storage(content_bucket)
+        put_object = storage.s3_client.put_object
+        throttled = {"calls": 0}
+        slow_down = botocore.exceptions.ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+        access_denied = botocore.exceptions.ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+
+        def flaky_put_object(**kwargs):
+            if kwargs["Key"].endswith("/2.json"):
+                raise access_denied
+            if throttled["calls"] < 2:
+                throttled["calls"] += 1
+                raise slow_down
+            return put_object(**kwargs)
+
+        questions = [question.model_copy(update={"id": question_id}) for question_id in (1, 2)]
+        with patch.object(storage.s3_client, "put_object", side_effect=flaky_put_object) as mock_put, \
+                patch("storage.time.sleep") as mock_sleep, \
+                patch.object(storage.metrics, "add_metric") as mock_add_metric:
+            report = s3_storage.save_questions(questions, max_workers=1)
+
+        assert report.written == [s3_storage.question_key(questions[0])]
+        assert list(report.failed) == [s3_storage.question_key(questions[1])]
+        assert mock_put.call_count == 4
+        assert mock_sleep.call_count == 2
+        saved = [call for call in mock_add_metric.call_args_list if call.kwargs["name"] == "QuestionSaveS3"]
+        assert [call.kwargs["value"] for call in saved] == [1]
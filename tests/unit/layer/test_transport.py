@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "layers", "pq_responder"))
+
+from unittest.mock import patch
+
+from parliament_api_client import ParliamentCommitteesAPIClient, ParliamentQuestionsAPIClient
+from transport import ParliamentAPITransport
+
+
+class TestParliamentAPITransport:
+    def test_clients_share_transport_mounted_on_base_uri(
+        self, mock_parliament_committees_api_uri, mock_parliament_questions_api_uri
+    ):
+        """
+        Test that all clients share one transport and its adapter is mounted on each real base URI
+        """
+        committees_client = ParliamentCommitteesAPIClient(mock_parliament_committees_api_uri)
+        questions_client = ParliamentQuestionsAPIClient(mock_parliament_questions_api_uri)
+
+        transport = committees_client.transport
+        assert questions_client.transport is transport
+        assert questions_client.session is committees_client.session
+        assert transport.session.adapters[mock_parliament_committees_api_uri] is transport.adapter
+        assert transport.session.get_adapter(f"{mock_parliament_questions_api_uri}questions/1") is transport.adapter
+        assert transport.adapter.max_retries.total == 3
+        assert 502 in transport.adapter.max_retries.status_forcelist
+        assert 429 not in transport.adapter.max_retries.status_forcelist
+        assert 503 not in transport.adapter.max_retries.status_forcelist
+
+    def test_get_applies_default_timeout(self):
+        """
+        Test that requests are sent with the transport's connect/read timeouts
+        """
+        transport = ParliamentAPITransport(timeout=(1, 2))
+        with patch.object(transport.session, "get") as mock_get:
+            transport.get("https://example.com/api/")
+
+        mock_get.assert_called_once_with("https://example.com/api/", timeout=(1, 2))
+
+    def test_pool_stats_empty(self):
+        """
+        Test that a new transport reports no pool hits or misses
+        """
+        transport = ParliamentAPITransport()
+
+        assert transport.pool_stats() == {"requests": 0, "connections": 0, "hits": 0, "misses": 0}